@@ -0,0 +1,17 @@
+"""
+⏱️ BENCHMARKS ⏱️
+================
+
+Frame-time benchmarks for the weekly games.
+
+Each weekly script is loaded the way Pygame Zero loads it (but with a
+hidden window), its settings are switched on and off, and then update()
+and draw() are timed frame by frame with lots of asteroids and bonus
+stars on screen. Results are written as JSON so two runs (say, before
+and after a change) can be compared:
+
+    python -m bench --output before.json
+    ... change something ...
+    python -m bench --output after.json
+    python -m bench.compare before.json after.json
+"""
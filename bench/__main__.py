@@ -0,0 +1,143 @@
+"""
+Run the frame-time benchmarks and write the results as JSON.
+
+    python -m bench                          # everything (slow!)
+    python -m bench --quick                  # smaller crowds, fewer frames
+    python -m bench --games star_dodger --counts 1000,10000 \\
+        --flags USE_ASTEROID_POOL,USE_BROADPHASE --output pool.json
+
+By default each game's performance flags (PERFORMANCE_FLAGS in
+bench/loader.py) are tried one at a time: everything off, then each flag
+on by itself (--pairwise adds every pair of them too). With --flags,
+every combination of the flags given is benchmarked instead, so keep
+that list short: 10 flags are already 1024 configurations. Flags that
+aren't varied keep the value in the script, and USE_PROFILER is always
+left off.
+
+The report also has cold-import times (python -X importtime) for the
+headless game modules and the Pygame Zero front end; --skip-imports leaves
+them out. It also times packing Star Dodger state into snapshots and deltas
+(see bench/snapshots.py); --skip-snapshots leaves that out.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from bench.frames import bench_config
+from bench.imports import import_report
+from bench.loader import GAMES, REPO_ROOT, flag_matrix
+from bench.snapshots import snapshot_report
+
+
+def environment():
+    """Enough about this machine and checkout to make results comparable."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    try:
+        import numpy
+
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    import pygame
+
+    return {
+        "commit": commit,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pygame": pygame.version.ver,
+        "numpy": numpy_version,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Frame-time benchmarks for the games")
+    parser.add_argument("--games", default=",".join(GAMES))
+    parser.add_argument("--counts", default="10,100,1000,10000")
+    parser.add_argument(
+        "--flags", default=None, help="comma-separated USE_... flags to vary"
+    )
+    parser.add_argument(
+        "--pairwise",
+        action="store_true",
+        help="also try every pair of performance flags together",
+    )
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--alloc-frames", type=int, default=20)
+    parser.add_argument(
+        "--quick", action="store_true", help="counts 10,1000 and 30 frames"
+    )
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument(
+        "--skip-imports", action="store_true", help="don't measure import times"
+    )
+    parser.add_argument(
+        "--skip-snapshots", action="store_true", help="don't time snapshot encoding"
+    )
+    args = parser.parse_args(argv)
+
+    counts = [int(c) for c in args.counts.split(",")]
+    frames, alloc_frames = args.frames, args.alloc_frames
+    if args.quick:
+        counts, frames, alloc_frames = [10, 1000], 30, 5
+    only = set(args.flags.split(",")) if args.flags else None
+
+    results = []
+    for game in args.games.split(","):
+        # Gold Collector has no crowds: just the one coin
+        game_counts = counts if game == "star_dodger" else [1]
+        for settings in flag_matrix(game, only, args.pairwise):
+            for count in game_counts:
+                result = bench_config(game, settings, count, frames, alloc_frames)
+                results.append(result)
+                on = ",".join(k[4:].lower() for k, v in settings.items() if v) or "-"
+                print(
+                    f"{game:15} n={count:<6} update p50 {result['update_ms']['p50']:8.3f} ms"
+                    f"  draw p50 {result['draw_ms']['p50']:8.3f} ms  [{on}]",
+                    file=sys.stderr,
+                )
+
+    report = {"environment": environment(), "results": results}
+    if not args.skip_imports:
+        report["imports"] = import_report()
+        for target, result in report["imports"].items():
+            if result["total_ms"] is None:
+                print(f"import {target:27} failed", file=sys.stderr)
+                continue
+            pygame = "pulls in pygame" if result["pygame"] else "no pygame"
+            print(
+                f"import {target:27} {result['total_ms']:8.1f} ms"
+                f"  {result['modules']:4} modules  ({pygame})",
+                file=sys.stderr,
+            )
+    if not args.skip_snapshots:
+        report["snapshots"] = snapshot_report(
+            [10, 1000] if args.quick else [10, 100, 1000]
+        )
+        for result in report["snapshots"]:
+            print(
+                f"snapshot n={result['count']:<6} {result['full_bytes']:6} bytes"
+                f" (delta {result['delta_bytes']})  encode {result['encode']['us']:8.2f} us"
+                f"  decode {result['decode']['us']:8.2f} us"
+                f"  delta {result['delta_encode']['us']:8.2f}/{result['delta_apply']['us']:.2f} us",
+                file=sys.stderr,
+            )
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Compare two benchmark result files.
+
+    python -m bench.compare before.json after.json
+
+Prints the p50/p95 update and draw times for every result that appears in
+both files, with after/before ratios (below 1.00 means faster).
+"""
+
+import json
+import sys
+
+
+def _key(result):
+    return (result["game"], tuple(sorted(result["settings"].items())), result["count"])
+
+
+def compare(before, after):
+    """Yield (key, metric, before_ms, after_ms) for results in both reports."""
+    old = {_key(r): r for r in before["results"]}
+    for result in after["results"]:
+        previous = old.get(_key(result))
+        if previous is None:
+            continue
+        for phase in ("update_ms", "draw_ms"):
+            for stat in ("p50", "p95"):
+                metric = f"{phase[:-3]} {stat}"
+                yield _key(result), metric, previous[phase][stat], result[phase][stat]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        raise SystemExit("usage: python -m bench.compare BEFORE.json AFTER.json")
+    with open(argv[0]) as f:
+        before = json.load(f)
+    with open(argv[1]) as f:
+        after = json.load(f)
+
+    for (game, settings, count), metric, old, new in compare(before, after):
+        on = ",".join(k[4:].lower() for k, v in settings if v) or "-"
+        ratio = new / old if old else float("inf")
+        print(
+            f"{game:15} n={count:<6} {metric:11} {old:9.3f} -> {new:9.3f} ms"
+            f"  x{ratio:5.2f}  [{on}]"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Time update() and draw() for one game with one set of settings.
+
+To get a realistic crowd on screen, the benchmark keeps spawning asteroids
+and bonus stars (through the game's own spawn functions) at exactly the
+rate that keeps `count` of each on screen, warms up until the screen is
+full, and then times each frame:
+
+- update_ms: that frame's spawns plus update()
+- draw_ms: draw(), onto an off-screen Surface
+
+A second, shorter pass measures memory per frame with tracemalloc (which
+slows everything down, so it isn't mixed with the timings):
+
+- peak_bytes: the most extra memory in use at any point during the frame
+- net_blocks: how many more Python memory blocks exist after the frame
+"""
+
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from bench.loader import load_game
+
+
+class Feeder:
+    """Spawns objects so that about `count` of each stay on screen."""
+
+    def __init__(self, mod, count):
+        self.mod = mod
+        self.count = count
+        self._owed = {}  # spawn function -> fraction of an object still owed
+
+    def warm_up(self):
+        for _ in range(self.warm_up_frames()):
+            self.spawn()
+            self.mod.update()
+
+    def warm_up_frames(self):
+        mod = self.mod
+        if not hasattr(mod, "spawn_asteroid"):
+            return 0
+        # Bonus stars fall at 2 pixels per frame, slower than any asteroid
+        return int((mod.HEIGHT + 50) / 2) + 10
+
+    def spawn(self):
+        mod = self.mod
+        if not hasattr(mod, "spawn_asteroid"):
+            return  # Gold Collector has no crowds (yet!)
+        mod.lives = 10**9  # Never let the game end mid-benchmark
+        distance = mod.HEIGHT + 50  # From y=-20 to past HEIGHT + 30
+        self._spawn(mod.spawn_asteroid, mod.get_asteroid_speed() / distance)
+        if mod.USE_BONUS_STARS:
+            self._spawn(mod.spawn_bonus_star, 2 / (mod.HEIGHT + 40))
+
+    def _spawn(self, spawn, share_per_frame):
+        owed = self._owed.get(spawn, 0.0) + self.count * share_per_frame
+        while owed >= 1:
+            spawn()
+            owed -= 1
+        self._owed[spawn] = owed
+
+
+def percentiles(samples):
+    """p50/p95/p99/mean/max of a list of milliseconds."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "mean": statistics.fmean(samples),
+        "max": max(samples),
+    }
+
+
+def bench_config(game, settings, count, frames=120, alloc_frames=20):
+    """Benchmark one game + settings + crowd size and return a result dict."""
+    mod = load_game(game, settings)
+    feeder = Feeder(mod, count)
+    update_ms, draw_ms, peak_bytes, net_blocks = [], [], [], []
+    clock = time.perf_counter
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        feeder.warm_up()
+
+        for _ in range(frames):
+            start = clock()
+            feeder.spawn()
+            mod.update()
+            middle = clock()
+            mod.draw()
+            end = clock()
+            update_ms.append((middle - start) * 1000)
+            draw_ms.append((end - middle) * 1000)
+
+        tracemalloc.start()
+        try:
+            for _ in range(alloc_frames):
+                tracemalloc.reset_peak()
+                before_bytes = tracemalloc.get_traced_memory()[0]
+                before_blocks = sys.getallocatedblocks()
+                feeder.spawn()
+                mod.update()
+                mod.draw()
+                peak_bytes.append(tracemalloc.get_traced_memory()[1] - before_bytes)
+                net_blocks.append(sys.getallocatedblocks() - before_blocks)
+        finally:
+            tracemalloc.stop()
+
+    on_screen = {"asteroids": len(getattr(mod, "asteroids", ()))}
+    if getattr(mod, "USE_BONUS_STARS", False):
+        on_screen["bonus_stars"] = len(mod.bonus_stars)
+    return {
+        "game": game,
+        "settings": settings,
+        "count": count,
+        "on_screen": on_screen,
+        "frames": frames,
+        "update_ms": percentiles(update_ms),
+        "draw_ms": percentiles(draw_ms),
+        "alloc_per_frame": {
+            "peak_bytes": statistics.median(peak_bytes),
+            "net_blocks": statistics.median(net_blocks),
+        },
+    }
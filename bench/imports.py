@@ -0,0 +1,92 @@
+"""
+Measure how long importing things takes, with `python -X importtime`.
+
+The game rules live in import-light modules (gamekit.star_dodger_sim,
+gamekit.gold_collector_sim) so tests, benchmarks and rollouts can use them
+without pygame or a window. This checks that it stays that way: each
+target is imported in a fresh Python process (so nothing is loaded yet),
+and for each one we report
+
+- total_ms: how long the import took, everything it pulled in included
+- modules: how many modules were imported
+- pygame: whether pygame came along (the headless modules should say False)
+
+pgzero.runner stands in for the Pygame Zero front end, since `import
+pgzrun` only works from a script file.
+
+This only measures: the weekly scripts themselves still import pgzrun and
+build their Actors when they load. That's on purpose, as Pygame Zero
+hands the scripts Actor, screen, clock and keyboard, and the scripts are
+lessons meant to be read top to bottom. The import-light modules are the
+headless sims, and they are what tests, rollouts and replays import.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+from bench.loader import REPO_ROOT
+
+TARGETS = (
+    "gamekit.star_dodger_sim",
+    "gamekit.gold_collector_sim",
+    "gamekit.rollout",
+    "gamekit.replay",
+    "pygame",
+    "pgzero.runner",
+)
+
+# "import time:   self [us] | cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def import_time(target, repeat=3):
+    """
+    The fastest of `repeat` cold imports of one module. If every one of
+    them failed, the last failure (total_ms None, plus the error) instead.
+    """
+    best = failed = None
+    for _ in range(repeat):
+        result = _measure(target)
+        if result["total_ms"] is None:
+            failed = result
+        elif best is None or result["total_ms"] < best["total_ms"]:
+            best = result
+    return best if best is not None else failed
+
+
+def _measure(target):
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        return {"total_ms": None, "modules": 0, "pygame": False, "error": proc.stderr}
+
+    # Children are listed (indented) before the module that imported them,
+    # so the target's block runs from the previous top-level line to its own.
+    block = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        indent, name = match.group(3), match.group(4)
+        block.append(name)
+        if not indent:
+            if name == target:
+                return {
+                    "total_ms": int(match.group(2)) / 1000,
+                    "modules": len(block),
+                    "pygame": any(n.split(".")[0] == "pygame" for n in block),
+                }
+            block = []  # Something Python imported at startup: not ours
+    return {"total_ms": None, "modules": 0, "pygame": False, "error": "not in output"}
+
+
+def import_report(targets=TARGETS, repeat=3):
+    return {target: import_time(target, repeat) for target in targets}
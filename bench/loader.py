@@ -0,0 +1,125 @@
+"""
+Load a weekly pgzero script as a module, without opening a real window.
+
+The scripts are written to be run directly, so their settings are plain
+"NAME = value" lines at the top. load_game() rewrites those lines to the
+values asked for, runs the script the same way Pygame Zero's runner does
+(with pgzrun.go() switched off) and gives back the module, ready for its
+update() and draw() to be called. draw() goes to an off-screen Surface.
+"""
+
+import itertools
+import os
+import re
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+GAMES = {
+    "gold_collector": REPO_ROOT / "week01" / "gold_collector_game.py",
+    "star_dodger": REPO_ROOT / "week02" / "star_dodger.py",
+}
+
+# The USE_... flags that are only there to make a game faster (the rest
+# change how the game plays or looks). These are what `python -m bench`
+# varies unless it is given --flags.
+PERFORMANCE_FLAGS = {
+    "gold_collector": ("USE_HUD_CACHE", "USE_ASSET_CACHE", "USE_DIRTY_RECTS"),
+    "star_dodger": (
+        "USE_ASTEROID_POOL",
+        "USE_BROADPHASE",
+        "USE_STARFIELD_CACHE",
+        "USE_CAMERA_CULLING",
+        "USE_BATCHED_DRAW",
+        "USE_HUD_CACHE",
+        "USE_OBJECT_POOL",
+        "USE_TIMER_WHEEL",
+        "USE_ASSET_CACHE",
+    ),
+}
+
+# Never switched on by the benchmark: the profiler is a measuring tool of
+# its own (and saves a file at exit for every game loaded with it on)
+NOT_BENCHMARKED = {"USE_PROFILER"}
+
+_FLAG = re.compile(r"^(USE_\w+) = (True|False)\b", re.MULTILINE)
+
+
+def find_flags(game):
+    """Return the USE_... settings a game script has, in file order."""
+    return _FLAG.findall(GAMES[game].read_text())
+
+
+def flag_matrix(game, only=None, pairwise=False):
+    """
+    The settings to benchmark a game with: every True/False combination of
+    the flags in only, or (without only) all of the game's performance
+    flags off, then each one on alone (and each pair, if pairwise).
+    """
+    flags = [name for name, _ in find_flags(game) if name not in NOT_BENCHMARKED]
+    if only is not None:
+        names = [name for name in flags if name in only]
+        for values in itertools.product((False, True), repeat=len(names)):
+            yield dict(zip(names, values))
+        return
+    names = [name for name in PERFORMANCE_FLAGS.get(game, ()) if name in flags]
+    yield dict.fromkeys(names, False)
+    for size in (1, 2) if pairwise else (1,):
+        for chosen in itertools.combinations(names, size):
+            yield {name: name in chosen for name in names}
+
+
+def load_game(game, settings=None, quiet=True):
+    """
+    Load a game script with some settings changed, e.g.
+    load_game("star_dodger", {"USE_ASTEROID_POOL": True}).
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    sys._pgzrun = True  # Makes pgzrun.go() do nothing, like the pgzero runner
+
+    import pgzero.game
+    import pygame
+    from pgzero.runner import prepare_mod
+    from pgzero.screen import Screen
+
+    path = GAMES[game]
+    source = path.read_text()
+    for name, value in (settings or {}).items():
+        source, found = re.subn(
+            rf"^{name} = [^#\n]*",
+            f"{name} = {value!r} ",
+            source,
+            count=1,
+            flags=re.MULTILINE,
+        )
+        if not found:
+            raise KeyError(f"{path.name} has no setting called {name}")
+
+    mod = ModuleType(path.stem)
+    mod.__file__ = str(path)
+    prepare_mod(mod)
+    mod.__file__ = str(path)  # prepare_mod() replaces it with pgzero's own
+
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    width, height = _window_size(source)
+    pygame.display.set_mode((width, height))
+    surface = pygame.Surface((width, height))  # Off-screen: draw() lands here
+    pgzero.game.screen = surface
+    mod.screen = Screen(surface)
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(
+        devnull if quiet else sys.stdout
+    ):
+        exec(compile(source, str(path), "exec"), mod.__dict__)
+    return mod
+
+
+def _window_size(source):
+    match = re.search(r"^WIDTH, HEIGHT = (\d+), (\d+)", source, re.MULTILINE)
+    return (int(match.group(1)), int(match.group(2))) if match else (800, 600)
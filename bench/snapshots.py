@@ -0,0 +1,83 @@
+"""
+How fast Star Dodger state packs into bytes and back (gamekit.snapshot).
+
+For each crowd size a StarDodgerSim is filled with that many asteroids and
+stepped one tick, then we time
+
+- capture: reading a Snapshot out of the sim
+- encode / decode: a full Snapshot to bytes and back
+- delta_encode / delta_apply: the change between the two ticks
+
+and report microseconds per call, snapshots per second, and the size in
+bytes of a full snapshot and of a one-tick delta.
+
+    python -m bench.snapshots --counts 10,100,1000
+"""
+
+import argparse
+import json
+import random
+import time
+
+from gamekit.snapshot import Snapshot, apply_delta, encode_delta
+from gamekit.star_dodger_sim import Settings, StarDodgerSim
+
+
+def crowded_sim(count, seed=0):
+    """A sim with `count` asteroids spread over the screen."""
+    sim = StarDodgerSim(Settings(invincibility=True), seed=seed)
+    rng = random.Random(seed)
+    for _ in range(count):
+        sim.asteroids.spawn(rng.randint(0, 770), rng.randint(-20, 400), 30, 30)
+    return sim
+
+
+def _time_per_call(func, min_seconds=0.2):
+    calls, start = 0, time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+
+def bench_snapshot(count, min_seconds=0.2):
+    sim = crowded_sim(count)
+    old = Snapshot.capture(sim)
+    sim.step()
+    new = Snapshot.capture(sim)
+    data = new.to_bytes()
+    delta = encode_delta(old, new)
+    timings = {
+        "capture": lambda: Snapshot.capture(sim),
+        "encode": new.to_bytes,
+        "decode": lambda: Snapshot.from_bytes(data),
+        "delta_encode": lambda: encode_delta(old, new),
+        "delta_apply": lambda: apply_delta(old, delta),
+    }
+    result = {"count": count, "full_bytes": len(data), "delta_bytes": len(delta)}
+    for name, func in timings.items():
+        seconds = _time_per_call(func, min_seconds)
+        result[name] = {
+            "us": round(seconds * 1e6, 2),
+            "per_second": round(1 / seconds),
+        }
+    return result
+
+
+def snapshot_report(counts=(10, 100, 1000), min_seconds=0.2):
+    return [bench_snapshot(count, min_seconds) for count in counts]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Snapshot encode/decode throughput")
+    parser.add_argument("--counts", default="10,100,1000")
+    parser.add_argument("--seconds", type=float, default=0.2, help="per measurement")
+    args = parser.parse_args(argv)
+    counts = [int(c) for c in args.counts.split(",")]
+    print(json.dumps(snapshot_report(counts, args.seconds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
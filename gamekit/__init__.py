@@ -0,0 +1,14 @@
+"""
+🧰 GAMEKIT 🧰
+=============
+
+Shared helpers for the weekly games. The weekly scripts stay simple on
+purpose — gamekit is where the "under the hood" machinery lives, so the
+games can opt into it with a USE_... switch when you want to go faster
+or bigger.
+
+Nothing in here imports pygame when it is imported, so these helpers can
+also be used from plain Python scripts, tools and benchmarks.
+
+FOR: Python for Kids Course (advanced pilots!)
+"""
@@ -0,0 +1,66 @@
+"""
+Load a game's images once, at startup, and share them.
+
+The games build Actor("asteroid") on every spawn inside a try/except. When
+the image is there, Pygame Zero's image cache makes that cheap. When it is
+missing, nothing is cached: every spawn searches the images folder for
+asteroid.png, asteroid.gif, asteroid.jpg... and raises, and only then
+falls back to a shape.
+
+Assets loads every image in a folder up front, so a game can decide ONCE
+whether it has all the sprites it needs. Pass Pygame Zero's images.load as
+`load`, and the preloaded surfaces are the very same ones Actor() uses.
+
+Each spawn still builds its own Actor (cheap, once the image is cached);
+reusing the Actors themselves is what USE_OBJECT_POOL is for.
+"""
+
+from pathlib import Path
+
+EXTENSIONS = (".png", ".gif", ".jpg", ".jpeg", ".bmp")
+
+
+class Assets:
+    """Every image in one folder, loaded once and shared."""
+
+    def __init__(self, folder, load=None):
+        self.folder = Path(folder)
+        self._load = load  # e.g. Pygame Zero's images.load
+        self._surfaces = {}
+        self.missing = set()  # Images that were found but wouldn't load
+
+    def __contains__(self, name):
+        return name in self._surfaces
+
+    def __repr__(self):
+        return f"Assets({str(self.folder)!r}, {sorted(self._surfaces)})"
+
+    def preload(self):
+        """Load every image in the folder. Returns self, for chaining."""
+        paths = sorted(self.folder.glob("*")) if self.folder.is_dir() else []
+        for path in paths:
+            if path.suffix.lower() not in EXTENSIONS or path.stem in self._surfaces:
+                continue
+            try:
+                self._surfaces[path.stem] = self._load_image(path)
+            except Exception:
+                self.missing.add(path.stem)
+        return self
+
+    def has(self, *names):
+        """True if every one of these images loaded."""
+        return all(name in self._surfaces for name in names)
+
+    def get(self, name):
+        return self._surfaces[name]
+
+    def _load_image(self, path):
+        if self._load is not None:
+            return self._load(path.stem)
+        import pygame
+
+        surface = pygame.image.load(str(path))
+        try:
+            return surface.convert_alpha()
+        except pygame.error:
+            return surface  # No display yet: can't convert, but still usable
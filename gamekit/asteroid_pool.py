@@ -0,0 +1,266 @@
+"""
+Array-backed store for lots of falling objects.
+
+A plain list keeps one Actor/Rect per asteroid, and every frame we loop over
+it in Python to move, cull and collide. AsteroidPool keeps the positions in
+columns instead (one array for left, one for top, one for width, one for
+height — a "struct of arrays"), so moving every asteroid is one array step.
+
+The original Actor/Rect objects are still kept alongside the columns, so
+draw() can loop over the pool exactly like a list. Their positions are only
+copied back from the columns when something iterates the pool (or, for
+sync(indices), just the objects about to be drawn): moving, culling,
+colliding and removing never touch them one by one.
+
+A pygame Rect only holds whole pixels: `rect.y += 3.5` rounds (halves away
+from zero). With whole_pixels=True, move() rounds the columns the same
+way, so a pool of Rects lands exactly where a list of Rects would.
+
+NumPy is used when it is installed; otherwise the pool falls back to the
+standard library's array module (same behaviour, just not vectorized).
+"""
+
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - the pool still works without it
+    np = None
+
+
+class AsteroidPool:
+    """
+    A list-like container of falling objects with array-backed positions.
+
+    Supports the list operations the games use (append, clear, len, for
+    loops) plus bulk operations: move(), below(), overlapping(), collide()
+    and remove_at(). Removal swaps the last object into the gap, so it is O(1)
+    per removed object instead of list.remove()'s O(n).
+    """
+
+    COLUMNS = ("left", "top", "width", "height")
+
+    def __init__(self, capacity=64, whole_pixels=False):
+        self.whole_pixels = whole_pixels  # Round like Rect (for a pool of Rects)
+        self.items = []  # The Actor/Rect objects (or None), same order as the columns
+        self._capacity = 0
+        self._dirty = False  # True when columns moved but items haven't been updated
+        for name in self.COLUMNS:
+            setattr(self, name, self._new_column(0))
+        self._grow(max(1, capacity))
+
+    # --- list-like behaviour ---
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        self.sync()
+        return iter(self.items)
+
+    def __repr__(self):
+        self.sync()
+        return repr(self.items)
+
+    def append(self, item):
+        """Add an Actor/Rect, reading its current position and size."""
+        self.spawn(item.left, item.top, item.width, item.height, item)
+
+    def spawn(self, left, top, width, height, item=None):
+        """Add an object by its rectangle. item may be None for headless use."""
+        n = len(self.items)
+        if n == self._capacity:
+            self._grow(self._capacity * 2)
+        self.left[n] = left
+        self.top[n] = top
+        self.width[n] = width
+        self.height[n] = height
+        self.items.append(item)
+        return n
+
+    def clear(self):
+        self.items.clear()
+        self._dirty = False
+
+    # --- bulk operations ---
+
+    def move(self, dy, dx=0):
+        """Move every object by (dx, dy) in one step."""
+        n = len(self.items)
+        if not n:
+            return
+        whole = self.whole_pixels
+        if np is not None:
+            for column, step in ((self.top[:n], dy), (self.left[:n], dx)):
+                if step:
+                    column += step
+                    if whole:
+                        round_like_rect(column)
+        else:
+            top, left = self.top, self.left
+            for i in range(n):
+                top[i] = _round_like_rect(top[i] + dy) if whole else top[i] + dy
+                if dx:
+                    left[i] = _round_like_rect(left[i] + dx) if whole else left[i] + dx
+        self._dirty = True
+
+    def below(self, limit, center=False):
+        """
+        Return the indices of objects whose top edge is below limit (or
+        whose center is, with center=True: Actor.y is the center, Rect.y
+        the top).
+        """
+        n = len(self.items)
+        if np is not None:
+            return np.flatnonzero(self._ys(n, center) > limit).tolist()
+        ys = self._ys(n, center)
+        return [i for i in range(n) if ys[i] > limit]
+
+    def overlapping(self, rect):
+        """
+        Return the indices of objects overlapping rect (an Actor or Rect),
+        using the same rules as colliderect().
+        """
+        n = len(self.items)
+        r_left, r_top = rect.left, rect.top
+        r_right, r_bottom = r_left + rect.width, r_top + rect.height
+        if np is not None:
+            left, top = self.left[:n], self.top[:n]
+            hit = (
+                (left < r_right)
+                & (left + self.width[:n] > r_left)
+                & (top < r_bottom)
+                & (top + self.height[:n] > r_top)
+            )
+            return np.flatnonzero(hit).tolist()
+        left, top, width, height = self.left, self.top, self.width, self.height
+        return [
+            i
+            for i in range(n)
+            if left[i] < r_right
+            and left[i] + width[i] > r_left
+            and top[i] < r_bottom
+            and top[i] + height[i] > r_top
+        ]
+
+    def collide(self, rect, limit, center=False):
+        """
+        below() and overlapping() in a single pass: return (off, hits), the
+        indices of objects below limit (by top edge, or center as in
+        below()), and of the other objects overlapping rect.
+        """
+        n = len(self.items)
+        r_left, r_top = rect.left, rect.top
+        r_right, r_bottom = r_left + rect.width, r_top + rect.height
+        if np is not None:
+            left, top = self.left[:n], self.top[:n]
+            off = self._ys(n, center) > limit
+            hit = (
+                ~off
+                & (left < r_right)
+                & (left + self.width[:n] > r_left)
+                & (top < r_bottom)
+                & (top + self.height[:n] > r_top)
+            )
+            return np.flatnonzero(off).tolist(), np.flatnonzero(hit).tolist()
+        left, top, width, height = self.left, self.top, self.width, self.height
+        ys = self._ys(n, center)
+        off, hits = [], []
+        for i in range(n):
+            t = top[i]
+            if ys[i] > limit:
+                off.append(i)
+            elif (
+                left[i] < r_right
+                and left[i] + width[i] > r_left
+                and t < r_bottom
+                and t + height[i] > r_top
+            ):
+                hits.append(i)
+        return off, hits
+
+    def _ys(self, n, center):
+        """The y each object is culled by: its top, or its center."""
+        if not center:
+            return self.top[:n] if np is not None else self.top
+        if np is not None:
+            return self.top[:n] + self.height[:n] / 2
+        top, height = self.top, self.height
+        return [top[i] + height[i] / 2 for i in range(n)]
+
+    def rects(self):
+        """Return (left, top, width, height) for every object, e.g. for drawing."""
+        n = len(self.items)
+        columns = [getattr(self, name)[:n] for name in self.COLUMNS]
+        if np is not None:
+            columns = [column.tolist() for column in columns]
+        return list(zip(*columns))
+
+    def remove_at(self, indices):
+        """
+        Remove the objects at the given indices (by swapping the last object
+        into each gap) and return the removed items, at their final positions.
+        """
+        indices = sorted(set(indices), reverse=True)
+        self.sync(indices)
+        removed = []
+        items = self.items
+        for i in indices:
+            last = len(items) - 1
+            removed.append(items[i])
+            if i != last:
+                items[i] = items[last]
+                for name in self.COLUMNS:
+                    column = getattr(self, name)
+                    column[i] = column[last]
+            items.pop()
+        return removed
+
+    def sync(self, indices=None):
+        """
+        Copy column positions back onto the Actor/Rect objects: all of them,
+        or only the ones at indices (e.g. the ones about to be drawn).
+        """
+        if not self._dirty:
+            return
+        items = self.items
+        n = len(items)
+        left, top = self.left[:n], self.top[:n]
+        if np is not None:
+            left, top = left.tolist(), top.tolist()  # Much faster to index
+        if indices is None:
+            moved = zip(items, left, top)
+            self._dirty = False
+        else:
+            moved = ((items[i], left[i], top[i]) for i in indices)
+        for item, x, y in moved:
+            if item is not None:
+                # An Actor keeps its position in _rect: set it there directly
+                getattr(item, "_rect", item).topleft = (x, y)
+
+    # --- storage ---
+
+    def _new_column(self, size):
+        if np is not None:
+            return np.zeros(size, dtype=np.float64)
+        return array("d", bytes(8 * size))
+
+    def _grow(self, capacity):
+        n = len(self.items)
+        for name in self.COLUMNS:
+            column = self._new_column(capacity)
+            column[:n] = getattr(self, name)[:n]
+            setattr(self, name, column)
+        self._capacity = capacity
+
+
+def round_like_rect(column):
+    """Round a NumPy column in place, the way pygame's Rect does."""
+    np.copysign(np.floor(np.abs(column) + 0.5), column, out=column)
+    return column
+
+
+def _round_like_rect(value):
+    """Round to a whole number the way pygame's Rect does (halves away from 0)."""
+    return math.copysign(math.floor(abs(value) + 0.5), value)
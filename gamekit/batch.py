@@ -0,0 +1,130 @@
+"""
+Draw a whole layer of objects with a single blit call.
+
+Every screen.draw.filled_circle() or actor.draw() is its own trip from
+Python into pygame, and with 10,000 asteroids on screen those trips are
+most of the frame. Two tricks make a layer much cheaper:
+
+- a Stamp is a shape (say, a gray circle with a darker outline) drawn ONCE
+  onto a small Surface. Each asteroid is then a copy of that picture
+  instead of a circle drawn all over again;
+- a SpriteBatch collects (picture, position) pairs for a whole layer and
+  hands them to pygame's Surface.blits(), which loops over them in C.
+
+The screen ends up exactly the same, pixel for pixel, as drawing each
+object on its own.
+
+An Actor is added with the picture and position Actor.draw() itself
+uses: its _surf (already rotated, if it has an angle) at its _rect's
+top-left corner (already moved for its anchor). Those belong to Pygame
+Zero's Actor, so requirements.txt keeps pgzero at 1.2.x. An Actor
+without them draws itself instead, in its turn: the blits before it
+go first, then its draw(), then the rest.
+
+    rock = Stamp.circle(15, (160, 160, 160), outline=(100, 100, 100))
+    batch = SpriteBatch()
+    batch.add_all(asteroids, rock)  # Actors use their own picture
+    batch.draw(screen.surface)
+"""
+
+KEY = (255, 0, 255)  # The "see-through" color of a stamp (nothing uses magenta)
+
+
+class Stamp:
+    """A pre-drawn picture that is placed centered on each object."""
+
+    def __init__(self, surface):
+        self.surface = surface
+        self.half_width = surface.get_width() // 2
+        self.half_height = surface.get_height() // 2
+
+    @classmethod
+    def circle(cls, radius, color, outline=None):
+        """
+        A filled circle (with a 1 pixel outline, if given), the same pixels
+        screen.draw.filled_circle() and screen.draw.circle() would draw.
+        """
+        import pygame  # Only needed once we actually paint something
+
+        size = 2 * radius
+        surface = pygame.Surface((size, size))
+        surface.fill(KEY)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        if outline is not None:
+            pygame.draw.circle(surface, outline, (radius, radius), radius, 1)
+        try:
+            surface = surface.convert()  # Match the display format for faster blits
+        except pygame.error:  # No display yet (e.g. headless tools)
+            pass
+        surface.set_colorkey(KEY, pygame.RLEACCEL)
+        return cls(surface)
+
+    def position(self, center):
+        """Where to blit the stamp so it is centered on center."""
+        x, y = center
+        return (x - self.half_width, y - self.half_height)
+
+
+class SpriteBatch:
+    """Collects (surface, position) pairs, then blits them all in one call."""
+
+    def __init__(self):
+        self.pairs = []
+        self.deferred = []  # (how many pairs come before it, a draw function)
+        self.calls = 0  # blits() calls so far...
+        self.drawn = 0  # ...and pictures they drew
+
+    def __len__(self):
+        return len(self.pairs) + len(self.deferred)
+
+    def add(self, surface, position):
+        self.pairs.append((surface, position))
+
+    def defer(self, draw):
+        """Call draw() when the batch is drawn, after what was added before it."""
+        self.deferred.append((len(self.pairs), draw))
+
+    def add_all(self, things, stamp=None):
+        """
+        Add every object in things: Actors with their own (current) picture,
+        anything else (Rects, Boxes...) as the stamp, centered on it.
+        """
+        pairs = self.pairs
+        if stamp is not None:
+            picture, dx, dy = stamp.surface, stamp.half_width, stamp.half_height
+        for thing in things:
+            surface = getattr(thing, "_surf", None)  # What Actor.draw() blits...
+            if surface is not None:
+                rect = thing._rect  # ...and where (much faster than thing.topleft)
+                pairs.append((surface, (rect.x, rect.y)))
+            elif hasattr(thing, "image"):
+                self.defer(thing.draw)  # An Actor we can't look inside draws itself
+            elif stamp is not None:
+                x, y = thing.center
+                pairs.append((picture, (x - dx, y - dy)))
+
+    def draw(self, target):
+        """Blit everything collected onto target (a Surface) and start over."""
+        pairs, count = self.pairs, len(self)
+        start = 0
+        for end, draw in self.deferred:  # Blit up to each deferred draw, then run it
+            self._blits(target, pairs[start:end])
+            draw()
+            start = end
+        self._blits(target, pairs[start:] if start else pairs)
+        self.drawn += count
+        self.pairs = []
+        self.deferred = []
+        return count
+
+    def _blits(self, target, pairs):
+        if pairs:
+            target.blits(pairs, doreturn=False)
+            self.calls += 1
+
+    def stats(self):
+        return {
+            "calls": self.calls,
+            "drawn": self.drawn,
+            "per_call": round(self.drawn / max(1, self.calls), 1),
+        }
@@ -0,0 +1,226 @@
+"""
+Spatial hash ("uniform grid") for finding objects near a rectangle.
+
+Checking the player against EVERY asteroid is fine for 10 asteroids, but
+slow for 10,000 — and almost all of them are far away. A spatial hash
+splits the world into square cells and remembers which objects touch which
+cells. To find what might hit the player we only look in the few cells the
+player's rectangle covers (the "broad phase"), then run colliderect() on
+just those candidates (the "narrow phase").
+
+Objects are anything with left/top/width/height (Actor, Rect, ...). They
+are tracked by id(), so unhashable objects like Rect work too.
+
+The same cells answer two more questions quickly: which object is nearest
+to a point (nearest() searches outwards ring by ring and stops as soon as
+nothing further out could be closer), and where the emptiest part of an
+area is (sparsest_cell(), for spawning things where there aren't any).
+"""
+
+import math
+
+
+class SpatialHash:
+    """
+    A grid of square cells, each holding the objects that overlap it.
+
+    insert() an object when it spawns, update() it after it moves (cheap
+    when it stays in the same cells), remove() it when it's gone, and
+    query() a rectangle to get the objects that might overlap it.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._cells = {}  # (cell_x, cell_y) -> {id(item): item}
+        self._spans = {}  # id(item) -> (x0, y0, x1, y1) cell range it's filed under
+        self._bounds = None  # (x0, y0, x1, y1): every cell ever filled is inside
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __contains__(self, item):
+        return id(item) in self._spans
+
+    def insert(self, item):
+        span = self._span(item.left, item.top, item.width, item.height)
+        self._spans[id(item)] = span
+        self._add(item, span)
+
+    def update(self, item):
+        """Re-file an item after it moved. Only touches cells if it changed cells."""
+        key = id(item)
+        old = self._spans.get(key)
+        span = self._span(item.left, item.top, item.width, item.height)
+        if span == old:
+            return
+        if old is not None:
+            self._discard(key, old)
+        self._spans[key] = span
+        self._add(item, span)
+
+    def remove(self, item):
+        span = self._spans.pop(id(item), None)
+        if span is not None:
+            self._discard(id(item), span)
+
+    def clear(self):
+        self._cells.clear()
+        self._spans.clear()
+        self._bounds = None
+
+    def query(self, rect):
+        """Return the items filed in the cells that rect overlaps."""
+        return self.query_area(rect.left, rect.top, rect.width, rect.height)
+
+    def query_area(self, left, top, width, height):
+        x0, y0, x1, y1 = self._span(left, top, width, height)
+        cells = self._cells
+        if x0 == x1 and y0 == y1:
+            return list(cells.get((x0, y0), {}).values())
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return list(found.values())
+
+    def nearest(self, x, y, max_distance=None):
+        """
+        Return the item whose center is nearest to (x, y), or None if there
+        are none (within max_distance, if given).
+        """
+        size = self.cell_size
+        cx, cy = int(x // size), int(y // size)
+        best, best_d2 = None, math.inf
+        if max_distance is not None:
+            best_d2 = max_distance * max_distance
+        rings = self._ring_limit(cx, cy)
+        for ring in range(rings + 1):
+            # Everything in this ring is at least this far away
+            if ring > 1 and ((ring - 1) * size) ** 2 > best_d2:
+                break
+            for cell in self._ring(cx, cy, ring):
+                for item in cell.values():
+                    dx = item.left + item.width / 2 - x
+                    dy = item.top + item.height / 2 - y
+                    d2 = dx * dx + dy * dy
+                    if d2 < best_d2:
+                        best, best_d2 = item, d2
+        return best
+
+    def sparsest_cell(self, left, top, width, height, rng=None):
+        """
+        Return (left, top, width, height) of the cell inside the area that
+        holds the fewest items. rng (a random.Random) breaks ties randomly;
+        without it the first one wins.
+        """
+        size = self.cell_size
+        x0, y0 = math.ceil(left / size), math.ceil(top / size)
+        x1, y1 = int((left + width) // size), int((top + height) // size)
+        cells = self._cells
+        best, fewest, ties = None, math.inf, 0
+        for cx in range(x0, x1):
+            for cy in range(y0, y1):
+                count = len(cells.get((cx, cy), ()))
+                if count < fewest:
+                    best, fewest, ties = (cx, cy), count, 1
+                elif count == fewest and rng is not None:
+                    ties += 1
+                    if rng.randrange(ties) == 0:  # Each tie equally likely
+                        best = (cx, cy)
+        if best is None:
+            return None
+        return (best[0] * size, best[1] * size, size, size)
+
+    def _ring_limit(self, cx, cy):
+        """How many rings out from (cx, cy) until every filled cell is covered."""
+        if not self._cells:
+            return -1
+        x0, y0, x1, y1 = self._bounds
+        return max(cx - x0, x1 - cx, cy - y0, y1 - cy)
+
+    def _ring(self, cx, cy, ring):
+        """The non-empty cells exactly `ring` cells away from (cx, cy)."""
+        cells = self._cells
+        if ring == 0:
+            cell = cells.get((cx, cy))
+            return [cell] if cell else []
+        found = []
+        for x in range(cx - ring, cx + ring + 1):
+            for y in (cy - ring, cy + ring):
+                cell = cells.get((x, y))
+                if cell:
+                    found.append(cell)
+        for y in range(cy - ring + 1, cy + ring):
+            for x in (cx - ring, cx + ring):
+                cell = cells.get((x, y))
+                if cell:
+                    found.append(cell)
+        return found
+
+    def _span(self, left, top, width, height):
+        size = self.cell_size
+        return (
+            int(left // size),
+            int(top // size),
+            int((left + width) // size),
+            int((top + height) // size),
+        )
+
+    def _add(self, item, span):
+        x0, y0, x1, y1 = span
+        bx0, by0, bx1, by1 = self._bounds or span
+        self._bounds = (min(bx0, x0), min(by0, y0), max(bx1, x1), max(by1, y1))
+        key = id(item)
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = {key: item}
+                else:
+                    cell[key] = item
+
+    def _discard(self, key, span):
+        x0, y0, x1, y1 = span
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(key, None)
+                    if not cell:
+                        del cells[(cx, cy)]
+
+
+class FallingGrid(SpatialHash):
+    """
+    A SpatialHash for objects that all move together, like asteroids that
+    all fall at the same speed.
+
+    Re-filing every object after every move costs more than the collision
+    checks the grid saves. So this grid doesn't move its objects at all:
+    fall(dy) just adds dy to how far everything has fallen, and positions
+    are shifted back by that much whenever the grid files an object or
+    answers a query. Moving the whole crowd is then a single addition.
+
+    insert(), update(), remove(), query() and query_area() take the
+    objects' real, current positions. (nearest() and sparsest_cell() are
+    for grids that stand still.)
+    """
+
+    def __init__(self, cell_size=64):
+        super().__init__(cell_size)
+        self.fallen = 0  # How far everything has moved down since clear()
+
+    def fall(self, dy):
+        """Every object moved down by dy (so the grid needn't touch them)."""
+        self.fallen += dy
+
+    def clear(self):
+        super().clear()
+        self.fallen = 0
+
+    def _span(self, left, top, width, height):
+        return super()._span(left, top - self.fallen, width, height)
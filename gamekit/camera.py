@@ -0,0 +1,135 @@
+"""
+A camera: which part of the world the window shows, and what's in it.
+
+draw() usually loops over every object and draws it, even the ones that
+are off the screen (asteroids waiting above the top, or sliding out at the
+bottom). That's a few wasted draws in an 800x600 world, but most of them
+once the world is bigger than the window.
+
+Camera keeps the view rectangle (left, top, width, height) in world
+coordinates. visible(store) returns only the objects in a store that
+overlap it, asking the store itself when it can answer faster than a
+loop over everything:
+
+- a SpatialHash (or anything with query_area()) looks in the view's cells,
+- a CoinArena (anything with visible()) is asked for its visible coins,
+- an AsteroidPool (anything with overlapping()) checks in one array step,
+- a plain list is checked object by object.
+
+It also counts, per frame, how many objects were drawn and how many were
+culled (skipped), so you can see what the culling saves.
+
+Even when the world is the window (like Star Dodger's), objects wait above
+the top and slide out past the bottom, and those are culled too.
+"""
+
+
+class Camera:
+    """The view of a world (world_width x world_height, or unlimited)."""
+
+    def __init__(self, width, height, world_width=None, world_height=None):
+        self.left = 0
+        self.top = 0
+        self.width = width
+        self.height = height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.drawn = 0  # Objects visible() returned this frame...
+        self.culled = 0  # ...and objects it left out
+        self.frames = 0
+        self.total_drawn = 0
+        self.total_culled = 0
+
+    @property
+    def view(self):
+        return (self.left, self.top, self.width, self.height)
+
+    def move_to(self, left, top):
+        """Put the view's top-left corner at (left, top), kept inside the world."""
+        if self.world_width is not None:
+            left = max(0, min(left, self.world_width - self.width))
+        if self.world_height is not None:
+            top = max(0, min(top, self.world_height - self.height))
+        self.left, self.top = left, top
+        return left, top
+
+    def follow(self, target):
+        """Center the view on target (anything with a center, like an Actor)."""
+        x, y = target.center
+        return self.move_to(x - self.width // 2, y - self.height // 2)
+
+    def to_screen(self, x, y):
+        """Turn a world position into a window position."""
+        return (x - self.left, y - self.top)
+
+    def new_frame(self):
+        """Start counting a new frame (call at the start of draw())."""
+        self.frames += 1
+        self.total_drawn += self.drawn
+        self.total_culled += self.culled
+        self.drawn = self.culled = 0
+
+    def visible(self, store):
+        """The objects in store that overlap the view."""
+        left, top, width, height = self.view
+        if hasattr(store, "query_area"):  # SpatialHash
+            found = [
+                item
+                for item in store.query_area(left, top, width, height)
+                if self.sees(_rect_of(item))
+            ]
+        elif hasattr(store, "visible"):  # CoinArena
+            found = store.visible(left, top, width, height)
+        elif hasattr(store, "overlapping"):  # AsteroidPool
+            indices = store.overlapping(self)
+            store.sync(indices)  # Only the objects we're about to draw
+            items = store.items
+            found = [items[i] for i in indices]
+        else:
+            found = self._overlapping(store)
+        self.drawn += len(found)
+        self.culled += len(store) - len(found)
+        return found
+
+    def sees(self, item):
+        """True if item (anything with left/top/width/height) overlaps the view."""
+        return (
+            item.left < self.left + self.width
+            and item.left + item.width > self.left
+            and item.top < self.top + self.height
+            and item.top + item.height > self.top
+        )
+
+    def _overlapping(self, things):
+        """sees() for every thing in a list, without a call per thing."""
+        left, top = self.left, self.top
+        right, bottom = left + self.width, top + self.height
+        found = []
+        for thing in things:
+            rect = _rect_of(thing)
+            x, y = rect.left, rect.top
+            if (
+                x < right
+                and x + rect.width > left
+                and y < bottom
+                and y + rect.height > top
+            ):
+                found.append(thing)
+        return found
+
+    def stats(self):
+        frames = max(1, self.frames)
+        return {
+            "frames": self.frames,
+            "drawn_per_frame": round(self.total_drawn / frames, 1),
+            "culled_per_frame": round(self.total_culled / frames, 1),
+        }
+
+
+def _rect_of(item):
+    """
+    The rectangle to check for item. An Actor's own left/top/width/height
+    are looked up the slow way (through the Actor to its rect), so read
+    them straight from the rect (_rect) it keeps them in.
+    """
+    return getattr(item, "_rect", item)
@@ -0,0 +1,95 @@
+"""
+A big Gold Collector arena with thousands of coins.
+
+gold_collector_game.py has one coin, so checking player.colliderect(coin)
+every frame is all it needs. With 5000 coins spread over an arena much
+bigger than the window, checking them all every frame (and drawing them
+all) would be far too slow, so CoinArena files every coin in a
+SpatialHash grid:
+
+- touching(player) only tests the coins in the cells the player covers,
+- visible(view) only returns the coins in the cells the camera can see,
+- nearest(x, y) finds the closest coin for a compass arrow, searching
+  outwards from the player's cell instead of measuring every coin,
+- a collected coin respawns in the emptiest cell of the arena
+  (sparsest_cell()), so the coins spread back into the parts that have
+  been cleared instead of piling up where there are already plenty.
+
+Coins are Boxes (no pygame needed), so the arena works headless too.
+"""
+
+import random
+
+from gamekit.broadphase import SpatialHash
+from gamekit.sim_base import Box
+
+
+class CoinArena:
+    """width x height pixels of world, holding `coins` coins."""
+
+    def __init__(
+        self,
+        width=4000,
+        height=4000,
+        coins=5000,
+        coin_size=24,
+        cell_size=128,
+        seed=None,
+    ):
+        self.width = width
+        self.height = height
+        self.coin_size = coin_size
+        self.rng = random.Random(seed)
+        self.grid = SpatialHash(cell_size)
+        self.coins = []
+        self.collected = 0
+        self.respawned = 0
+        for _ in range(coins):
+            coin = Box(
+                self.rng.randrange(width - coin_size),
+                self.rng.randrange(height - coin_size),
+                coin_size,
+                coin_size,
+            )
+            self.coins.append(coin)
+            self.grid.insert(coin)
+
+    def __len__(self):
+        return len(self.coins)
+
+    def touching(self, player):
+        """The coins player is touching."""
+        return [coin for coin in self.grid.query(player) if coin.colliderect(player)]
+
+    def collect(self, player):
+        """Return the coins player touches, respawning each one somewhere sparse."""
+        touched = self.touching(player)
+        for coin in touched:
+            self.collected += 1
+            self.respawn(coin)
+        return touched
+
+    def respawn(self, coin):
+        """Move coin to a random spot in the emptiest cell of the arena."""
+        cell = self.grid.sparsest_cell(0, 0, self.width, self.height, self.rng)
+        left, top, size, _ = cell
+        room = max(1, size - coin.width)
+        coin.left = left + self.rng.randrange(room)
+        coin.top = top + self.rng.randrange(room)
+        self.grid.update(coin)
+        self.respawned += 1
+
+    def nearest(self, x, y):
+        """The coin whose center is closest to (x, y)."""
+        return self.grid.nearest(x, y)
+
+    def visible(self, left, top, width, height):
+        """The coins that might be on screen, for a camera at (left, top)."""
+        return [
+            coin
+            for coin in self.grid.query_area(left, top, width, height)
+            if coin.left < left + width
+            and coin.left + coin.width > left
+            and coin.top < top + height
+            and coin.top + coin.height > top
+        ]
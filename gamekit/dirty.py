@@ -0,0 +1,119 @@
+"""
+Repaint only the parts of the screen that changed.
+
+Gold Collector's draw() clears and repaints all 800x600 pixels every frame,
+but from one frame to the next only a few small areas change: where the
+player was and is now, where the coin was and is now, and the score.
+
+DirtyRects asks the game each frame for its "regions": a name, the area
+it covers, and a version (anything that changes when the picture changes,
+like the score). Any region that moved or changed makes both its old and
+its new area dirty. The game's own draw() then runs once per dirty area,
+with the screen clipped to that area, so clearing and drawing only touch
+those pixels. Because the unchanged draw() does the painting, everything
+still overlaps in the right order.
+
+A region covering the whole screen (like the background, versioned by
+USE_BACKGROUND) forces a full repaint whenever its version changes.
+
+Pygame Zero still presents the whole screen with pygame.display.flip()
+after draw(); what this saves is the clearing, filling and drawing.
+"""
+
+
+def bounds(thing):
+    """The (left, top, width, height) of an Actor or a Rect."""
+    return (thing.left, thing.top, thing.width, thing.height)
+
+
+class DirtyRects:
+    """Runs a draw() function only where the screen changed."""
+
+    def __init__(self, regions):
+        self.regions = regions  # function -> {name: ((l, t, w, h), version)}
+        self._previous = None  # Last frame's regions (None = repaint it all)
+        self.frames = 0
+        self.full_repaints = 0
+        self.painted = 0  # Pixels repainted, over all frames
+        self.screen_pixels = 0  # Pixels a full repaint every frame would cost
+
+    def invalidate(self):
+        """Repaint the whole screen next frame."""
+        self._previous = None
+
+    def dirty(self, screen_rect):
+        """Work out this frame's dirty areas (as pygame Rects)."""
+        import pygame
+
+        current = self.regions()
+        previous, self._previous = self._previous, current
+        if previous is None:
+            return [screen_rect]
+
+        areas = []
+        for name in current.keys() | previous.keys():
+            new, old = current.get(name), previous.get(name)
+            if new == old:
+                continue
+            for region in (old, new):
+                if region is not None:
+                    area = pygame.Rect(region[0]).clip(screen_rect)
+                    if area.width and area.height:
+                        areas.append(area)
+        return _merge(areas)
+
+    def wrap(self, draw):
+        """
+        Return a draw() to use in place of the game's own:
+
+            draw = dirty_rects.wrap(draw)
+        """
+        import pgzero.game
+
+        last_surface = None
+
+        def draw_dirty():
+            nonlocal last_surface
+            surface = pgzero.game.screen
+            if surface is not last_surface:
+                self.invalidate()  # A new window has nothing on it yet
+                last_surface = surface
+            screen_rect = surface.get_rect()
+            areas = self.dirty(screen_rect)
+            self.frames += 1
+            self.screen_pixels += screen_rect.width * screen_rect.height
+            if areas == [screen_rect]:
+                self.full_repaints += 1
+            old_clip = surface.get_clip()
+            try:
+                for area in areas:
+                    surface.set_clip(area)
+                    draw()
+                    self.painted += area.width * area.height
+            finally:
+                surface.set_clip(old_clip)
+
+        return draw_dirty
+
+    def stats(self):
+        share = self.painted / self.screen_pixels if self.screen_pixels else 0.0
+        return {
+            "frames": self.frames,
+            "full_repaints": self.full_repaints,
+            "painted_share": round(share, 4),  # 1.0 = as much as full repaints
+        }
+
+
+def _merge(areas):
+    """Join overlapping areas, so no pixel is repainted twice in a frame."""
+    merged = []
+    for area in areas:
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(area):
+                area = area.union(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(area)
+    return merged
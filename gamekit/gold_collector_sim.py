@@ -0,0 +1,89 @@
+"""
+Headless, deterministic Gold Collector.
+
+The rules of week01/gold_collector_game.py (shapes mode) as an object that
+steps one fixed tick at a time, takes Keys as input and draws its random
+numbers from its own seeded random.Random — no window needed.
+
+Gold Collector has no "game over", so a game lasts as long as you keep
+stepping it; run() takes a max_ticks time limit.
+"""
+
+import random
+from dataclasses import dataclass
+
+from gamekit.sim_base import NO_KEYS, Box, next_keys_for
+
+
+@dataclass
+class Settings:
+    """The gold_collector_game.py settings."""
+
+    width: int = 800
+    height: int = 600
+    random_movement: bool = False  # USE_RANDOM_MOVEMENT
+    player_speed: float = 5
+    tick_rate: int = 60  # Logic ticks per second
+
+
+class GoldCollectorSim:
+    """
+    One game of Gold Collector. Public state: score, tick, player and coin
+    (Boxes). game_over is always False, so it can share code with
+    StarDodgerSim.
+    """
+
+    game_over = False
+
+    def __init__(self, settings=None, seed=None):
+        self.settings = settings if settings is not None else Settings()
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.reset(seed)
+
+    @property
+    def dt(self):
+        return 1.0 / self.settings.tick_rate
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(seed)
+        self.score = 0
+        self.tick = 0
+        self.player = Box(380, 280, 44, 44)
+        self.coin = Box(520, 320, 24, 24)
+
+    def step(self, keys=NO_KEYS):
+        s, player = self.settings, self.player
+        self.tick += 1
+        speed = s.player_speed
+        if keys.left:
+            player.left -= speed
+        if keys.right:
+            player.left += speed
+        if keys.up:
+            player.top -= speed
+        if keys.down:
+            player.top += speed
+        player.left = max(0, min(player.left, s.width - player.width))
+        player.top = max(0, min(player.top, s.height - player.height))
+
+        if player.colliderect(self.coin):
+            self.score += 1
+            self.move_coin_to_new_position()
+
+    def run(self, policy=None, max_ticks=3600):
+        """Play for max_ticks ticks and return the score."""
+        next_keys = next_keys_for(policy)
+        while self.tick < max_ticks:
+            self.step(next_keys(self))
+        return self.score
+
+    def move_coin_to_new_position(self):
+        s, coin = self.settings, self.coin
+        if s.random_movement:
+            coin.left = self.rng.randint(0, s.width - coin.width)
+            coin.top = self.rng.randint(0, s.height - coin.height)
+        else:
+            coin.left = (coin.left + 160) % (s.width - coin.width)
@@ -0,0 +1,105 @@
+"""
+Cached HUD (Heads-Up Display) text.
+
+screen.draw.text() turns a string into pixels ("rasterizes" it) every time
+it is called — 60 times a second for a score that only changes now and then.
+The Hud here keeps the pixels around instead:
+
+- TextCache remembers rendered text surfaces, keyed by (text, fontsize,
+  color), and throws away the least recently used ones when it gets full.
+- Hud remembers what each HUD slot showed last frame and reuses that
+  surface until the text changes.
+
+Hud.text() takes the same arguments as screen.draw.text() for the things
+our HUDs use (a position or center=, color=, fontsize=), so a game can
+switch between the two with a single USE_... setting.
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces with hit/miss counters."""
+
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()  # (text, fontsize, color) -> Surface
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def get(self, text, fontsize=24, color="white"):
+        key = (text, fontsize, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._render(text, fontsize, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)  # Evict the least recently used
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def _render(self, text, fontsize, color):
+        from pgzero import ptext  # Same renderer as screen.draw.text()
+
+        # cache=False: this class is the cache, no need for ptext's as well
+        return ptext.getsurf(text, fontsize=fontsize, color=color, cache=False)
+
+
+class Hud:
+    """
+    HUD text slots that only re-render when their text changes.
+
+    Each slot is identified by where it's drawn (its position or center),
+    so the "Score" line is one slot whether the score is 9 or 10.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else TextCache()
+        self.reused = 0  # Frames where a slot's text was unchanged
+        self._slots = {}  # slot -> (text, fontsize, color, surface, topleft)
+
+    def text(self, text, pos=None, center=None, color="white", fontsize=24, surf=None):
+        """Draw text like screen.draw.text(), reusing last frame's pixels if we can."""
+        slot = ("center", center) if center is not None else ("pos", pos)
+        previous = self._slots.get(slot)
+        if previous is not None and previous[:3] == (text, fontsize, color):
+            self.reused += 1
+            surface, topleft = previous[3], previous[4]
+        else:
+            surface = self.cache.get(text, fontsize, color)
+            if center is not None:
+                x = center[0] - surface.get_width() / 2
+                y = center[1] - surface.get_height() / 2
+                topleft = (int(round(x)), int(round(y)))
+            else:
+                topleft = (int(round(pos[0])), int(round(pos[1])))
+            self._slots[slot] = (text, fontsize, color, surface, topleft)
+
+        if surf is None:
+            # The surface pgzero is drawing to (like Actor.draw)
+            from pgzero import game
+
+            surf = game.screen
+        surf.blit(surface, topleft)
+
+    def stats(self):
+        """Counters for checking that the cache is doing its job."""
+        calls = self.reused + self.cache.hits + self.cache.misses
+        return {
+            "hits": self.cache.hits,
+            "misses": self.cache.misses,
+            "reused": self.reused,
+            "cached": len(self.cache),
+            # Fraction of text() calls that didn't have to render any text
+            "hit_rate": (calls - self.cache.misses) / calls if calls else 0.0,
+        }
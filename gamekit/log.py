@@ -0,0 +1,103 @@
+"""
+Game messages through Python's logging module, instead of print().
+
+print() formats and writes its message straight away, every time. When a
+game prints on every spawn, dodge and hit, that console output can become a
+real share of each frame (and it blocks when the output is piped somewhere
+slow). A logger only builds the message if it is actually going to be shown:
+
+    log.debug("list now has %s item(s)", len(asteroids))
+
+Levels pick how chatty a game is:
+
+- "DEBUG": everything, including every list append/remove
+- "INFO": game events (hits, bonus stars, game over...)
+- "WARNING": only problems
+- "OFF": nothing at all; log calls return straight away
+
+On top of that, RateLimitFilter lets each message through at most a few
+times a second, and says how many copies it held back.
+"""
+
+import logging
+import sys
+import time
+
+OFF = logging.CRITICAL + 10
+
+LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "OFF": OFF,
+}
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let each message through at most `per_second` times a second.
+
+    Messages are told apart by their unformatted text, so "Score: %s" is one
+    message whatever the score is. The next copy that gets through after a
+    quiet spell says how many were held back.
+    """
+
+    def __init__(self, per_second=10):
+        super().__init__()
+        self.per_second = per_second
+        self._windows = {}  # (logger, message) -> [window start, shown, held back]
+
+    def filter(self, record):
+        now = time.monotonic()
+        key = (record.name, record.msg)
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= 1.0:
+            held_back = window[2] if window else 0
+            self._windows[key] = [now, 1, 0]
+            if held_back:
+                record.msg = f"{record.getMessage()}  (+{held_back} similar)"
+                record.args = ()
+            return True
+        if window[1] < self.per_second:
+            window[1] += 1
+            return True
+        window[2] += 1
+        return False
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to whatever sys.stdout is *now*, so redirecting it still works."""
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+
+def configure_logging(game, level="INFO", per_second=10):
+    """
+    Set up and return the logger for one game, e.g.
+    log = configure_logging("star_dodger", "INFO").
+
+    Messages go to the console with nothing added, so they look just like
+    print() output. Calling this again (when a game is reloaded) replaces the
+    old settings instead of printing everything twice.
+    """
+    if isinstance(level, str):
+        level = LEVELS[level.upper()]
+    logger = logging.getLogger(f"games.{game}")
+    logger.setLevel(level)
+    logger.disabled = level >= OFF  # Quickest "no" there is
+    logger.propagate = False
+
+    for handler in list(logger.handlers):
+        if isinstance(handler, _StdoutHandler):
+            logger.removeHandler(handler)
+    handler = _StdoutHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    if per_second:
+        handler.addFilter(RateLimitFilter(per_second))
+    logger.addHandler(handler)
+    return logger
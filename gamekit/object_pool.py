@@ -0,0 +1,71 @@
+"""
+Recycle game objects instead of building new ones.
+
+Every spawn_asteroid() builds a brand-new Actor (which means looking up its
+image) and every removed asteroid becomes garbage. With lots of spawns that
+adds up to allocation churn and garbage-collector pauses.
+
+An ObjectPool keeps removed objects on a "free list". acquire() hands one
+back out (re-initialized by your reset function) and only builds a new
+object when the free list is empty; release() puts an object back.
+"""
+
+
+class ObjectPool:
+    """
+    A free list of reusable objects.
+
+    create() builds a new object; reset(obj, *args) re-initializes one when
+    it is handed out (for example, moving it to its spawn position).
+    """
+
+    def __init__(self, create, reset=None, prewarm=0, max_free=None):
+        self._create = create
+        self._reset = reset
+        self._free = []
+        self.max_free = max_free  # None = keep every released object
+        self.live = 0  # Objects handed out and not yet released
+        self.high_water = 0  # The most objects ever live at once
+        self.created = 0
+        self.reused = 0
+        self.prewarm(prewarm)
+
+    def prewarm(self, count):
+        """Build objects ahead of time until `count` are waiting in the free list."""
+        while len(self._free) < count:
+            self._free.append(self._create())
+            self.created += 1
+
+    def acquire(self, *args, **kwargs):
+        """Hand out an object, reusing a released one when there is one."""
+        if self._free:
+            obj = self._free.pop()
+            self.reused += 1
+        else:
+            obj = self._create()
+            self.created += 1
+        if self._reset is not None:
+            self._reset(obj, *args, **kwargs)
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        """Give an object back so a later acquire() can reuse it."""
+        self.live -= 1
+        if self.max_free is None or len(self._free) < self.max_free:
+            self._free.append(obj)
+
+    def release_all(self, objects):
+        for obj in objects:
+            self.release(obj)
+
+    def stats(self):
+        return {
+            "live": self.live,
+            "free": len(self._free),
+            "high_water": self.high_water,
+            "created": self.created,
+            "reused": self.reused,
+        }
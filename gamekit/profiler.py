@@ -0,0 +1,97 @@
+"""
+Time each part of a frame, so you can see which part is slow.
+
+A game calls start("update") at the top of update(), lap("movement") after
+each part and stop() at the end. Every lap goes into two histograms:
+
+- a rolling one (the last `window` frames) for the on-screen overlay, so it
+  shows what is happening right now,
+- a whole-run one with fixed millisecond buckets, for dump(), so a slow
+  moment a minute ago still shows up afterwards.
+"""
+
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+
+# Bucket edges in milliseconds; a 60 FPS frame has 16.7 ms to spend
+BUCKETS_MS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33)
+
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling and whole-run histograms."""
+
+    def __init__(self, window=300, clock=time.perf_counter):
+        self.window = window
+        self.visible = False  # Is the overlay showing?
+        self._clock = clock
+        self._recent = {}  # "update.movement" -> the last `window` times (ms)
+        self._buckets = {}  # "update.movement" -> a count per bucket, plus one
+        self._section = None
+        self._section_start = self._last = 0.0
+
+    def start(self, section):
+        """Start timing a section of the frame, like "update" or "draw"."""
+        self._section = section
+        self._section_start = self._last = self._clock()
+
+    def lap(self, phase):
+        """Record the time since the last lap (or start) as this phase."""
+        now = self._clock()
+        self.record(f"{self._section}.{phase}", (now - self._last) * 1000)
+        self._last = now
+
+    def stop(self):
+        """Record the whole section's time as "<section>.total"."""
+        elapsed = self._clock() - self._section_start
+        self.record(f"{self._section}.total", elapsed * 1000)
+
+    def record(self, name, ms):
+        recent = self._recent.get(name)
+        if recent is None:
+            recent = self._recent[name] = deque(maxlen=self.window)
+            self._buckets[name] = [0] * (len(BUCKETS_MS) + 1)
+        recent.append(ms)
+        self._buckets[name][bisect_left(BUCKETS_MS, ms)] += 1
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def summary(self):
+        """p50/p95/max (ms) of each phase over the rolling window."""
+        result = {}
+        for name, recent in self._recent.items():
+            ordered = sorted(recent)
+            last = len(ordered) - 1
+            result[name] = {
+                "p50": ordered[last // 2],
+                "p95": ordered[last * 95 // 100],
+                "max": ordered[last],
+            }
+        return result
+
+    def lines(self):
+        """The overlay's text, one line per phase."""
+        lines = [f"{'phase':18} {'p50':>6} {'p95':>6}  ms"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:18} {stats['p50']:6.2f} {stats['p95']:6.2f}")
+        return lines
+
+    def histograms(self):
+        """Whole-run counts per bucket, labelled "<=1ms" and so on."""
+        labels = [f"<={edge}ms" for edge in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return {
+            name: {label: count for label, count in zip(labels, counts) if count}
+            for name, counts in self._buckets.items()
+        }
+
+    def dump(self, path):
+        """Write the rolling summary and the whole-run histograms as JSON."""
+        report = {
+            "window": self.window,
+            "recent": self.summary(),
+            "histograms": self.histograms(),
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
@@ -0,0 +1,249 @@
+"""
+Record a Star Dodger session and play it back without a window.
+
+StarDodgerSim is deterministic: the same seed, settings and keys always
+give the same game. So a whole session fits in a tiny file:
+
+- the seed and the Settings,
+- which arrow keys were held on every frame (4 bits, run-length encoded,
+  so holding LEFT for ten seconds costs a few bytes),
+- the on_key_down() events (like SPACE to restart) and the frame they
+  happened on.
+
+ReplayPlayer re-simulates a replay as fast as the computer can go. It saves
+a snapshot of the whole simulation every `snapshot_every` frames on the
+way, so seek() can jump to any frame without replaying from the start.
+That is handy for reproducing a rare collision bug, or for timing one
+heavy moment of a game:
+
+    python -m gamekit.replay session.sdr
+    python -m gamekit.replay session.sdr --seek 5400 --frames 600
+"""
+
+import argparse
+import copy
+import json
+import random
+import struct
+import time
+from dataclasses import asdict, dataclass, field
+
+from gamekit.sim_base import Keys
+from gamekit.star_dodger_sim import Settings, StarDodgerSim
+
+MAGIC = b"SDRP"
+VERSION = 1
+SPACE = 32  # pygame's K_SPACE, so this file doesn't need pygame
+
+_HEADER = struct.Struct("<4sBq")  # magic, version, seed
+_LENGTH = struct.Struct("<I")
+_RUN = struct.Struct("<HB")  # frames, key bits
+_EVENT = struct.Struct("<IH")  # frame, key code
+_BITS = (1, 2, 4, 8)  # left, right, up, down
+
+
+def keys_to_bits(keys):
+    return sum(bit for bit, held in zip(_BITS, keys) if held)
+
+
+def bits_to_keys(bits):
+    return Keys(*(bool(bits & bit) for bit in _BITS))
+
+
+@dataclass
+class Replay:
+    """One recorded session: everything needed to play it again exactly."""
+
+    seed: int
+    settings: dict
+    keys: bytearray = field(default_factory=bytearray)  # Key bits, one per frame
+    events: list = field(default_factory=list)  # (frame, key code) pairs
+
+    def __len__(self):
+        return len(self.keys)
+
+    def to_bytes(self):
+        settings = json.dumps(self.settings, sort_keys=True).encode()
+        runs = list(_runs(self.keys))
+        parts = [
+            _HEADER.pack(MAGIC, VERSION, self.seed),
+            _LENGTH.pack(len(settings)),
+            settings,
+            _LENGTH.pack(len(runs)),
+            *(_RUN.pack(count, bits) for count, bits in runs),
+            _LENGTH.pack(len(self.events)),
+            *(_EVENT.pack(frame, key) for frame, key in self.events),
+        ]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a Star Dodger replay (or a newer version)")
+        offset = _HEADER.size
+
+        def read_length():
+            nonlocal offset
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            return length
+
+        size = read_length()
+        end = offset + size
+        settings = json.loads(data[offset:end])
+        offset = end
+
+        keys = bytearray()
+        for _ in range(read_length()):
+            count, bits = _RUN.unpack_from(data, offset)
+            offset += _RUN.size
+            keys += bytes((bits,)) * count
+
+        events = []
+        for _ in range(read_length()):
+            events.append(_EVENT.unpack_from(data, offset))
+            offset += _EVENT.size
+        return cls(seed, settings, keys, events)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def _runs(keys):
+    """(count, bits) runs of a key-bits bytearray, each at most 65535 long."""
+    count, current = 0, None
+    for bits in keys:
+        if bits == current and count < 0xFFFF:
+            count += 1
+        else:
+            if count:
+                yield count, current
+            count, current = 1, bits
+    if count:
+        yield count, current
+
+
+def handle_key(sim, key):
+    """What star_dodger_sim_view.py's on_key_down() does with a key press."""
+    if key == SPACE and sim.game_over:
+        sim.reset()
+
+
+class ReplayRecorder:
+    """
+    Wraps a StarDodgerSim and writes down everything that drives it.
+
+    Use recorder.step(keys) and recorder.key_down(key) instead of the sim's
+    own step() and the game's key handling. A sim without a seed gets a
+    random one first, because the replay needs to know it.
+    """
+
+    def __init__(self, sim):
+        if sim.seed is None:
+            sim.reset(random.randrange(2**62))
+        self.sim = sim
+        self.replay = Replay(sim.seed, asdict(sim.settings))
+
+    def step(self, keys):
+        self.replay.keys.append(keys_to_bits(keys))
+        self.sim.step(keys)
+
+    def key_down(self, key):
+        self.replay.events.append((len(self.replay.keys), int(key)))
+        handle_key(self.sim, key)
+
+    def save(self, path):
+        self.replay.save(path)
+
+
+class ReplayPlayer:
+    """Re-simulates a Replay headlessly, with snapshots for seeking."""
+
+    def __init__(self, replay, snapshot_every=600):
+        self.replay = replay
+        self.snapshot_every = snapshot_every
+        self._events = {}
+        for frame, key in replay.events:
+            self._events.setdefault(frame, []).append(key)
+        self.sim = StarDodgerSim(Settings(**replay.settings), seed=replay.seed)
+        self.frame = 0
+        self._snapshots = {0: copy.deepcopy(self.sim)}
+
+    def play(self, frames=None):
+        """
+        Run `frames` more frames (or to the end of the replay) and return
+        how many actually ran.
+        """
+        end = len(self.replay) if frames is None else self.frame + frames
+        end = min(end, len(self.replay))
+        start = self.frame
+        keys, sim = self.replay.keys, self.sim
+        while self.frame < end:
+            frame = self.frame
+            for key in self._events.get(frame, ()):
+                handle_key(sim, key)
+            sim.step(bits_to_keys(keys[frame]))
+            self.frame = frame + 1
+            if self.frame % self.snapshot_every == 0:
+                self._snapshots.setdefault(self.frame, copy.deepcopy(sim))
+        return self.frame - start
+
+    def seek(self, frame):
+        """Put the simulation at the start of `frame`, as quickly as possible."""
+        frame = max(0, min(frame, len(self.replay)))
+        nearest = max(f for f in self._snapshots if f <= frame)
+        if not nearest <= self.frame <= frame:
+            self.sim = copy.deepcopy(self._snapshots[nearest])
+            self.frame = nearest
+        self.play(frame - self.frame)
+        return self.sim
+
+
+def describe(sim):
+    return {
+        "tick": sim.tick,
+        "score": sim.score,
+        "lives": sim.lives,
+        "invincible": sim.invincible,
+        "game_over": sim.game_over,
+        "asteroids": len(sim.asteroids),
+        "bonus_stars": len(sim.bonus_stars),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play back a Star Dodger replay")
+    parser.add_argument("replay")
+    parser.add_argument("--seek", type=int, default=None, help="jump to this frame")
+    parser.add_argument(
+        "--frames", type=int, default=None, help="how many frames to time after --seek"
+    )
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.replay)
+    player = ReplayPlayer(replay)
+    if args.seek is not None:
+        player.seek(args.seek)
+    start = time.perf_counter()
+    ran = player.play(args.frames)
+    seconds = time.perf_counter() - start
+
+    report = {
+        "frames": len(replay),
+        "played": ran,
+        "seconds": round(seconds, 4),
+        "frames_per_second": round(ran / seconds) if seconds else None,
+        "state": describe(player.sim),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Play lots of seeded games at once and summarize how they went.
+
+Playing Star Dodger by hand to find a good ASTEROID_SPEED takes hours.
+run_rollouts() plays N headless games (one seed each) on every CPU core
+with a ProcessPoolExecutor and reports the score, how long each game
+lasted, and how many hits and dodges there were.
+
+A policy decides which keys are held each tick. It can be a name
+("idle", "random", "dodge" for Star Dodger, "chase" for Gold Collector),
+a list of Keys to replay, or a function sim -> Keys defined at module
+level (so it can be sent to the worker processes).
+
+From the command line (prints a JSON summary):
+
+    python -m gamekit.rollout star_dodger --episodes 1000 --policy dodge \\
+        --set asteroid_speed=5 --set asteroid_interval=1.0
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields, replace
+from functools import partial
+
+from gamekit import gold_collector_sim, star_dodger_sim
+from gamekit.sim_base import NO_KEYS, Keys
+
+GAMES = {
+    "star_dodger": star_dodger_sim,
+    "gold_collector": gold_collector_sim,
+}
+
+# Default game length limits (ticks). Star Dodger usually ends on its own.
+DEFAULT_MAX_TICKS = {"star_dodger": 60 * 60 * 10, "gold_collector": 60 * 60}
+
+
+class RandomPolicy:
+    """Presses a random combination of keys, changing it every `hold` ticks."""
+
+    def __init__(self, seed=None, hold=10):
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.keys = NO_KEYS
+
+    def __call__(self, sim):
+        if sim.tick % self.hold == 0:
+            self.keys = Keys(*(self.rng.random() < 0.5 for _ in range(4)))
+        return self.keys
+
+
+def dodge_policy(sim):
+    """Star Dodger: slide away from the closest asteroid falling towards us."""
+    player = sim.player
+    left, right = player.left - 10, player.right + 10
+    threat = None
+    for a_left, a_top, a_width, a_height in sim.asteroids.rects():
+        if a_left < right and a_left + a_width > left and a_top < player.bottom:
+            if threat is None or a_top > threat[1]:
+                threat = (a_left + a_width / 2, a_top)
+    if threat is None:
+        return Keys(down=True)
+    go_left = threat[0] > player.left + player.width / 2
+    if player.left <= 0:
+        go_left = False
+    elif player.right >= sim.settings.width:
+        go_left = True
+    return Keys(left=go_left, right=not go_left, down=True)
+
+
+def chase_policy(sim):
+    """Gold Collector: head straight for the coin."""
+    (px, py), (cx, cy) = sim.player.center, sim.coin.center
+    return Keys(left=cx < px - 2, right=cx > px + 2, up=cy < py - 2, down=cy > py + 2)
+
+
+NAMED_POLICIES = {"dodge": dodge_policy, "chase": chase_policy}
+
+
+def make_policy(policy, seed):
+    """Turn a policy name into something the sims can run."""
+    if policy == "idle":
+        return None
+    if policy == "random":
+        return RandomPolicy(seed)
+    if isinstance(policy, str):
+        return NAMED_POLICIES[policy]
+    if callable(policy) or policy is None:
+        return policy
+    return list(policy)  # A script: each episode replays it from the start
+
+
+def play_episode(game, seed, policy="random", settings=None, max_ticks=None):
+    """Play one seeded game headlessly and return what happened."""
+    module = GAMES[game]
+    sim_class = (
+        module.StarDodgerSim if game == "star_dodger" else module.GoldCollectorSim
+    )
+    sim = sim_class(settings, seed=seed)
+    if max_ticks is None:
+        max_ticks = DEFAULT_MAX_TICKS[game]
+    sim.run(make_policy(policy, seed), max_ticks=max_ticks)
+    return {
+        "seed": seed,
+        "score": sim.score,
+        "ticks": sim.tick,
+        "seconds": sim.tick * sim.dt,
+        "hits": getattr(sim, "hits", 0),
+        "dodges": getattr(sim, "dodges", 0),
+        "game_over": sim.game_over,
+    }
+
+
+def run_rollouts(
+    game="star_dodger",
+    episodes=100,
+    policy="random",
+    settings=None,
+    max_ticks=None,
+    workers=None,
+    seed=0,
+):
+    """
+    Play `episodes` games with seeds seed, seed+1, ... and return a summary
+    (see summarize()) with the per-episode results under "episodes".
+
+    workers=None uses every CPU core; workers=1 plays in this process.
+    """
+    seeds = range(seed, seed + episodes)
+    play = partial(
+        play_episode, game, policy=policy, settings=settings, max_ticks=max_ticks
+    )
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or episodes == 1:
+        results = [play(s) for s in seeds]
+    else:
+        chunksize = max(1, episodes // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(play, seeds, chunksize=chunksize))
+    summary = summarize(results)
+    summary["episodes"] = results
+    return summary
+
+
+def summarize(results):
+    """Mean/stdev/min/max of each number across episodes."""
+    summary = {"count": len(results)}
+    for key in ("score", "seconds", "hits", "dodges"):
+        values = [r[key] for r in results]
+        summary[key] = {
+            "mean": statistics.fmean(values) if values else 0.0,
+            "stdev": statistics.pstdev(values) if values else 0.0,
+            "min": min(values, default=0),
+            "max": max(values, default=0),
+        }
+    summary["game_over_rate"] = (
+        sum(r["game_over"] for r in results) / len(results) if results else 0.0
+    )
+    return summary
+
+
+def parse_settings(game, assignments):
+    """Build a Settings object from ["asteroid_speed=5", ...]."""
+    settings = GAMES[game].Settings()
+    types = {f.name: f.type for f in fields(settings)}
+    changes = {}
+    for assignment in assignments:
+        name, _, text = assignment.partition("=")
+        if name not in types:
+            raise SystemExit(f"Unknown setting for {game}: {name}")
+        if types[name] is bool:
+            changes[name] = text.strip().lower() in ("1", "true", "yes", "on")
+        else:
+            changes[name] = types[name](text)
+    return replace(settings, **changes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("game", choices=sorted(GAMES))
+    parser.add_argument("--episodes", type=int, default=100)
+    parser.add_argument("--policy", default="random")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=None)
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="change a setting",
+    )
+    parser.add_argument(
+        "--per-episode", action="store_true", help="include every episode in the output"
+    )
+    args = parser.parse_args(argv)
+
+    summary = run_rollouts(
+        args.game,
+        episodes=args.episodes,
+        policy=args.policy,
+        settings=parse_settings(args.game, args.set),
+        max_ticks=args.max_ticks,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    if not args.per_episode:
+        del summary["episodes"]
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
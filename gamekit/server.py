@@ -0,0 +1,327 @@
+"""
+Host lots of Star Dodger games in one process, with asyncio.
+
+Every player (a real client over a socket, or a stand-in client for load
+testing) gets a Session: their own StarDodgerSim, the keys they are holding,
+an inbox of commands and an outbox of state updates. One scheduler task
+steps every session together, TICK_RATE times a second (through
+FixedTimestep, so a slow tick is caught up and the rest dropped), and the
+clients are asyncio tasks that only wake up when they have something to do.
+
+The protocol:
+
+- client -> server: one line of text per command, "K<bits>" for the arrow
+  keys held (left=1, right=2, up=4, down=8, so 0 to 15), "R" to restart
+  after game over (like SPACE). Anything else is dropped, and so is a line
+  that isn't UTF-8; a line longer than the stream limit (64 KiB) ends that
+  client's connection. Nothing a client sends can stop the other sessions.
+- server -> client: binary messages, each a 4-byte little-endian length
+  and then gamekit.snapshot bytes. The first is a full snapshot, the rest
+  deltas against the one before (about 30 bytes a tick while everything
+  just falls). Read them with snapshot.decode(data, previous).
+
+Both queues are bounded. A full inbox drops its oldest command (the newest
+keys are the ones that matter), and a client too slow to keep up with its
+outbox gets a fresh full snapshot instead of the deltas it missed.
+
+    python -m gamekit.server --serve --port 8765
+    python -m gamekit.server --load-test --clients 300 --seconds 10
+    python -m gamekit.server --load-test --socket --clients 50
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import struct
+import time
+
+from gamekit.replay import bits_to_keys
+from gamekit.sim_base import NO_KEYS
+from gamekit.snapshot import Snapshot, decode, encode_delta
+from gamekit.star_dodger_sim import StarDodgerSim
+from gamekit.timestep import FixedTimestep
+
+_FRAME = struct.Struct("<I")  # Length of each server -> client message
+
+
+class Session:
+    """One player's game, plus the queues that connect it to its client."""
+
+    def __init__(self, session_id, sim, outbox_size=8, inbox_size=16):
+        self.id = session_id
+        self.sim = sim
+        self.keys = NO_KEYS
+        self.inbox = asyncio.Queue(maxsize=inbox_size)  # Command lines from the client
+        self.outbox = asyncio.Queue(maxsize=outbox_size)  # Snapshot bytes to the client
+        self.dropped = 0  # Updates thrown away because the client fell behind
+        self.ignored = 0  # Commands thrown away (inbox full, or not a command)
+        self._sent = None  # The Snapshot the client will have after its outbox
+
+    def receive(self, command):
+        """Queue a command line from the client. A full inbox drops its oldest."""
+        inbox = self.inbox
+        if inbox.full():
+            inbox.get_nowait()
+            self.ignored += 1
+        inbox.put_nowait(command)
+
+    def handle(self, command):
+        """Apply one command line from the client (ValueError if it isn't one)."""
+        if command == "R":
+            if self.sim.game_over:
+                self.sim.reset()
+        elif command[:1] == "K" and command[1:].isdigit() and int(command[1:]) < 16:
+            self.keys = bits_to_keys(int(command[1:]))
+        else:
+            raise ValueError(f"Not a command: {command[:20]!r}")
+
+    def drain_inbox(self):
+        inbox = self.inbox
+        while not inbox.empty():
+            try:
+                self.handle(inbox.get_nowait())
+            except ValueError:
+                self.ignored += 1  # A bad line only costs its own session
+
+    def update(self):
+        """The next message: a delta since the last one (a full snapshot, first)."""
+        new = Snapshot.capture(self.sim)
+        old, self._sent = self._sent, new
+        return new.to_bytes() if old is None else encode_delta(old, new)
+
+    def publish(self):
+        """
+        Queue an update for the client. Deltas only work in order, so a full
+        outbox is emptied and replaced by one full snapshot.
+        """
+        outbox = self.outbox
+        if outbox.full():
+            while not outbox.empty():
+                outbox.get_nowait()
+                self.dropped += 1
+            self._sent = None
+        data = self.update()
+        outbox.put_nowait(data)
+        return len(data)
+
+
+class GameServer:
+    """Runs every Session on one shared fixed-tick scheduler."""
+
+    def __init__(self, settings=None, tick_rate=60, send_every=1, max_catch_up=5):
+        self.settings = settings
+        self.tick_rate = tick_rate
+        self.send_every = send_every  # Send a delta every N ticks (2 = 30 per second)
+        self.sessions = {}
+        self.ticks = 0
+        self.bytes_sent = 0
+        self.deltas_sent = 0
+        self.busy_seconds = 0.0  # Time spent inside tick()
+        self._next_id = 0
+        self.timestep = FixedTimestep(self.tick, tick_rate, max_catch_up)
+
+    def open_session(self, seed=None):
+        self._next_id += 1
+        if seed is None:
+            seed = random.randrange(2**31)
+        session = Session(self._next_id, StarDodgerSim(self.settings, seed=seed))
+        self.sessions[session.id] = session
+        return session
+
+    def close_session(self, session):
+        self.sessions.pop(session.id, None)
+
+    def tick(self):
+        """Advance every session by one tick, and send deltas when it's time."""
+        start = time.perf_counter()
+        self.ticks += 1
+        send = self.ticks % self.send_every == 0
+        for session in self.sessions.values():
+            session.drain_inbox()
+            session.sim.step(session.keys)
+            if send:
+                self.bytes_sent += session.publish()
+                self.deltas_sent += 1
+        self.busy_seconds += time.perf_counter() - start
+
+    async def run(self, seconds=None):
+        """The scheduler: tick at tick_rate until cancelled (or for `seconds`)."""
+        loop = asyncio.get_running_loop()
+        started = last = loop.time()
+        while seconds is None or last - started < seconds:
+            await asyncio.sleep(self.timestep.dt - self.timestep.accumulator)
+            now = loop.time()
+            self.timestep.advance(now - last)
+            last = now
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        """Accept socket clients; each connection gets its own session."""
+        return await asyncio.start_server(self._client_connected, host, port)
+
+    async def _client_connected(self, reader, writer):
+        session = self.open_session()
+        sender = asyncio.create_task(_send_lines(session.outbox, writer))
+        try:
+            while line := await reader.readline():
+                try:
+                    session.receive(line.decode().strip())
+                except UnicodeDecodeError:
+                    session.ignored += 1
+        except (ConnectionError, ValueError):
+            pass  # Gone, or a line over the stream limit: only this client ends
+        finally:
+            sender.cancel()
+            self.close_session(session)
+            writer.close()
+
+    def stats(self, seconds):
+        ticks = self.ticks
+        return {
+            "sessions": len(self.sessions),
+            "ticks": ticks,
+            "ticks_per_second": round(ticks / seconds, 1) if seconds else None,
+            "dropped_ticks": self.timestep.dropped,
+            "ms_per_tick": (
+                round(self.busy_seconds / ticks * 1000, 3) if ticks else None
+            ),
+            "us_per_session_tick": (
+                round(self.busy_seconds / ticks / len(self.sessions) * 1e6, 2)
+                if ticks and self.sessions
+                else None
+            ),
+            "deltas_sent": self.deltas_sent,
+            "bytes_per_delta": (
+                round(self.bytes_sent / self.deltas_sent, 1)
+                if self.deltas_sent
+                else None
+            ),
+            "outbox_dropped": sum(s.dropped for s in self.sessions.values()),
+            "commands_ignored": sum(s.ignored for s in self.sessions.values()),
+        }
+
+
+async def _send_lines(outbox, writer):
+    while True:
+        data = await outbox.get()
+        writer.write(_FRAME.pack(len(data)) + data)
+        await writer.drain()
+
+
+# --- stand-in clients for load testing ---
+
+
+class FakePlayer:
+    """Holds random keys for a while, and restarts when its game ends."""
+
+    def __init__(self, seed, hold=10):
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.updates = 0
+
+    def react(self, snapshot):
+        """Return the command lines to send after reading one update."""
+        self.updates += 1
+        commands = []
+        if snapshot.game_over:
+            commands.append("R")
+        if self.updates % self.hold == 0:
+            commands.append(f"K{self.rng.randrange(16)}")
+        return commands
+
+
+async def queue_client(session, seed):
+    """A client in the same process, talking straight to the session's queues."""
+    player = FakePlayer(seed)
+    snapshot = None
+    while True:
+        snapshot = decode(await session.outbox.get(), snapshot)
+        for command in player.react(snapshot):
+            session.receive(command)
+
+
+async def socket_client(host, port, seed):
+    """The same client, over a real local socket."""
+    reader, writer = await asyncio.open_connection(host, port)
+    player = FakePlayer(seed)
+    snapshot = None
+    try:
+        while True:
+            (size,) = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+            snapshot = decode(await reader.readexactly(size), snapshot)
+            for command in player.react(snapshot):
+                writer.write(command.encode() + b"\n")
+    except asyncio.IncompleteReadError:
+        pass  # The server hung up
+    finally:
+        writer.close()
+
+
+async def load_test(clients=100, seconds=5.0, use_socket=False, port=8765, **options):
+    """Run `clients` stand-in players for `seconds` and return the server stats."""
+    server = GameServer(**options)
+    tasks = []
+    if use_socket:
+        listener = await server.serve(port=port)
+        tasks = [
+            asyncio.create_task(socket_client("127.0.0.1", port, seed))
+            for seed in range(clients)
+        ]
+        while len(server.sessions) < clients:
+            await asyncio.sleep(0.01)
+    else:
+        listener = None
+        for seed in range(clients):
+            session = server.open_session(seed)
+            tasks.append(asyncio.create_task(queue_client(session, seed)))
+
+    start = time.perf_counter()
+    await server.run(seconds)
+    stats = server.stats(time.perf_counter() - start)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if listener is not None:
+        for _ in range(100):  # Give the server a moment to notice the hang-ups
+            if not server.sessions:
+                break
+            await asyncio.sleep(0.01)
+        listener.close()
+        await listener.wait_closed()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host many Star Dodger sessions")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--serve", action="store_true")
+    mode.add_argument("--load-test", action="store_true")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--socket", action="store_true", help="load test over TCP")
+    parser.add_argument("--tick-rate", type=int, default=60)
+    parser.add_argument("--send-every", type=int, default=1)
+    args = parser.parse_args(argv)
+    options = {"tick_rate": args.tick_rate, "send_every": args.send_every}
+
+    if args.load_test:
+        stats = asyncio.run(
+            load_test(args.clients, args.seconds, args.socket, args.port, **options)
+        )
+        print(json.dumps(stats, indent=2))
+        return
+
+    async def serve_forever():
+        server = GameServer(**options)
+        listener = await server.serve(port=args.port)
+        print(f"Serving Star Dodger on 127.0.0.1:{args.port}")
+        async with listener:
+            await server.run()
+
+    asyncio.run(serve_forever())
+
+
+if __name__ == "__main__":
+    main()
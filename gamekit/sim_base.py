@@ -0,0 +1,56 @@
+"""
+Pieces shared by the headless game simulations.
+
+- Keys: which arrow keys are held during one tick (the simulation's input).
+- Box: a tiny pygame-free rectangle with colliderect().
+- next_keys_for(): turns a "policy" (nothing, a list of Keys, or a
+  function) into a function that gives the Keys for the next tick.
+"""
+
+from collections import namedtuple
+
+Keys = namedtuple("Keys", "left right up down", defaults=(False, False, False, False))
+NO_KEYS = Keys()
+
+
+class Box:
+    """A tiny pygame-free rectangle (left/top corner plus size)."""
+
+    __slots__ = ("left", "top", "width", "height")
+
+    def __init__(self, left, top, width, height):
+        self.left, self.top, self.width, self.height = left, top, width, height
+
+    @property
+    def right(self):
+        return self.left + self.width
+
+    @property
+    def bottom(self):
+        return self.top + self.height
+
+    @property
+    def center(self):
+        return (self.left + self.width / 2, self.top + self.height / 2)
+
+    def colliderect(self, other):
+        return (
+            self.left < other.left + other.width
+            and other.left < self.left + self.width
+            and self.top < other.top + other.height
+            and other.top < self.top + self.height
+        )
+
+
+def next_keys_for(policy):
+    """
+    Return a function sim -> Keys for a policy, which can be None (no keys),
+    an iterable of Keys (a script or a recording — NO_KEYS once it runs out)
+    or a callable taking the sim and returning Keys.
+    """
+    if policy is None:
+        return lambda sim: NO_KEYS
+    if callable(policy):
+        return policy
+    script = iter(policy)
+    return lambda sim: next(script, NO_KEYS)
@@ -0,0 +1,282 @@
+"""
+Pack a Star Dodger game's state into a few bytes, and each tick's changes
+into even fewer.
+
+A Snapshot is everything you can see in one tick of a StarDodgerSim: tick,
+score, lives, the shield, the player and where every asteroid and bonus star
+is. to_bytes() gives it a fixed layout (little-endian):
+
+- a header struct: magic, version, tick, score, lives, flags, shield timer,
+  player left/top and how many asteroids and stars there are,
+- then four int16 columns, straight from array("h"): asteroid lefts,
+  asteroid tops, star lefts, star tops (the same "struct of arrays" layout
+  as AsteroidPool, so no per-object work is needed).
+
+Positions are stored in quarter pixels, which is exact for the game's
+speeds (3, 3.5, 4...). Sizes aren't stored: every asteroid is 30x30 and
+every star 20x20. The background stars never change, so they aren't here
+either.
+
+A delta between two snapshots is smaller still. Every asteroid falls by the
+same amount each tick, so each column stores its most common change (the
+"drift") and then only the objects that don't follow it: new ones, and the
+ones swapped into the gap when another was removed. A tick where everything
+just fell costs about 30 bytes, however many asteroids there are.
+
+    old = Snapshot.capture(sim)
+    sim.step(keys)
+    new = Snapshot.capture(sim)
+    data = encode_delta(old, new)
+    assert apply_delta(old, data) == new
+    assert decode(data, old) == decode(new.to_bytes()) == new
+"""
+
+import struct
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+
+from gamekit.asteroid_pool import np
+
+MAGIC = b"SDSS"
+VERSION = 2  # 2: lives is a signed 16-bit number
+FULL, DELTA = 0, 1
+SCALE = 4  # Positions are stored in 1/4 pixels
+
+_KIND = struct.Struct("<4sBB")  # magic, version, FULL or DELTA
+# tick, score, lives, flags, shield timer, player left/top, asteroid/star counts
+# (lives is signed: several hits in one tick can take it below zero)
+_STATE = struct.Struct("<IihBHhhHH")
+_FIELD = [struct.Struct("<" + code) for code in _STATE.format[1:]]
+_MASK = struct.Struct("<H")  # Which of the _STATE fields a delta carries
+_COLUMN = struct.Struct("<hH")  # drift, number of exceptions
+_COLUMNS = ("asteroid_lefts", "asteroid_tops", "star_lefts", "star_tops")
+_SWAP = sys.byteorder != "little"  # array() uses the machine's byte order
+
+
+def _column(values=(), typecode="h"):
+    return array(typecode, values)
+
+
+def _to_bytes(column):
+    if _SWAP:
+        column = _column(column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_bytes(view, count, offset, typecode="h"):
+    column = _column(typecode=typecode)
+    end = offset + 2 * count
+    column.frombytes(view[offset:end])
+    if _SWAP:
+        column.byteswap()
+    return column, end
+
+
+def _fixed(value):
+    return round(value * SCALE)
+
+
+def _fixed_column(values):
+    """A pool column (NumPy or array("d")) in quarter pixels."""
+    if np is not None:
+        column = _column()
+        column.frombytes(np.rint(values * SCALE).astype(np.int16).tobytes())
+        return column
+    return _column(_fixed(v) for v in values)
+
+
+@dataclass
+class Snapshot:
+    """The visible state of one tick, with positions in quarter pixels."""
+
+    tick: int = 0
+    score: int = 0
+    lives: int = 0
+    invincible: bool = False
+    game_over: bool = False
+    invincible_timer: int = 0
+    player_left: int = 0
+    player_top: int = 0
+    asteroid_lefts: array = field(default_factory=_column)
+    asteroid_tops: array = field(default_factory=_column)
+    star_lefts: array = field(default_factory=_column)
+    star_tops: array = field(default_factory=_column)
+
+    @classmethod
+    def capture(cls, sim):
+        """Take a snapshot of a StarDodgerSim."""
+        columns = []
+        for pool in (sim.asteroids, sim.bonus_stars):
+            n = len(pool)
+            columns.append(_fixed_column(pool.left[:n]))
+            columns.append(_fixed_column(pool.top[:n]))
+        return cls(
+            sim.tick,
+            sim.score,
+            sim.lives,
+            sim.invincible,
+            sim.game_over,
+            min(sim.invincible_timer, 0xFFFF),
+            _fixed(sim.player.left),
+            _fixed(sim.player.top),
+            *columns,
+        )
+
+    def restore(self, sim):
+        """
+        Put this state back into a StarDodgerSim. The random number generator
+        isn't part of a snapshot, so use a replay to continue a game exactly.
+        """
+        sim.tick = self.tick
+        sim.score = self.score
+        sim.lives = self.lives
+        sim.invincible = self.invincible
+        sim.game_over = self.game_over
+        sim.invincible_timer = self.invincible_timer
+        sim.start_timers()
+        sim.player.left = self.player_left / SCALE
+        sim.player.top = self.player_top / SCALE
+        for pool, lefts, tops, size in (
+            (sim.asteroids, self.asteroid_lefts, self.asteroid_tops, 30),
+            (sim.bonus_stars, self.star_lefts, self.star_tops, 20),
+        ):
+            pool.clear()
+            for left, top in zip(lefts, tops):
+                pool.spawn(left / SCALE, top / SCALE, size, size)
+
+    def scalars(self):
+        flags = self.invincible | self.game_over << 1
+        return (
+            self.tick,
+            self.score,
+            self.lives,
+            flags,
+            self.invincible_timer,
+            self.player_left,
+            self.player_top,
+            len(self.asteroid_lefts),
+            len(self.star_lefts),
+        )
+
+    def columns(self):
+        return [getattr(self, name) for name in _COLUMNS]
+
+    def to_bytes(self):
+        parts = [_KIND.pack(MAGIC, VERSION, FULL), _STATE.pack(*self.scalars())]
+        parts.extend(_to_bytes(column) for column in self.columns())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        view = memoryview(data)
+        _check(view, FULL)
+        offset = _KIND.size
+        state = _STATE.unpack_from(view, offset)
+        offset += _STATE.size
+        asteroids, stars = state[-2:]
+        columns = []
+        for count in (asteroids, asteroids, stars, stars):
+            column, offset = _from_bytes(view, count, offset)
+            columns.append(column)
+        return cls._from_scalars(state, columns)
+
+    @classmethod
+    def _from_scalars(cls, state, columns):
+        tick, score, lives, flags, timer, left, top = state[:7]
+        return cls(
+            tick,
+            score,
+            lives,
+            bool(flags & 1),
+            bool(flags & 2),
+            timer,
+            left,
+            top,
+            *columns,
+        )
+
+
+def _check(view, kind):
+    magic, version, found = _KIND.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a Star Dodger snapshot")
+    if version != VERSION:
+        raise ValueError(f"Snapshot version {version} isn't supported")
+    if found != kind:
+        raise ValueError(
+            "Expected a full snapshot" if kind == FULL else "Expected a delta"
+        )
+
+
+def encode_delta(old, new):
+    """The bytes that turn snapshot `old` into snapshot `new`."""
+    old_state, new_state = old.scalars(), new.scalars()
+    mask = 0
+    changed = []
+    for bit, (fmt, was, now) in enumerate(zip(_FIELD, old_state, new_state)):
+        if was != now:
+            mask |= 1 << bit
+            changed.append(fmt.pack(now))
+    parts = [_KIND.pack(MAGIC, VERSION, DELTA), _MASK.pack(mask), *changed]
+
+    for was, now in zip(old.columns(), new.columns()):
+        shared = min(len(was), len(now))
+        steps = Counter(now[i] - was[i] for i in range(shared))
+        drift = steps.most_common(1)[0][0] if steps else 0
+        if not -0x8000 <= drift <= 0x7FFF:
+            drift = 0
+        indices = _column(typecode="H")
+        values = _column()
+        for i, value in enumerate(now):
+            if i >= shared or value - was[i] != drift:
+                indices.append(i)
+                values.append(value)
+        parts.append(_COLUMN.pack(drift, len(indices)))
+        parts.append(_to_bytes(indices))
+        parts.append(_to_bytes(values))
+    return b"".join(parts)
+
+
+def apply_delta(old, data):
+    """Return a new Snapshot: `old` with the delta `data` applied."""
+    view = memoryview(data)
+    _check(view, DELTA)
+    offset = _KIND.size
+    (mask,) = _MASK.unpack_from(view, offset)
+    offset += _MASK.size
+    state = list(old.scalars())
+    for bit, fmt in enumerate(_FIELD):
+        if mask & (1 << bit):
+            (state[bit],) = fmt.unpack_from(view, offset)
+            offset += fmt.size
+
+    asteroids, stars = state[-2:]
+    columns = []
+    for was, count in zip(old.columns(), (asteroids, asteroids, stars, stars)):
+        drift, exceptions = _COLUMN.unpack_from(view, offset)
+        offset += _COLUMN.size
+        indices, offset = _from_bytes(view, exceptions, offset, "H")
+        values, offset = _from_bytes(view, exceptions, offset)
+        shared = min(len(was), count)
+        if drift:
+            column = _column(v + drift for v in was[:shared])
+        else:
+            column = was[:shared]
+        column.extend([0] * (count - shared))  # New objects: all exceptions
+        for i, value in zip(indices, values):
+            column[i] = value
+        columns.append(column)
+    return Snapshot._from_scalars(state, columns)
+
+
+def decode(data, old=None):
+    """Read either kind of message: a full snapshot, or a delta on top of old."""
+    view = memoryview(data)
+    if len(view) >= _KIND.size and view[_KIND.size - 1] == DELTA:
+        if old is None:
+            raise ValueError("A delta needs the snapshot it was made from")
+        return apply_delta(old, view)
+    return Snapshot.from_bytes(view)
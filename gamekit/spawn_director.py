@@ -0,0 +1,259 @@
+"""
+Plan spawns ahead of time, a whole wave at a time.
+
+spawn_asteroid() asks the random number generator for one x position every
+time it runs, on a fixed 1.5 second timer. That's fine for one asteroid at
+a time, but a dense wave (30 asteroids in a second, in a line, or sweeping
+across the screen) would mean lots of little calls right in the middle of
+update().
+
+A SpawnDirector works out a whole wave in one go instead: every spawn's
+tick, x position and kind (asteroid or bonus star), made with a few array
+operations and stored in a ring buffer. In update() spawning is then
+just taking the events that are due off the front of the buffer.
+
+Waves follow each other in a loop. How fast and how dense they are comes
+from a DifficultyCurve, given the same score get_asteroid_speed() uses
+(read when each wave is planned, so it can lag one wave behind).
+
+The speed is global, not per asteroid: director.speed is the speed of the
+wave that's running now, and everything on screen falls at it. So when a
+fast wave starts, the asteroids left over from the last wave speed up too.
+(The pool, the broadphase grid and the vector env all move every asteroid
+by the same amount at once, and the grid keeps its list oldest first
+because of it.)
+
+    director = SpawnDirector([Wave(), Wave(burst=5, pattern="line")], seed=1)
+    for x, kind in director.advance(score):  # once per update()
+        ...
+    speed = director.speed
+
+NumPy is used when it is installed, otherwise the standard library (same
+behaviour, but different random numbers for the same seed).
+"""
+
+import math
+import random
+from array import array
+from dataclasses import dataclass
+
+from gamekit.asteroid_pool import np
+
+ASTEROID, STAR = 0, 1  # How kinds are stored in the buffer
+KINDS = ("asteroid", "star")  # ...and what advance() calls them
+PATTERNS = ("random", "line", "sweep")
+
+
+@dataclass
+class Wave:
+    """One stretch of spawning. Times are in seconds."""
+
+    duration: float = 10.0  # How long the wave lasts
+    every: float = 1.5  # Time between spawns (before the difficulty curve)
+    burst: int = 1  # Objects per spawn
+    pattern: str = "random"  # "random" x, a "line" across, or a "sweep" side to side
+    speed: float = 1.0  # Times the curve's speed while it runs (1.5 = a fast wave)
+    star_every: float = 0  # Also drop a bonus star this often (0 = no stars)
+
+
+@dataclass
+class DifficultyCurve:
+    """
+    Speed and spawn gaps for a score. The defaults are get_asteroid_speed()
+    with USE_INCREASING_DIFFICULTY on.
+    """
+
+    base_speed: float = 3
+    step_every: int = 10  # Every this many points...
+    speed_step: float = 0.5  # ...asteroids get this much faster...
+    max_speed: float = 10  # ...but never faster than this
+    gap_step: float = 0.0  # ...and gaps between spawns this much shorter (0.1 = 10%)
+    min_gap: float = 0.1  # Seconds
+
+    def speed(self, score):
+        steps = score // self.step_every
+        return min(self.base_speed + steps * self.speed_step, self.max_speed)
+
+    def gap(self, every, score):
+        steps = score // self.step_every
+        return max(self.min_gap, every * (1 - self.gap_step) ** steps)
+
+
+class SpawnDirector:
+    """
+    Plans waves of spawn events and hands them out as they come due.
+
+    advance(score) moves on one tick and returns the due events as
+    (x, kind) tuples, where kind is "asteroid" or "star". The speed
+    attribute is the speed of the wave that's running now, for everything
+    that's falling.
+    """
+
+    COLUMNS = (("ticks", "q"), ("xs", "d"), ("kinds", "b"))
+
+    def __init__(
+        self, waves, width=800, tick_rate=60, seed=None, curve=None, margin=30
+    ):
+        for wave in waves:
+            if wave.pattern not in PATTERNS:
+                raise ValueError(f"Unknown wave pattern {wave.pattern!r}")
+        self.waves = list(waves)
+        self.width = width
+        self.tick_rate = tick_rate
+        self.curve = curve if curve is not None else DifficultyCurve()
+        self.margin = margin  # Keep spawns this far from the edges
+        self.rng = (
+            np.random.default_rng(seed) if np is not None else random.Random(seed)
+        )
+        self.now = 0  # Ticks so far
+        self.speed = self.curve.speed(0)
+        self.planned = 0  # Events planned so far
+        self.waves_planned = 0
+        self._wave_start = 0  # Tick the next planned wave starts on
+        self._head = 0  # Ring buffer: index of the next event...
+        self._size = 0  # ...and how many are waiting
+        self._capacity = 0
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, self._new_column(typecode, 0))
+        self._grow(256)
+
+    def __len__(self):
+        return self._size
+
+    def advance(self, score=0):
+        """Move on one tick and return the events due now."""
+        self.now += 1
+        while self._wave_start <= self.now:
+            self.plan_wave(score)  # A wave starts: plan the whole of it
+        if self._size == 0 or self.ticks[self._head] > self.now:
+            return ()
+        due = []
+        head, capacity = self._head, self._capacity
+        ticks, xs, kinds = self.ticks, self.xs, self.kinds
+        while self._size and ticks[head] <= self.now:
+            due.append((float(xs[head]), KINDS[kinds[head]]))
+            head = (head + 1) % capacity
+            self._size -= 1
+        self._head = head
+        return due
+
+    def reset(self):
+        """Forget every planned event and start again from the first wave."""
+        self.now = 0
+        self.speed = self.curve.speed(0)
+        self._wave_start = 0
+        self.waves_planned = 0
+        self._head = self._size = 0
+
+    # --- planning ---
+
+    def plan_wave(self, score=0):
+        """Plan the next wave in the loop and add its events to the buffer."""
+        wave = self.waves[self.waves_planned % len(self.waves)]
+        self.waves_planned += 1
+        start, rate = self._wave_start, self.tick_rate
+        length = max(1, round(wave.duration * rate))
+        self._wave_start = start + length
+        self.speed = self.curve.speed(score) * wave.speed  # From now on
+
+        gap = self.curve.gap(wave.every, score)
+        spawns = max(1, math.floor(wave.duration / gap))
+        events = self._asteroids(wave, start, rate, gap, spawns)
+        if wave.star_every > 0:
+            events = self._merge(events, self._stars(wave, start, rate))
+        self._push(*events)
+
+    def _asteroids(self, wave, start, rate, gap, spawns):
+        lo, hi = self.margin, self.width - self.margin
+        burst = wave.burst
+        total = spawns * burst
+        step = (hi - lo) / (burst + 1)  # For "line": the space between objects
+        if np is not None:
+            rng = self.rng
+            ticks = np.rint(np.arange(1, spawns + 1) * gap * rate).astype(np.int64)
+            ticks = np.repeat(start + ticks, burst)
+            if wave.pattern == "random":
+                xs = rng.integers(lo, hi + 1, size=total).astype(np.float64)
+            elif wave.pattern == "line":
+                jitter = rng.uniform(-0.5, 0.5, size=spawns) * step
+                xs = (lo + step * np.arange(1, burst + 1) + jitter[:, None]).ravel()
+            else:  # sweep: back and forth across the screen
+                phase = np.arange(total) / max(1, total - 1)
+                xs = lo + (hi - lo) * (1 - np.cos(phase * 2 * np.pi)) / 2
+            return ticks, xs, np.full(total, ASTEROID, dtype=np.int8)
+        rng = self.rng
+        ticks, xs = [], []
+        for k in range(spawns):
+            tick = start + round((k + 1) * gap * rate)
+            ticks.extend([tick] * burst)
+            if wave.pattern == "random":
+                xs.extend(float(rng.randint(lo, hi)) for _ in range(burst))
+            elif wave.pattern == "line":
+                jitter = rng.uniform(-0.5, 0.5) * step
+                xs.extend(lo + step * (i + 1) + jitter for i in range(burst))
+        if wave.pattern == "sweep":
+            xs = [
+                lo + (hi - lo) * (1 - math.cos(i / max(1, total - 1) * 2 * math.pi)) / 2
+                for i in range(total)
+            ]
+        return ticks, xs, [ASTEROID] * total
+
+    def _stars(self, wave, start, rate):
+        count = max(1, math.floor(wave.duration / wave.star_every))
+        lo, hi = self.margin, self.width - self.margin
+        every = wave.star_every * rate  # In ticks
+        if np is not None:
+            ticks = start + np.rint(np.arange(1, count + 1) * every).astype(np.int64)
+            xs = self.rng.integers(lo, hi + 1, size=count).astype(np.float64)
+            return ticks, xs, np.full(count, STAR, dtype=np.int8)
+        ticks = [start + round((k + 1) * every) for k in range(count)]
+        xs = [float(self.rng.randint(lo, hi)) for _ in range(count)]
+        return ticks, xs, [STAR] * count
+
+    def _merge(self, first, second):
+        """Put two sets of events in tick order (first's events win ties)."""
+        if np is not None:
+            ticks = np.concatenate((first[0], second[0]))
+            order = np.argsort(ticks, kind="stable")
+            return tuple(np.concatenate(pair)[order] for pair in zip(first, second))
+        events = sorted(
+            [(t, 0, i, x, k) for i, (t, x, k) in enumerate(zip(*first))]
+            + [(t, 1, i, x, k) for i, (t, x, k) in enumerate(zip(*second))]
+        )
+        return [e[0] for e in events], [e[3] for e in events], [e[4] for e in events]
+
+    # --- the ring buffer ---
+
+    def _push(self, ticks, xs, kinds):
+        n = len(ticks)
+        if self._size + n > self._capacity:
+            self._grow(max(self._capacity * 2, self._size + n))
+        self.planned += n
+        start = (self._head + self._size) % self._capacity
+        if np is not None:
+            where = (start + np.arange(n)) % self._capacity
+            self.ticks[where] = ticks
+            self.xs[where] = xs
+            self.kinds[where] = kinds
+        else:
+            for i in range(n):
+                j = (start + i) % self._capacity
+                self.ticks[j], self.xs[j], self.kinds[j] = ticks[i], xs[i], kinds[i]
+        self._size += n
+
+    def _new_column(self, typecode, size):
+        if np is not None:
+            return np.zeros(size, dtype=np.dtype(typecode))
+        return array(typecode, bytes(array(typecode).itemsize * size))
+
+    def _grow(self, capacity):
+        """Make the buffer bigger, unrolling the waiting events to the front."""
+        order = [(self._head + i) % max(1, self._capacity) for i in range(self._size)]
+        for name, typecode in self.COLUMNS:
+            old = getattr(self, name)
+            column = self._new_column(typecode, capacity)
+            for i, j in enumerate(order):
+                column[i] = old[j]
+            setattr(self, name, column)
+        self._head = 0
+        self._capacity = capacity
@@ -0,0 +1,451 @@
+"""
+Star Dodger as a training environment for automated players.
+
+reset(seed) starts a game and returns (observation, info); step(action)
+plays one tick and returns (observation, reward, terminated, truncated,
+info). That's the same shape as a Gymnasium environment, so training code
+written for one works with these (Gymnasium itself isn't needed).
+
+- StarDodgerEnv plays one game, using StarDodgerSim (the exact rules).
+- VectorStarDodgerEnv plays n games in lockstep. Instead of n sims, it
+  keeps every game's player, asteroids and counters in NumPy arrays and
+  moves the whole batch with a few array operations per tick, so a plain
+  CPU plays millions of ticks a minute. A game that ends is started again
+  straight away.
+
+An action is a number from 0 to 8 (see ACTIONS): stay still, one of the
+four arrow keys, or two of them at once (a diagonal).
+
+An observation is a float32 array of 4 + 3 * k numbers:
+
+- the player's center x and y, as fractions of the screen width and height,
+- lives and score,
+- for each of the k asteroids nearest the player (nearest first): how far
+  away it is in x and y (again as fractions of the screen) and 1.0, or
+  three zeros when fewer than k asteroids are on screen.
+
+The reward is the points scored in the tick, minus hit_penalty for each
+life lost. NumPy is required.
+
+    python -m gamekit.star_dodger_env --envs 1024 --steps 2000
+"""
+
+import argparse
+import json
+import math
+import time
+
+from gamekit.asteroid_pool import np, round_like_rect
+from gamekit.rollout import parse_settings
+from gamekit.sim_base import Keys
+from gamekit.star_dodger_sim import Settings, StarDodgerSim
+
+# Action number -> (x, y) direction, -1, 0 or 1 (y is down the screen)
+ACTIONS = (
+    (0, 0),
+    (-1, 0),
+    (1, 0),
+    (0, -1),
+    (0, 1),
+    (-1, -1),
+    (1, -1),
+    (-1, 1),
+    (1, 1),
+)
+ACTION_KEYS = tuple(Keys(x < 0, x > 0, y < 0, y > 0) for x, y in ACTIONS)
+
+PLAYER_SIZE = (40, 50)  # Shapes-mode sizes, as in StarDodgerSim
+ASTEROID_SIZE = 30
+STAR_SIZE = 20
+
+
+def observation_size(k):
+    return 4 + 3 * k
+
+
+def _need_numpy():
+    if np is None:
+        raise ImportError("The training environments need NumPy: pip install numpy")
+
+
+def _observations(settings, k, px, py, lives, score, ax, ay, alive):
+    """
+    Observations for a batch of games: px, py, lives and score have one
+    number per game, ax, ay (asteroid centers) and alive one row per game.
+    """
+    count = len(px)
+    width, height = settings.width, settings.height
+    obs = np.zeros((count, observation_size(k)), dtype=np.float32)
+    obs[:, 0] = px / width
+    obs[:, 1] = py / height
+    obs[:, 2] = lives
+    obs[:, 3] = score
+    take = min(k, ax.shape[1])
+    if take == 0:
+        return obs
+    dx = ax - px[:, None]
+    dy = ay - py[:, None]
+    distance = np.where(alive, dx * dx + dy * dy, np.inf)
+    if take < distance.shape[1]:  # Only sort the k nearest
+        nearest = np.argpartition(distance, take - 1, axis=1)[:, :take]
+        order = np.take_along_axis(distance, nearest, axis=1).argsort(axis=1)
+        nearest = np.take_along_axis(nearest, order, axis=1)
+    else:
+        nearest = distance.argsort(axis=1)
+    present = np.take_along_axis(alive, nearest, axis=1)
+    end = 4 + 3 * take
+    obs[:, 4:end:3] = np.where(present, np.take_along_axis(dx, nearest, 1), 0) / width
+    obs[:, 5:end:3] = np.where(present, np.take_along_axis(dy, nearest, 1), 0) / height
+    obs[:, 6:end:3] = present
+    return obs
+
+
+class StarDodgerEnv:
+    """One game of Star Dodger, as a training environment."""
+
+    def __init__(self, settings=None, k=8, hit_penalty=10.0, max_ticks=None):
+        _need_numpy()
+        self.sim = StarDodgerSim(settings)
+        self.settings = self.sim.settings
+        self.k = k  # Nearest asteroids in each observation
+        self.hit_penalty = hit_penalty
+        self.max_ticks = max_ticks  # Cut games off (truncated) after this many ticks
+        self.observation_size = observation_size(k)
+        self.action_count = len(ACTIONS)
+
+    def reset(self, seed=None):
+        """Start a new game. A seed makes it repeatable."""
+        self.sim.reset(seed)
+        return self.observe(), self._info()
+
+    def step(self, action):
+        """Play one tick holding the keys for action (a number, or a Keys)."""
+        sim = self.sim
+        if sim.game_over:
+            raise RuntimeError("The game is over: call reset() first")
+        keys = action if isinstance(action, Keys) else ACTION_KEYS[action]
+        score, lives = sim.score, sim.lives
+        sim.step(keys)
+        reward = (sim.score - score) - self.hit_penalty * (lives - sim.lives)
+        terminated = sim.game_over
+        truncated = (
+            not terminated and self.max_ticks is not None and sim.tick >= self.max_ticks
+        )
+        return self.observe(), float(reward), terminated, truncated, self._info()
+
+    def observe(self):
+        sim = self.sim
+        pool, player = sim.asteroids, sim.player
+        n = len(pool)
+        return _observations(
+            self.settings,
+            self.k,
+            np.array([player.left + player.width / 2]),
+            np.array([player.top + player.height / 2]),
+            sim.lives,
+            sim.score,
+            (pool.left[:n] + pool.width[:n] / 2)[None],
+            (pool.top[:n] + pool.height[:n] / 2)[None],
+            np.ones((1, n), dtype=bool),
+        )[0]
+
+    def _info(self):
+        sim = self.sim
+        return {"tick": sim.tick, "hits": sim.hits, "dodges": sim.dodges}
+
+
+class VectorStarDodgerEnv:
+    """
+    n games of Star Dodger played in lockstep.
+
+    step() takes n actions and returns n of everything else. A game that
+    ends is restarted, so its observation is the new game's first one;
+    info has "score", "lives" and "tick" for every game as it was at the
+    end of the step (before any restart), and "final_observation" when a
+    game ended.
+
+    The rules are StarDodgerSim's (the random numbers differ). With
+    invincibility on, the sim's first touching asteroid is the one that
+    hits; here it is the oldest one.
+    """
+
+    def __init__(
+        self, n, settings=None, k=8, hit_penalty=10.0, max_ticks=None, seed=None
+    ):
+        _need_numpy()
+        s = self.settings = settings if settings is not None else Settings()
+        self.n = n
+        self.k = k
+        self.hit_penalty = hit_penalty
+        self.max_ticks = max_ticks
+        self.observation_size = observation_size(k)
+        self.action_count = len(ACTIONS)
+        self._dx = np.array([x for x, _ in ACTIONS], dtype=np.float64)
+        self._dy = np.array([y for _, y in ACTIONS], dtype=np.float64)
+        self.asteroid_every = self._ticks(s.asteroid_interval)
+        self.star_every = self._ticks(s.star_interval)
+        self.shield_ticks = self._ticks(s.shield_time)
+        # Every object in a game falls at the same speed, so they leave in
+        # the order they arrived, and each game only ever needs a few slots
+        # (used round and round, like a ring buffer)
+        asteroid_slots = self._slots(
+            s.height + 50, s.asteroid_speed, self.asteroid_every
+        )
+        star_slots = self._slots(s.height + 40, s.star_speed, self.star_every)
+        self.player_left = np.zeros(n)
+        self.player_top = np.zeros(n)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.tick = np.zeros(n, dtype=np.int64)
+        self.hits = np.zeros(n, dtype=np.int64)
+        self.dodges = np.zeros(n, dtype=np.int64)
+        self.invincible = np.zeros(n, dtype=bool)
+        self.invincible_timer = np.zeros(n, dtype=np.int64)
+        self.asteroids = _Falling(n, asteroid_slots)
+        self.stars = _Falling(n, star_slots if s.bonus_stars else 0)
+        self.rng = np.random.default_rng(seed)
+        self.episodes = 0  # Games finished so far
+        self.reset()
+
+    def __len__(self):
+        return self.n
+
+    def reset(self, seed=None):
+        """Start all n games again. A seed makes them repeatable."""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self._restart(np.ones(self.n, dtype=bool))
+        return self.observe(), self._info()
+
+    def step(self, actions):
+        """Play one tick of every game; actions holds one action per game."""
+        s = self.settings
+        actions = np.asarray(actions)
+        score, lives = self.score.copy(), self.lives.copy()
+        self.tick += 1
+
+        # The sim's timers: the shield runs out, then the spawns
+        ending = self.invincible & (self.invincible_timer + 1 >= self.shield_ticks)
+        self.invincible &= ~ending
+        self._spawn(self.asteroids, self.asteroid_every, ASTEROID_SIZE)
+        if s.bonus_stars:
+            self._spawn(self.stars, self.star_every, STAR_SIZE)
+
+        width, height = PLAYER_SIZE
+        self.player_left += self._dx[actions] * s.player_speed
+        self.player_top += self._dy[actions] * s.player_speed
+        np.clip(self.player_left, 0, s.width - width, out=self.player_left)
+        np.clip(self.player_top, s.height // 2, s.height - height, out=self.player_top)
+        self.invincible_timer += self.invincible
+
+        self._update_asteroids()
+        if s.bonus_stars:
+            self._update_stars()
+
+        reward = (self.score - score) - self.hit_penalty * (lives - self.lives)
+        terminated = self.lives <= 0
+        if self.max_ticks is not None:
+            truncated = ~terminated & (self.tick >= self.max_ticks)
+        else:
+            truncated = np.zeros(self.n, dtype=bool)
+        obs, info = self.observe(), self._info()
+        done = terminated | truncated
+        if done.any():
+            info["final_observation"] = obs.copy()
+            self.episodes += int(done.sum())
+            self._restart(done)
+            obs[done] = self.observe(done)
+        return obs, reward, terminated, truncated, info
+
+    def observe(self, rows=slice(None)):
+        """The observations of every game (or of the games picked by rows)."""
+        asteroids, half = self.asteroids, ASTEROID_SIZE / 2
+        width, height = PLAYER_SIZE
+        return _observations(
+            self.settings,
+            self.k,
+            self.player_left[rows] + width / 2,
+            self.player_top[rows] + height / 2,
+            self.lives[rows],
+            self.score[rows],
+            asteroids.left[rows] + half,
+            asteroids.top[rows] + half,
+            asteroids.alive[rows],
+        )
+
+    # --- the rules, for every game at once ---
+
+    def _spawn(self, falling, every, size):
+        rows = np.flatnonzero(self.tick % every == 0)
+        if len(rows) == 0:
+            return
+        s = self.settings
+        x = self.rng.integers(30, s.width - 30, size=len(rows), endpoint=True)
+        falling.add(rows, x - size // 2, -20)
+
+    def _asteroid_speed(self):
+        s = self.settings
+        if not s.increasing_difficulty:
+            return s.asteroid_speed
+        extra_speed = (self.score // s.speedup_every) * s.speedup_step
+        return np.minimum(s.asteroid_speed + extra_speed, s.max_speed)[:, None]
+
+    def _update_asteroids(self):
+        s, asteroids = self.settings, self.asteroids
+        asteroids.top += self._asteroid_speed()
+        round_like_rect(asteroids.top)  # Whole pixels, like the sim's Rects
+        dodged, touching = asteroids.collide(self, s.height + 30, ASTEROID_SIZE)
+        if s.invincibility:  # Only the first touching asteroid hits (then the shield)
+            rows = np.flatnonzero(touching.any(axis=1) & ~self.invincible)
+            hits = np.zeros_like(touching)
+            hits[rows, asteroids.oldest(touching[rows], rows)] = True
+        else:
+            hits = touching & ~self.invincible[:, None]
+        dodge_count, hit_count = dodged.sum(axis=1), hits.sum(axis=1)
+        self.score += dodge_count
+        self.dodges += dodge_count
+        self.lives -= hit_count
+        self.hits += hit_count
+        if s.invincibility:
+            shielded = (hit_count > 0) & (self.lives > 0)
+            self.invincible |= shielded
+            self.invincible_timer[shielded] = 0
+        asteroids.alive &= ~(dodged | hits)
+
+    def _update_stars(self):
+        s, stars = self.settings, self.stars
+        stars.top += s.star_speed
+        round_like_rect(stars.top)
+        fallen, collected = stars.collide(self, s.height + 20, STAR_SIZE)
+        self.score += 5 * collected.sum(axis=1)
+        stars.alive &= ~(fallen | collected)
+
+    def _restart(self, rows):
+        s = self.settings
+        width, height = PLAYER_SIZE
+        self.player_left[rows] = s.width // 2 - width // 2
+        self.player_top[rows] = s.height - height - 20
+        self.score[rows] = 0
+        self.lives[rows] = s.lives
+        self.tick[rows] = 0
+        self.hits[rows] = 0
+        self.dodges[rows] = 0
+        self.invincible[rows] = False
+        self.invincible_timer[rows] = 0
+        self.asteroids.clear(rows)
+        self.stars.clear(rows)
+
+    def _info(self):
+        return {
+            "score": self.score.copy(),
+            "lives": self.lives.copy(),
+            "tick": self.tick.copy(),
+        }
+
+    def _ticks(self, seconds):
+        return max(1, round(seconds * self.settings.tick_rate))
+
+    @staticmethod
+    def _slots(distance, speed, every):
+        """The most objects of one kind a game can have on screen at once."""
+        ticks_alive = math.floor(distance / speed) + 1  # From spawn to falling off
+        return math.ceil(ticks_alive / every) + 1
+
+
+class _Falling:
+    """Square falling objects for n games: n rows of `slots` columns."""
+
+    def __init__(self, n, slots):
+        self.slots = slots
+        self.left = np.zeros((n, slots))
+        self.top = np.zeros((n, slots))
+        self.alive = np.zeros((n, slots), dtype=bool)
+        self.spawned = np.zeros(n, dtype=np.int64)  # Also: the next slot to use
+
+    def add(self, rows, lefts, top):
+        slot = self.spawned[rows] % self.slots
+        self.left[rows, slot] = lefts
+        self.top[rows, slot] = top
+        self.alive[rows, slot] = True
+        self.spawned[rows] += 1
+
+    def clear(self, rows):
+        self.alive[rows] = False
+        self.spawned[rows] = 0
+
+    def collide(self, env, limit, size):
+        """Like AsteroidPool.collide(), for every game: (off, touching) masks."""
+        width, height = PLAYER_SIZE
+        left, top, alive = self.left, self.top, self.alive
+        player_left = env.player_left[:, None]
+        player_top = env.player_top[:, None]
+        off = alive & (top > limit)
+        touching = (
+            alive
+            & ~off
+            & (left < player_left + width)
+            & (left + size > player_left)
+            & (top < player_top + height)
+            & (top + size > player_top)
+        )
+        return off, touching
+
+    def oldest(self, mask, rows):
+        """For each of rows, the slot of the oldest object picked by mask."""
+        age = (np.arange(self.slots) - self.spawned[rows, None]) % self.slots
+        return np.where(mask, age, self.slots).argmin(axis=1)
+
+
+def throughput(envs=1024, steps=2000, settings=None, seed=0):
+    """Play random actions and report how many game ticks per second that is."""
+    rng = np.random.default_rng(seed)
+    if envs:
+        env = VectorStarDodgerEnv(envs, settings, seed=seed)
+        env.reset(seed)
+        start = time.perf_counter()
+        for _ in range(steps):
+            env.step(rng.integers(0, env.action_count, size=envs))
+        elapsed = time.perf_counter() - start
+        total, episodes = envs * steps, env.episodes
+    else:
+        env = StarDodgerEnv(settings)
+        env.reset(seed)
+        episodes = 0
+        start = time.perf_counter()
+        for action in rng.integers(0, env.action_count, size=steps).tolist():
+            if env.step(action)[2]:
+                episodes += 1
+                env.reset()
+        elapsed = time.perf_counter() - start
+        total = steps
+    return {
+        "envs": envs,
+        "steps": total,
+        "episodes": episodes,
+        "seconds": round(elapsed, 3),
+        "steps_per_second": round(total / elapsed),
+        "steps_per_minute": round(60 * total / elapsed),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--envs", type=int, default=1024, help="games in lockstep (0 = StarDodgerEnv)"
+    )
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="change a setting",
+    )
+    args = parser.parse_args(argv)
+    settings = parse_settings("star_dodger", args.set)
+    print(json.dumps(throughput(args.envs, args.steps, settings, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Headless, deterministic Star Dodger.
+
+week02/star_dodger.py keeps its state in module globals, reads the live
+keyboard, and gets its timing from pgzero's clock. That's perfect for
+learning, but it can't run without a window, and no two runs are alike.
+
+StarDodgerSim holds the same rules as an object:
+
+- it steps with a fixed tick (60 per second by default), so timers like
+  "spawn an asteroid every 1.5 seconds" become tick counts on a TimerWheel,
+- all randomness comes from its own seeded random.Random,
+- input is passed in each step as a Keys tuple (scripted, recorded or live),
+- nothing here imports pygame or opens a window.
+
+The same seed and the same inputs always give the same game, so thousands
+of games can be played per second for balancing and regression checks.
+The shapes-mode geometry of star_dodger.py is used (Rect top-left corners,
+in whole pixels: a Rect rounds `y += 3.5`, and so do the sim's pools).
+The rules are a copy, so tests/test_star_dodger_parity.py plays star_dodger.py
+and a sim side by side with the same inputs and checks they stay in step.
+"""
+
+import random
+from dataclasses import dataclass
+
+from gamekit.asteroid_pool import AsteroidPool
+from gamekit.sim_base import NO_KEYS, Box, Keys, next_keys_for
+from gamekit.timer_wheel import TimerWheel
+
+__all__ = ["Box", "Keys", "NO_KEYS", "Settings", "StarDodgerSim"]
+
+
+@dataclass
+class Settings:
+    """The star_dodger.py settings, with times in seconds."""
+
+    width: int = 800
+    height: int = 600
+    bonus_stars: bool = False  # USE_BONUS_STARS
+    increasing_difficulty: bool = False  # USE_INCREASING_DIFFICULTY
+    invincibility: bool = False  # USE_INVINCIBILITY
+    asteroid_speed: float = 3  # ASTEROID_SPEED (pixels per tick)
+    speedup_every: int = 10  # With increasing_difficulty: speed up every N points...
+    speedup_step: float = 0.5  # ...by this much...
+    max_speed: float = 10  # ...but never faster than this
+    lives: int = 3
+    player_speed: float = 5
+    star_speed: float = 2
+    asteroid_interval: float = 1.5  # clock.schedule_interval(spawn_asteroid, 1.5)
+    star_interval: float = 4.0  # clock.schedule_interval(spawn_bonus_star, 4.0)
+    shield_time: float = 2.0  # clock.schedule_unique(end_invincibility, 2.0)
+    tick_rate: int = 60  # Logic ticks per second
+
+
+class StarDodgerSim:
+    """
+    One game of Star Dodger that advances one fixed tick per step().
+
+    The state is public so front ends, tools and tests can read it:
+    score, lives, game_over, invincible, invincible_timer, player (a Box),
+    asteroids and bonus_stars (AsteroidPools), plus event counters hits,
+    dodges and stars_collected, and tick (how long this game has lasted).
+    The spawn and shield timers are on timers (a TimerWheel).
+    """
+
+    def __init__(self, settings=None, seed=None):
+        self.settings = settings if settings is not None else Settings()
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.asteroids = AsteroidPool(whole_pixels=True)  # Rects: whole pixels
+        self.bonus_stars = AsteroidPool(whole_pixels=True)
+        self.timers = TimerWheel()
+        self.reset(seed)
+
+    @property
+    def dt(self):
+        return 1.0 / self.settings.tick_rate
+
+    def reset(self, seed=None):
+        """Start a new game. A seed makes the new game repeatable."""
+        s = self.settings
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(seed)
+        self.score = 0
+        self.lives = s.lives
+        self.game_over = False
+        self.invincible = False
+        self.invincible_timer = 0  # Ticks of invincibility (for the flash effect)
+        self.tick = 0
+        self.hits = 0
+        self.dodges = 0
+        self.stars_collected = 0
+        self.player = Box(s.width // 2 - 20, s.height - 70, 40, 50)
+        self.asteroids.clear()
+        self.bonus_stars.clear()
+        self.start_timers()
+
+    def start_timers(self):
+        """
+        (Re)start the timers that stand in for pgzero's clock, in step with
+        self.tick (so a game restored part-way through keeps its rhythm).
+        """
+        s, timers, tick = self.settings, self.timers, self.tick
+        timers.clear()
+        every = self._ticks(s.asteroid_interval)
+        timers.schedule_interval(self.spawn_asteroid, every, delay=every - tick % every)
+        if s.bonus_stars:
+            every = self._ticks(s.star_interval)
+            timers.schedule_interval(
+                self.spawn_bonus_star, every, delay=every - tick % every
+            )
+        if self.invincible:
+            left = self._ticks(s.shield_time) - self.invincible_timer
+            timers.schedule_unique(self.end_invincibility, left)
+
+    def get_asteroid_speed(self):
+        s = self.settings
+        if s.increasing_difficulty:
+            extra_speed = (self.score // s.speedup_every) * s.speedup_step
+            return min(s.asteroid_speed + extra_speed, s.max_speed)
+        return s.asteroid_speed
+
+    def step(self, keys=NO_KEYS):
+        """Advance the game by one tick with the given Keys held down."""
+        if self.game_over:
+            return
+        self.tick += 1
+        self.timers.advance()
+        self._move_player(keys)
+        if self.invincible:
+            self.invincible_timer += 1
+        self._update_asteroids()
+        if self.settings.bonus_stars:
+            self._update_bonus_stars()
+
+    def run(self, policy=None, max_ticks=None):
+        """
+        Play until game over (or max_ticks) and return the final score.
+
+        policy can be None (no keys), an iterable of Keys (a script or a
+        recording — NO_KEYS once it runs out) or a callable taking the sim
+        and returning Keys.
+        """
+        next_keys = next_keys_for(policy)
+        while not self.game_over and (max_ticks is None or self.tick < max_ticks):
+            self.step(next_keys(self))
+        return self.score
+
+    # --- the rules (same as star_dodger.py) ---
+
+    def spawn_asteroid(self):
+        x = self.rng.randint(30, self.settings.width - 30)
+        self.asteroids.spawn(x - 15, -20, 30, 30)
+
+    def spawn_bonus_star(self):
+        x = self.rng.randint(30, self.settings.width - 30)
+        self.bonus_stars.spawn(x - 10, -20, 20, 20)
+
+    def end_invincibility(self):
+        self.invincible = False
+
+    def _ticks(self, seconds):
+        return max(1, round(seconds * self.settings.tick_rate))
+
+    def _move_player(self, keys):
+        s, player = self.settings, self.player
+        speed = s.player_speed
+        if keys.left:
+            player.left -= speed
+        if keys.right:
+            player.left += speed
+        if keys.up:
+            player.top -= speed
+        if keys.down:
+            player.top += speed
+        player.left = max(0, min(player.left, s.width - player.width))
+        player.top = max(s.height // 2, min(player.top, s.height - player.height))
+
+    def _update_asteroids(self):
+        asteroids = self.asteroids
+        asteroids.move(self.get_asteroid_speed())
+
+        dodged, touching = asteroids.collide(self.player, self.settings.height + 30)
+        self.score += len(dodged)
+        self.dodges += len(dodged)
+
+        hits = []
+        for index in touching:
+            if self.invincible:
+                break
+            hits.append(index)
+            self._player_hit()
+
+        if dodged or hits:
+            asteroids.remove_at(dodged + hits)
+
+    def _player_hit(self):
+        self.lives -= 1
+        self.hits += 1
+        if self.lives <= 0:
+            self.game_over = True
+        elif self.settings.invincibility:
+            self.invincible = True
+            self.invincible_timer = 0
+            shield = self._ticks(self.settings.shield_time)
+            self.timers.schedule_unique(self.end_invincibility, shield)
+
+    def _update_bonus_stars(self):
+        stars = self.bonus_stars
+        stars.move(self.settings.star_speed)
+        fallen, collected = stars.collide(self.player, self.settings.height + 20)
+        self.score += 5 * len(collected)
+        self.stars_collected += len(collected)
+        if fallen or collected:
+            stars.remove_at(fallen + collected)
@@ -0,0 +1,188 @@
+"""
+Pre-rendered starfield background.
+
+Drawing a starry sky one filled_circle() at a time costs one call per star,
+every frame — even though the stars never move. StarfieldCache paints the
+background color and every star into an off-screen Surface ONCE, and after
+that the whole sky is a single blit, no matter how many stars there are.
+
+The picture is only repainted when the window size or the number of stars
+changes (or when you call invalidate()).
+
+ParallaxStarfield does the same for a sky that scrolls: several layers of
+stars (far ones slow and dim, near ones fast and bright), tens of thousands
+of them, still drawn with a couple of blits per layer.
+"""
+
+import random
+from dataclasses import dataclass
+
+
+class StarfieldCache:
+    """Paints (x, y, size) stars onto a Surface once and reuses it."""
+
+    def __init__(self, background=(10, 10, 30), color=(255, 255, 255)):
+        self.background = background
+        self.color = color
+        self._surface = None
+        self._key = None  # (width, height, star count) the surface was painted for
+
+    def surface(self, stars, width, height):
+        """Return the painted sky, repainting it only if the key changed."""
+        key = (width, height, len(stars))
+        if self._surface is None or key != self._key:
+            self._surface = self._render(stars, width, height)
+            self._key = key
+        return self._surface
+
+    def invalidate(self):
+        """Forget the painted sky, e.g. after changing stars in place."""
+        self._surface = None
+
+    def _render(self, stars, width, height):
+        import pygame  # Only needed once we actually paint something
+
+        surface = pygame.Surface((width, height))
+        surface.fill(self.background)
+        for x, y, size in stars:
+            pygame.draw.circle(surface, self.color, (x, y), size)
+        try:
+            return surface.convert()  # Match the display format for faster blits
+        except pygame.error:  # No display yet (e.g. headless tools)
+            return surface
+
+
+@dataclass
+class StarLayer:
+    """One layer of a ParallaxStarfield."""
+
+    speed: float = 1.0  # Pixels scrolled per pixel of scroll() (far layers < 1)
+    stars: int = 1000  # Stars per screenful
+    size: int = 1  # Radius in pixels (1 = single pixels, the cheapest)
+    color: tuple = (255, 255, 255)
+
+
+DEFAULT_LAYERS = (
+    StarLayer(speed=0.25, stars=16000, size=1, color=(90, 90, 120)),
+    StarLayer(speed=0.5, stars=5000, size=1, color=(170, 170, 200)),
+    StarLayer(speed=1.0, stars=400, size=2, color=(255, 255, 255)),
+)
+
+
+class ParallaxStarfield:
+    """
+    A vertically scrolling sky made of layers, each cached in one Surface.
+
+    Each layer's Surface is a ring of tiles: strips `tile_height` tall and as
+    wide as the screen, one more than fit on the screen. A tile's stars are
+    only made (from a seed, so they're always the same) when it scrolls into
+    view, and they're painted over the tile that scrolled out at the bottom.
+    Drawing a layer is two blits: the part of the ring below the wrap point
+    and the part above it. So the cost per frame is the same however many
+    stars there are; only a tile scrolling into view costs any star drawing.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        layers=DEFAULT_LAYERS,
+        tile_height=64,
+        seed=0,
+        background=(10, 10, 30),
+    ):
+        self.width = width
+        self.height = height
+        self.layers = list(layers)
+        self.tile_height = tile_height
+        self.seed = seed
+        self.background = background
+        self.slots = -(-height // tile_height) + 1  # Tiles in each ring
+        self.offset = 0.0  # How far we have scrolled (at speed 1.0)
+        self.tiles_made = 0
+        self.tiles_evicted = 0
+        self.blits = 0  # Blits in the last draw()
+        self._rings = None  # One Surface per layer, made on the first draw()
+        self._slot_tiles = None  # Per layer: which tile each slot holds
+
+    def scroll(self, dy):
+        """Move the sky down by dy pixels (near layers move the full dy)."""
+        self.offset += dy
+
+    def draw(self, target):
+        """Blit every layer onto target (a pygame Surface). Returns the blits."""
+        if self._rings is None:
+            self._make_rings()
+        th, ring_height = self.tile_height, self.slots * self.tile_height
+        self.blits = 0
+        for index, layer in enumerate(self.layers):
+            # The top of the screen in this layer's "world": it moves up as we scroll
+            top = -int(self.offset * layer.speed)
+            first = top // th
+            for tile in range(first, first + self.slots):
+                self._fill(index, tile)
+
+            ring = self._rings[index]
+            start = top % ring_height
+            above_wrap = min(self.height, ring_height - start)
+            target.blit(ring, (0, 0), (0, start, self.width, above_wrap))
+            self.blits += 1
+            if above_wrap < self.height:
+                rest = self.height - above_wrap
+                target.blit(ring, (0, above_wrap), (0, 0, self.width, rest))
+                self.blits += 1
+        return self.blits
+
+    def stats(self):
+        return {
+            "layers": len(self.layers),
+            "stars_per_screen": sum(layer.stars for layer in self.layers),
+            "tiles_made": self.tiles_made,
+            "tiles_evicted": self.tiles_evicted,
+            "blits": self.blits,
+        }
+
+    def _make_rings(self):
+        import pygame  # Only needed once we actually paint something
+
+        self._rings = []
+        for index in range(len(self.layers)):
+            ring = pygame.Surface((self.width, self.slots * self.tile_height))
+            if index:  # Upper layers: black is see-through
+                ring.set_colorkey((0, 0, 0))
+            try:
+                ring = ring.convert()  # Match the display format for faster blits
+            except pygame.error:  # No display yet (e.g. headless tools)
+                pass
+            self._rings.append(ring)
+        self._slot_tiles = [[None] * self.slots for _ in self.layers]
+
+    def _fill(self, index, tile):
+        """Make sure tile's stars are painted in its slot of layer index's ring."""
+        slot = tile % self.slots
+        held = self._slot_tiles[index]
+        if held[slot] == tile:
+            return
+        if held[slot] is not None:
+            self.tiles_evicted += 1
+        held[slot] = tile
+        self.tiles_made += 1
+
+        import pygame
+
+        layer, ring, th = self.layers[index], self._rings[index], self.tile_height
+        area = pygame.Rect(0, slot * th, self.width, th)
+        ring.fill(self.background if index == 0 else (0, 0, 0), area)
+        # The same tile always gets the same stars, even after it was evicted
+        rng = random.Random(hash((self.seed, index, tile)))
+        count = round(layer.stars * th / self.height)
+        color, size = layer.color, layer.size
+        ring.set_clip(area)  # Big stars on the edge mustn't spill into the next tile
+        for _ in range(count):
+            x = rng.randrange(self.width)
+            y = area.top + rng.randrange(th)
+            if size <= 1:
+                ring.fill(color, (x, y, 1, 1))
+            else:
+                pygame.draw.circle(ring, color, (x, y), size)
+        ring.set_clip(None)
@@ -0,0 +1,53 @@
+"""
+Find every overlap between two groups of boxes, without testing every pair.
+
+One player against many asteroids is easy: AsteroidPool.collide() checks
+them all in one pass. But many against many (say 50 bullets against 2000
+asteroids) tested pair by pair is 100,000 colliderect() calls per frame.
+
+Sort-and-sweep puts every box from both groups in order of its left edge
+and sweeps across from left to right, keeping an "active" list of boxes
+whose right edge hasn't been passed yet. A box can only overlap boxes that
+are active when it starts, so that's all it gets tested against. With the
+boxes spread across the screen that's a handful each, not all of them.
+"""
+
+
+def overlapping_pairs(boxes_a, boxes_b):
+    """
+    Return every (i, j) where boxes_a[i] overlaps boxes_b[j], using the same
+    rules as colliderect(). Boxes are (left, top, width, height) tuples, like
+    AsteroidPool.rects() gives, or anything with those four attributes.
+    """
+    boxes_a = [_as_tuple(box) for box in boxes_a]
+    boxes_b = [_as_tuple(box) for box in boxes_b]
+    groups = (boxes_a, boxes_b)
+    starts = sorted(
+        [(box[0], 0, i) for i, box in enumerate(boxes_a)]
+        + [(box[0], 1, j) for j, box in enumerate(boxes_b)]
+    )
+
+    active = ([], [])  # Per group: indices of boxes we haven't swept past yet
+    pairs = []
+    for left, group, index in starts:
+        top, height = groups[group][index][1], groups[group][index][3]
+        bottom = top + height
+        others = groups[1 - group]
+        # Forget the other group's boxes that end before this one starts...
+        still_open = [
+            k for k in active[1 - group] if others[k][0] + others[k][2] > left
+        ]
+        active[1 - group][:] = still_open
+        # ...the rest overlap it left-to-right, so only top-to-bottom is left to check
+        for k in still_open:
+            other = others[k]
+            if other[1] < bottom and top < other[1] + other[3]:
+                pairs.append((index, k) if group == 0 else (k, index))
+        active[group].append(index)
+    return pairs
+
+
+def _as_tuple(box):
+    if isinstance(box, tuple):
+        return box
+    return (box.left, box.top, box.width, box.height)
@@ -0,0 +1,221 @@
+"""
+Timers that count game ticks instead of seconds.
+
+Pygame Zero's clock counts real seconds, so "spawn an asteroid every 1.5
+seconds" depends on how fast the computer is, and a headless simulation
+(which has no clock at all) had to redo every timer by hand as tick counts.
+TimerWheel counts ticks: advance() moves it on by one, and whatever is due
+runs. The same timers then behave exactly alike in the window and headless.
+
+It is a "hierarchical timing wheel", so there can be thousands of timers
+(one per power-up, per spawn wave...) and scheduling or cancelling one is
+O(1). The first wheel has a slot for each of the next 256 ticks. Timers
+further away go on the next wheel, whose slots are 256 ticks wide, and so
+on; every 256 ticks one slot of the wheel above is tipped into the one
+below. Each tick only looks at one slot, however many timers are waiting.
+
+Timers due on the same tick run in the order they were first scheduled,
+so a game using them is repeatable.
+
+    timers = TimerWheel()
+    timers.schedule_interval(spawn_asteroid, 90)  # every 90 ticks
+    timers.schedule_unique(end_invincibility, 120)
+    timers.advance()  # once per update()
+"""
+
+
+class Timer:
+    """One scheduled call. Keep it if you want to cancel() it later."""
+
+    __slots__ = ("callback", "args", "expires", "interval", "seq", "active", "_slot")
+
+    def __init__(self, callback, args, expires, interval, seq):
+        self.callback = callback
+        self.args = args
+        self.expires = expires  # The tick it runs on
+        self.interval = interval  # Ticks between repeats (None = run once)
+        self.seq = seq  # Tie-breaker for timers due on the same tick
+        self.active = True
+        self._slot = None  # The dict it is waiting in
+
+    def __repr__(self):
+        name = getattr(self.callback, "__name__", repr(self.callback))
+        return f"<Timer {name} at tick {self.expires}>"
+
+
+class TimerWheel:
+    """
+    Timers measured in ticks. Call advance() once per game tick.
+
+    slot_bits sets the size of each wheel (8 = 256 slots); with `levels`
+    wheels, timers up to 256**levels ticks away are handled directly (and
+    ones further than that still work, they just wait on a list).
+    """
+
+    def __init__(self, slot_bits=8, levels=4):
+        self.now = 0  # Ticks so far
+        self.fired = 0  # Callbacks run so far
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._wheels = [[{} for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self._overflow = {}  # Timers beyond the top wheel
+        self._by_callback = {}  # callback -> {timer: None}, for unschedule()
+        self._seq = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    # --- scheduling (like Pygame Zero's clock, but in ticks) ---
+
+    def schedule(self, callback, delay, *args):
+        """Call callback(*args) once, `delay` ticks from now (at least 1)."""
+        return self._add(callback, args, delay, None)
+
+    def schedule_interval(self, callback, interval, *args, delay=None):
+        """
+        Call callback(*args) every `interval` ticks. The first call is
+        `delay` ticks from now (one interval, if not given).
+        """
+        first = interval if delay is None else delay
+        return self._add(callback, args, first, max(1, interval))
+
+    def schedule_unique(self, callback, delay, *args):
+        """Like schedule(), but first cancel any timers already set for callback."""
+        self.unschedule(callback)
+        return self.schedule(callback, delay, *args)
+
+    def unschedule(self, callback):
+        """Cancel every timer set for callback."""
+        for timer in list(self._by_callback.get(callback, ())):
+            self.cancel(timer)
+
+    def cancel(self, timer):
+        if not timer.active:
+            return
+        timer.active = False
+        if timer._slot is not None:
+            del timer._slot[timer]
+            timer._slot = None
+        self._forget(timer)
+
+    def clear(self):
+        """Cancel every timer (the tick count carries on)."""
+        for timers in list(self._by_callback.values()):
+            for timer in list(timers):
+                self.cancel(timer)
+
+    def ticks_until(self, timer):
+        return timer.expires - self.now
+
+    # --- running ---
+
+    def advance(self, ticks=1):
+        """Move on `ticks` ticks, running every timer that comes due."""
+        for _ in range(ticks):
+            self.now += 1
+            self._cascade()
+            slot = self._wheels[0][self.now & self._mask]
+            if slot:
+                self._fire(slot)
+
+    def _fire(self, slot):
+        due = sorted(slot, key=_by_seq)
+        slot.clear()
+        for timer in due:
+            timer._slot = None
+        for timer in due:
+            if not timer.active:  # Cancelled by an earlier callback this tick
+                continue
+            if timer.interval is None:
+                timer.active = False
+                self._forget(timer)
+            else:
+                timer.expires += timer.interval
+                self._insert(timer)
+            self.fired += 1
+            timer.callback(*timer.args)
+
+    def _cascade(self):
+        """Tip the slots of the upper wheels whose time has come into the lower ones."""
+        now, bits, wheels = self.now, self._bits, self._wheels
+        if now & self._mask:
+            return
+        # The wheels that just went all the way round: now is a multiple of 256**level
+        top = 1
+        while top < len(wheels) and not now & ((1 << (bits * top)) - 1):
+            top += 1
+        if not now & ((1 << (bits * len(wheels))) - 1) and self._overflow:
+            self._reinsert(self._overflow)
+        for level in range(top - 1, 0, -1):
+            self._reinsert(wheels[level][(now >> (bits * level)) & self._mask])
+
+    def _reinsert(self, slot):
+        timers = list(slot)
+        slot.clear()
+        for timer in timers:
+            self._insert(timer)
+
+    # --- storage ---
+
+    def _add(self, callback, args, delay, interval):
+        self._seq += 1
+        timer = Timer(callback, args, self.now + max(1, delay), interval, self._seq)
+        self._by_callback.setdefault(callback, {})[timer] = None
+        self._count += 1
+        self._insert(timer)
+        return timer
+
+    def _insert(self, timer):
+        expires, now, bits = timer.expires, self.now, self._bits
+        for level, wheel in enumerate(self._wheels):
+            shift = bits * level
+            if (expires >> shift) - (now >> shift) <= self._mask:
+                slot = wheel[(expires >> shift) & self._mask]
+                break
+        else:
+            slot = self._overflow
+        slot[timer] = None
+        timer._slot = slot
+
+    def _forget(self, timer):
+        timers = self._by_callback[timer.callback]
+        del timers[timer]
+        if not timers:
+            del self._by_callback[timer.callback]
+        self._count -= 1
+
+
+def _by_seq(timer):
+    return timer.seq
+
+
+class TickClock:
+    """
+    A TimerWheel that takes times in seconds, like Pygame Zero's clock.
+
+    Swap it in for `clock` and call tick() once per update(): the timers
+    then count updates, at tick_rate updates per second.
+    """
+
+    def __init__(self, tick_rate=60, wheel=None):
+        self.tick_rate = tick_rate
+        self.wheel = wheel if wheel is not None else TimerWheel()
+
+    def ticks(self, seconds):
+        return max(1, round(seconds * self.tick_rate))
+
+    def schedule(self, callback, delay):
+        return self.wheel.schedule(callback, self.ticks(delay))
+
+    def schedule_interval(self, callback, interval):
+        return self.wheel.schedule_interval(callback, self.ticks(interval))
+
+    def schedule_unique(self, callback, delay):
+        return self.wheel.schedule_unique(callback, self.ticks(delay))
+
+    def unschedule(self, callback):
+        self.wheel.unschedule(callback)
+
+    def tick(self):
+        self.wheel.advance()
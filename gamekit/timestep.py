@@ -0,0 +1,133 @@
+"""
+Run a game's update() at a fixed rate, whatever the frame rate is.
+
+The games move things a fixed amount per update() ("asteroid.y += 3"), so
+when the computer is busy and frames come slower, the whole game slows
+down. FixedTimestep keeps a "time owed" accumulator instead: every frame it
+adds the real time that passed and runs as many fixed-size ticks as that
+pays for. A slow frame runs two or three ticks, so the game keeps its speed.
+
+To stop a really slow frame from snowballing (more ticks make the next
+frame slower, which needs even more ticks...), at most max_catch_up ticks
+run per frame and any extra time owed is dropped.
+
+Ticks and frames don't line up exactly, so draw() can also slide the
+objects it is told about part of the way between where they were last tick
+and where they are now. That keeps movement smooth at any frame rate.
+"""
+
+from contextlib import contextmanager
+
+
+class FixedTimestep:
+    """
+    Call tick() exactly tick_rate times per second of game time.
+
+    tracked, if given, is a function returning the objects (anything with x
+    and y) that draw() should interpolate.
+    """
+
+    def __init__(self, tick, tick_rate=60, max_catch_up=5, tracked=None, max_jump=50):
+        self.tick = tick
+        self.dt = 1.0 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.tracked = tracked
+        self.max_jump = max_jump  # Bigger moves are teleports: don't slide those
+        self.accumulator = 0.0
+        self.alpha = 0.0  # How far we are from the last tick to the next (0..1)
+        self.ticks = 0
+        self.frames = 0
+        self.dropped = 0  # Ticks skipped by the catch-up cap
+        self._previous = {}
+
+    def advance(self, frame_dt):
+        """Add one frame's worth of real time and run the ticks it pays for."""
+        self.frames += 1
+        self.accumulator += frame_dt
+        ran = 0
+        while self.accumulator >= self.dt:
+            if ran == self.max_catch_up:
+                skipped = int(self.accumulator / self.dt)
+                self.dropped += skipped
+                self.accumulator -= skipped * self.dt
+                break
+            self._remember()
+            self.tick()
+            self.accumulator -= self.dt
+            ran += 1
+        self.ticks += ran
+        self.alpha = self.accumulator / self.dt
+        return ran
+
+    def _remember(self):
+        if self.tracked is not None:
+            self._previous = {}
+            for obj in self.tracked():
+                box = _box(obj)
+                self._previous[id(obj)] = (box.x, box.y)
+
+    @contextmanager
+    def interpolated(self):
+        """
+        Inside the with block, tracked objects sit alpha of the way from
+        their last-tick position to their current one. They are put back
+        afterwards, so the game rules never see the in-between positions.
+        """
+        moved = []
+        if self.tracked is not None and self._previous:
+            previous, alpha, limit = self._previous, self.alpha, self.max_jump
+            for obj in self.tracked():
+                old = previous.get(id(obj))
+                if old is None:
+                    continue  # New since the last tick: draw it where it is
+                box = _box(obj)
+                x, y = box.x, box.y
+                dx, dy = x - old[0], y - old[1]
+                if (dx or dy) and abs(dx) <= limit and abs(dy) <= limit:
+                    moved.append((box, x, y))
+                    box.x = old[0] + dx * alpha
+                    box.y = old[1] + dy * alpha
+        try:
+            yield
+        finally:
+            for box, x, y in moved:
+                box.x = x
+                box.y = y
+
+    def wrap(self, draw):
+        """
+        Return (update, draw) functions to use in place of the game's own:
+
+            update, draw = timestep.wrap(draw)
+
+        Pygame Zero passes the new update() the frame time; called with no
+        argument, it runs exactly one tick.
+        """
+
+        def update(dt=None):
+            self.advance(self.dt if dt is None else dt)
+
+        def draw_frame():
+            with self.interpolated():
+                draw()
+
+        return update, draw_frame
+
+    def stats(self):
+        return {
+            "ticks": self.ticks,
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "alpha": round(self.alpha, 3),
+        }
+
+
+def _box(obj):
+    """
+    The rectangle that holds obj's position. An Actor keeps its top-left
+    corner in a rect (_rect) that Actor.draw() blits at; moving that
+    directly is much faster than Actor's x and y properties, and moves the
+    picture by exactly the same amount. Anything else (a Rect, a Box) is
+    its own rectangle.
+    """
+    return getattr(obj, "_rect", obj)
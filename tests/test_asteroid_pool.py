@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+import gamekit.asteroid_pool as asteroid_pool
+from gamekit.asteroid_pool import AsteroidPool
+
+pygame = pytest.importorskip("pygame")
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy, and again with the array-module fallback."""
+    if request.param == "array":
+        monkeypatch.setattr(asteroid_pool, "np", None)
+    elif asteroid_pool.np is None:
+        pytest.skip("NumPy isn't installed")
+    return request.param
+
+
+def falling_rects(seed, count=50):
+    rng = random.Random(seed)
+    return [
+        pygame.Rect(rng.randint(0, 770), rng.randint(-50, 600), 30, 30)
+        for _ in range(count)
+    ]
+
+
+def test_a_pool_of_rects_moves_like_a_list_of_rects(backend):
+    rects = falling_rects(1)
+    pool = AsteroidPool(whole_pixels=True)
+    for rect in falling_rects(1):
+        pool.append(rect)
+    for speed in (3, 3.5, 4.5, 3.5, 0.5, 7.5) * 10:
+        for rect in rects:
+            rect.y += speed
+        pool.move(speed)
+    assert [tuple(r) for r in pool] == [tuple(r) for r in rects]
+    assert [r[:2] for r in pool.rects()] == [tuple(r.topleft) for r in rects]
+
+
+def test_without_whole_pixels_positions_stay_exact(backend):
+    pool = AsteroidPool()
+    pool.spawn(0, -20, 30, 30)
+    for _ in range(3):
+        pool.move(3.5)
+    assert pool.rects() == [(0, -9.5, 30, 30)]
+
+
+def test_culling_and_removal_leave_the_other_objects_alone(backend):
+    rects = falling_rects(2)
+    pool = AsteroidPool(whole_pixels=True)
+    for rect in rects:
+        pool.append(rect)
+    before = [tuple(r) for r in rects]
+    pool.move(10)
+
+    off, hits = pool.collide(pygame.Rect(300, 400, 40, 50), 630)
+    removed = pool.remove_at(off + hits)
+    assert all(r.top > 630 or r.colliderect((300, 400, 40, 50)) for r in removed)
+    kept = [r for r in rects if r not in removed]
+    assert [tuple(r) for r in kept] == [
+        b for r, b in zip(rects, before) if r not in removed
+    ]  # Not written back yet...
+
+    pool.sync([0])  # ...until they're drawn
+    assert pool.items[0].topleft == (pool.left[0], pool.top[0])
+    assert [r[:2] for r in pool.rects()] == [tuple(r.topleft) for r in pool]
+
+
+def test_center_culling_matches_actor_y(backend):
+    pool = AsteroidPool()
+    pool.spawn(0, 610, 30, 30)  # Center at 625: still on its way out
+    pool.spawn(0, 620, 30, 30)  # Center at 635: an Actor's y is past HEIGHT + 30
+    assert pool.below(630) == []  # (a Rect's y, its top, isn't yet)
+    assert pool.below(630, center=True) == [1]
@@ -0,0 +1,75 @@
+import pytest
+
+from gamekit.batch import SpriteBatch, Stamp
+
+pygame = pytest.importorskip("pygame")
+
+RED, GREEN, BLUE = (255, 0, 0), (0, 255, 0), (0, 0, 255)
+
+
+class Spot:
+    """A Rect-like thing the batch draws with a stamp."""
+
+    def __init__(self, center):
+        self.center = center
+
+
+class SelfDrawingActor:
+    """An Actor the batch can't look inside (no _surf/_rect): it draws itself."""
+
+    image = "green"
+
+    def __init__(self, target, center):
+        self.target = target
+        self.center = center
+
+    def draw(self):
+        pygame.draw.circle(self.target, GREEN, self.center, 10)
+
+
+def draw_one_by_one(target, things, stamps):
+    for thing, stamp in zip(things, stamps):
+        if isinstance(thing, SelfDrawingActor):
+            thing.draw()
+        else:
+            target.blit(stamp.surface, stamp.position(thing.center))
+
+
+def test_self_drawing_actors_keep_their_place_in_the_layer():
+    red, blue = Stamp.circle(10, RED), Stamp.circle(10, BLUE)
+    expected = pygame.Surface((100, 40))
+    actual = pygame.Surface((100, 40))
+    centers = [(20, 20), (28, 20), (36, 20), (44, 20), (52, 20), (60, 20)]
+
+    def things(target):
+        return [
+            Spot(centers[0]),
+            SelfDrawingActor(target, centers[1]),
+            Spot(centers[2]),
+            Spot(centers[3]),
+            SelfDrawingActor(target, centers[4]),
+            Spot(centers[5]),
+        ]
+
+    stamps = [red, None, blue, red, None, blue]
+    draw_one_by_one(expected, things(expected), stamps)
+
+    batch = SpriteBatch()
+    layer = things(actual)
+    batch.add_all(layer[:2], red)
+    batch.add_all(layer[2:3], blue)
+    batch.add_all(layer[3:5], red)
+    batch.add_all(layer[5:], blue)
+    assert len(batch) == 6
+    assert batch.draw(actual) == 6
+    assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(expected, "RGB")
+    assert batch.calls == 3  # The blits between the self-drawn Actors
+    assert len(batch) == 0 and batch.draw(actual) == 0
+
+
+def test_a_batch_of_stamps_is_one_blits_call():
+    rock = Stamp.circle(15, (160, 160, 160), outline=(100, 100, 100))
+    batch = SpriteBatch()
+    batch.add_all([Spot((x, 50)) for x in range(0, 800, 10)], rock)
+    batch.draw(pygame.Surface((800, 100)))
+    assert batch.stats() == {"calls": 1, "drawn": 80, "per_call": 80.0}
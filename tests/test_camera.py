@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+import pytest
+
+from gamekit.asteroid_pool import AsteroidPool
+from gamekit.broadphase import SpatialHash
+from gamekit.camera import Camera
+
+WIDTH, HEIGHT = 800, 600
+
+
+def box(left, top, width=30, height=30):
+    return SimpleNamespace(left=left, top=top, width=width, height=height)
+
+
+# Star Dodger's asteroids (30x30): which ones the window shows
+SEEN = [box(100, 100), box(0, 0), box(770, 570), box(400, -20), box(400, 590)]
+OFF = [
+    box(400, -30),  # Waiting above the top (bottom edge touches it: not seen)
+    box(400, -50),
+    box(400, HEIGHT),  # Just past the bottom
+    box(400, HEIGHT + 25),  # Lingering until HEIGHT + 30
+    box(-30, 300),
+    box(WIDTH + 5, 300),
+]
+
+
+def pool_of(boxes):
+    pool = AsteroidPool()
+    for b in boxes:
+        pool.append(b)
+    return pool
+
+
+def grid_of(boxes):
+    grid = SpatialHash()
+    for b in boxes:
+        grid.insert(b)
+    return grid
+
+
+@pytest.mark.parametrize("store", [list, pool_of, grid_of])
+def test_objects_off_the_window_are_culled_even_when_the_world_is_the_window(
+    store,
+):
+    camera = Camera(WIDTH, HEIGHT, world_width=WIDTH, world_height=HEIGHT)
+    camera.new_frame()
+    found = camera.visible(store(SEEN + OFF))
+    assert sorted((b.left, b.top) for b in found) == sorted(
+        (b.left, b.top) for b in SEEN
+    )
+    assert (camera.drawn, camera.culled) == (len(SEEN), len(OFF))
+
+
+def test_actors_are_checked_through_their_rect():
+    class FakeActor:  # Like pgzero's Actor: the position lives in _rect
+        def __init__(self, left, top):
+            self._rect = box(left, top)
+
+    camera = Camera(WIDTH, HEIGHT)
+    actors = [FakeActor(10, 10), FakeActor(10, -40), FakeActor(10, HEIGHT + 10)]
+    assert camera.visible(actors) == actors[:1]
+    assert camera.culled == 2
+
+
+def test_counts_add_up_over_frames():
+    camera = Camera(WIDTH, HEIGHT)
+    for top in (0, -100):
+        camera.new_frame()
+        camera.visible([box(0, top), box(0, top + 200)])
+    camera.new_frame()
+    assert camera.stats() == {
+        "frames": 3,
+        "drawn_per_frame": 1.0,
+        "culled_per_frame": 0.3,
+    }
@@ -0,0 +1,78 @@
+import pytest
+
+from bench.loader import load_game
+
+pytest.importorskip("pgzero")
+
+
+class ScriptedKeyboard:
+    left = right = up = down = False
+
+
+def pixels(game):
+    import pgzero.game
+
+    return pgzero.game.screen.copy()
+
+
+def same_picture(a, b):
+    import pygame
+
+    return pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+
+# (name, where the player starts): in the open, and in a corner, where the
+# camera stops at the arena's edge and the player moves across the window
+STARTS = [("middle", None), ("corner", (30, 30))]
+
+
+@pytest.mark.parametrize("sprites", [False, True])
+@pytest.mark.parametrize("name, start", STARTS)
+def test_dirty_frames_match_full_repaints_in_the_coin_arena(name, start, sprites):
+    game = load_game(
+        "gold_collector",
+        {
+            "USE_COIN_ARENA": True,
+            "USE_DIRTY_RECTS": True,
+            "USE_SPRITES": sprites,
+            "LOG_LEVEL": "OFF",
+        },
+    )
+    game.keyboard = keyboard = ScriptedKeyboard()
+    if start is not None:
+        game.player.center = start
+    moves = ["right"] * 40 + ["down"] * 40 + ["left"] * 20 + [None] * 5 + ["up"] * 40
+    partial = 0  # Dirty frames that didn't need a full repaint
+    for frame, key in enumerate(moves):
+        keyboard.left = keyboard.right = keyboard.up = keyboard.down = False
+        if key is not None:
+            setattr(keyboard, key, True)
+        game.update()
+        full_repaints = game.dirty_rects.full_repaints
+        game.draw()
+        partial += game.dirty_rects.full_repaints == full_repaints
+        dirty = pixels(game)
+        game.dirty_rects.invalidate()
+        game.draw()
+        assert same_picture(dirty, pixels(game)), f"frame {frame}"
+    if name == "corner":  # The camera was stuck at the edge: little to repaint
+        assert game.camera.view[:2] == (0, 0)
+        assert partial > len(moves) // 2
+
+
+def test_dirty_frames_match_full_repaints_in_the_lesson_game():
+    game = load_game(
+        "gold_collector",
+        {"USE_DIRTY_RECTS": True, "USE_RANDOM_MOVEMENT": True, "LOG_LEVEL": "OFF"},
+    )
+    game.keyboard = keyboard = ScriptedKeyboard()
+    game.coin.topleft = (game.player.left + 60, game.player.top)
+    keyboard.right = True
+    for frame in range(60):
+        game.update()
+        game.draw()
+        dirty = pixels(game)
+        game.dirty_rects.invalidate()
+        game.draw()
+        assert same_picture(dirty, pixels(game)), f"frame {frame}"
+    assert game.score > 0
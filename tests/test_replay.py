@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from gamekit.replay import SPACE, Replay, ReplayPlayer, ReplayRecorder
+from gamekit.sim_base import Keys
+from gamekit.snapshot import Snapshot
+from gamekit.star_dodger_sim import Settings, StarDodgerSim
+
+FRAMES = 3000
+
+
+@pytest.fixture(scope="module")
+def recording():
+    """A recorded session (with restarts), and the state at every frame."""
+    settings = Settings(asteroid_interval=0.2, bonus_stars=True, invincibility=True)
+    recorder = ReplayRecorder(StarDodgerSim(settings, seed=11))
+    rng = random.Random(11)
+    states = []
+    keys = Keys()
+    for frame in range(FRAMES):
+        if recorder.sim.game_over and rng.random() < 0.05:
+            recorder.key_down(SPACE)
+        if frame % 25 == 0:
+            keys = Keys(*(rng.random() < 0.5 for _ in range(4)))
+        states.append(Snapshot.capture(recorder.sim))
+        recorder.step(keys)
+    states.append(Snapshot.capture(recorder.sim))
+    assert recorder.replay.events, "the session should include a restart"
+    return recorder.replay, states
+
+
+def test_play_reproduces_the_recording(recording):
+    replay, states = recording
+    player = ReplayPlayer(Replay.from_bytes(replay.to_bytes()))
+    assert player.play() == FRAMES
+    assert Snapshot.capture(player.sim) == states[-1]
+
+
+@pytest.mark.parametrize(
+    "frames", [[0], [1234], [2999, 3000], [1800, 600, 2500, 5, 1799, 1801]]
+)
+def test_seek_then_play_matches_the_recording(recording, frames):
+    replay, states = recording
+    player = ReplayPlayer(replay, snapshot_every=300)
+    player.play(FRAMES // 2)  # Leave snapshots behind, but not all the way
+    for frame in frames:
+        player.seek(frame)
+        assert player.frame == frame
+        assert Snapshot.capture(player.sim) == states[frame]
+        ran = player.play(100)
+        assert Snapshot.capture(player.sim) == states[frame + ran]
+
+
+def test_seek_is_clamped_to_the_replay(recording):
+    replay, states = recording
+    player = ReplayPlayer(replay)
+    assert Snapshot.capture(player.seek(FRAMES + 500)) == states[-1]
+    assert Snapshot.capture(player.seek(-5)) == states[0]
+
+
+def test_bytes_round_trip_with_long_runs():
+    keys = bytearray([3]) * 70000 + bytearray([0, 1, 1, 15])
+    replay = Replay(7, {"lives": 5}, keys, [(5, SPACE), (70001, SPACE)])
+    assert Replay.from_bytes(replay.to_bytes()) == replay
+
+
+def test_other_data_is_rejected():
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b"SDSS" + bytes(16))
@@ -0,0 +1,128 @@
+import random
+from array import array
+
+import pytest
+
+from gamekit.sim_base import Keys
+from gamekit.snapshot import Snapshot, apply_delta, decode, encode_delta
+from gamekit.star_dodger_sim import Settings, StarDodgerSim
+
+
+def column(values):
+    return array("h", values)
+
+
+def snapshot(**fields):
+    values = {
+        "tick": 1,
+        "score": 2,
+        "lives": 3,
+        "player_left": 1520,
+        "player_top": 2120,
+    }
+    values.update(fields)
+    for name in ("asteroid_lefts", "asteroid_tops", "star_lefts", "star_tops"):
+        values[name] = column(values.get(name, ()))
+    return Snapshot(**values)
+
+
+def played_snapshots(seed, ticks=1500):
+    settings = Settings(
+        asteroid_interval=0.1, bonus_stars=True, star_interval=0.5, invincibility=True
+    )
+    sim = StarDodgerSim(settings, seed=seed)
+    rng = random.Random(seed)
+    keys = Keys()
+    snapshots = [Snapshot.capture(sim)]
+    for tick in range(ticks):
+        if tick % 20 == 0:
+            keys = Keys(*(rng.random() < 0.5 for _ in range(4)))
+        sim.step(keys)
+        snapshots.append(Snapshot.capture(sim))
+    return snapshots
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_a_played_game_round_trips_tick_by_tick(seed):
+    snapshots = played_snapshots(seed)
+    assert any(len(s.asteroid_lefts) > 10 for s in snapshots)
+    for old, new in zip(snapshots, snapshots[1:]):
+        assert Snapshot.from_bytes(new.to_bytes()) == new
+        data = encode_delta(old, new)
+        assert apply_delta(old, data) == new
+        assert decode(data, old) == new
+
+
+EDGES = [
+    {"lives": -1},
+    {"lives": -32768},
+    {"lives": 32767},
+    {"score": -(2**31)},
+    {"score": 2**31 - 1},
+    {"tick": 0},
+    {"tick": 2**32 - 1},
+    {"invincible": True, "invincible_timer": 0xFFFF},
+    {"game_over": True},
+    {"player_left": -32768, "player_top": 32767},
+    {"asteroid_lefts": [-32768, 32767], "asteroid_tops": [32767, -32768]},
+    {"star_lefts": [0] * 1000, "star_tops": range(1000)},
+]
+
+
+@pytest.mark.parametrize("fields", EDGES)
+def test_edge_values_round_trip(fields):
+    new = snapshot(**fields)
+    assert Snapshot.from_bytes(new.to_bytes()) == new
+    for old in (snapshot(), new):
+        assert apply_delta(old, encode_delta(old, new)) == new
+        assert apply_delta(new, encode_delta(new, old)) == old
+
+
+def test_deltas_when_objects_appear_and_disappear():
+    many = snapshot(asteroid_lefts=range(0, 800, 8), asteroid_tops=range(100))
+    fallen = snapshot(asteroid_lefts=range(0, 800, 8), asteroid_tops=range(12, 112))
+    removed = snapshot(asteroid_lefts=[5, 792, 16], asteroid_tops=[17, 111, 14])
+    empty = snapshot()
+    for old, new in [
+        (empty, many),
+        (many, fallen),
+        (fallen, removed),
+        (removed, empty),
+    ]:
+        assert apply_delta(old, encode_delta(old, new)) == new
+
+
+def test_a_tick_where_everything_falls_is_small():
+    old = snapshot(asteroid_lefts=range(0, 800, 4), asteroid_tops=range(200))
+    new = snapshot(asteroid_lefts=range(0, 800, 4), asteroid_tops=range(12, 212))
+    assert len(encode_delta(old, new)) < 40
+
+
+def test_drift_too_big_for_int16_is_stored_as_exceptions():
+    old = snapshot(asteroid_lefts=[-32768] * 5, asteroid_tops=[0] * 5)
+    new = snapshot(asteroid_lefts=[32767] * 5, asteroid_tops=[0] * 5)
+    assert apply_delta(old, encode_delta(old, new)) == new
+
+
+def test_restore_puts_the_state_back():
+    sim = StarDodgerSim(Settings(asteroid_interval=0.2), seed=4)
+    sim.run(max_ticks=300)
+    saved = Snapshot.capture(sim)
+    other = StarDodgerSim(Settings(asteroid_interval=0.2), seed=5)
+    saved.restore(other)
+    assert Snapshot.capture(other) == saved
+
+
+def test_bad_data_is_rejected():
+    full = snapshot().to_bytes()
+    delta = encode_delta(snapshot(), snapshot(score=9))
+    with pytest.raises(ValueError, match="Not a Star Dodger"):
+        Snapshot.from_bytes(b"XXXX" + full[4:])
+    with pytest.raises(ValueError, match="version"):
+        Snapshot.from_bytes(full[:4] + bytes([full[4] + 1]) + full[5:])
+    with pytest.raises(ValueError, match="full snapshot"):
+        Snapshot.from_bytes(delta)
+    with pytest.raises(ValueError, match="delta"):
+        apply_delta(snapshot(), full)
+    with pytest.raises(ValueError, match="needs the snapshot"):
+        decode(delta)
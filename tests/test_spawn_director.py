@@ -0,0 +1,57 @@
+import pytest
+
+import gamekit.spawn_director as spawn_director
+from gamekit.spawn_director import DifficultyCurve, SpawnDirector, Wave
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    """Run a test with NumPy, and again with the array-module fallback."""
+    if request.param == "array":
+        monkeypatch.setattr(spawn_director, "np", None)
+    elif spawn_director.np is None:
+        pytest.skip("NumPy isn't installed")
+    return request.param
+
+
+def make_director():
+    waves = [
+        Wave(duration=1, every=0.25, star_every=0.5),
+        Wave(duration=1, every=0.1, burst=3, pattern="line", speed=1.5),
+        Wave(duration=1, every=0.05, pattern="sweep", speed=0.8),
+    ]
+    curve = DifficultyCurve(base_speed=3, speed_step=0.5)
+    return SpawnDirector(waves, tick_rate=20, seed=1, curve=curve)
+
+
+def test_the_speed_is_the_running_waves_speed(backend):
+    director = make_director()
+    speeds = []
+    for tick in range(1, 121):
+        for event in director.advance(score=0):
+            assert len(event) == 2  # (x, kind): no speed of its own
+        speeds.append(director.speed)
+    # 20 ticks to a wave (the second one runs ticks 20-39), and they loop round
+    assert speeds[::20] == pytest.approx([3.0, 4.5, 2.4] * 2)
+    assert speeds[19:39] == [4.5] * 20
+
+
+def test_the_speed_only_changes_when_a_wave_starts(backend):
+    director = make_director()
+    for tick in range(10):
+        director.advance(score=0)
+    director.advance(score=100)  # Halfway through the first wave
+    assert director.speed == 3.0
+    for tick in range(10):
+        director.advance(score=100)
+    assert director.speed == min(3 + 10 * 0.5, 10) * 1.5  # The next wave
+
+
+def test_reset_goes_back_to_the_first_waves_speed(backend):
+    director = make_director()
+    for tick in range(30):
+        director.advance()
+    assert director.speed == 4.5
+    director.reset()
+    assert director.speed == 3.0
+    assert [kind for _, kind in director.advance()] == []
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from gamekit.star_dodger_env import ACTION_KEYS, VectorStarDodgerEnv
+from gamekit.star_dodger_sim import Settings, StarDodgerSim
+
+np = pytest.importorskip("numpy")
+
+GAMES = 4
+
+SETTINGS = [
+    Settings(lives=10),
+    Settings(bonus_stars=True, lives=10),
+    Settings(increasing_difficulty=True, lives=15),
+    Settings(invincibility=True, lives=10),
+    Settings(
+        bonus_stars=True,
+        increasing_difficulty=True,
+        invincibility=True,
+        lives=20,
+        asteroid_interval=0.3,
+    ),
+]
+
+
+class SeededRows:
+    """
+    Stands in for the vector env's NumPy generator: game i's spawn positions
+    come from random.Random(seeds[i]), the way a StarDodgerSim's do.
+    """
+
+    def __init__(self, seeds):
+        self.rngs = [random.Random(seed) for seed in seeds]
+
+    def integers(self, low, high, size, endpoint):
+        assert endpoint and size == len(self.rngs), "the games should be in step"
+        return np.array([rng.randint(low, high) for rng in self.rngs])
+
+
+@pytest.mark.parametrize("settings", SETTINGS)
+def test_vector_env_plays_the_same_games_as_the_sim(settings):
+    seeds = range(GAMES)
+    sims = [StarDodgerSim(settings, seed=seed) for seed in seeds]
+    env = VectorStarDodgerEnv(GAMES, settings)
+    env.rng = SeededRows(seeds)
+    actions = random.Random(99)
+    action = [0] * GAMES
+
+    for tick in range(1, 20001):
+        if tick % 7 == 1:
+            action = [actions.randrange(len(ACTION_KEYS)) for _ in sims]
+        for sim, a in zip(sims, action):
+            sim.step(ACTION_KEYS[a])
+        _, _, terminated, _, info = env.step(action)
+
+        assert info["score"].tolist() == [sim.score for sim in sims], f"tick {tick}"
+        assert info["lives"].tolist() == [sim.lives for sim in sims], f"tick {tick}"
+        assert terminated.tolist() == [sim.game_over for sim in sims]
+        if terminated.any():
+            break  # That game restarts, and is no longer in step with the others
+    assert tick > 500
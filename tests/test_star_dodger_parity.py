@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from bench.loader import load_game
+from gamekit.sim_base import Keys
+from gamekit.star_dodger_sim import Settings, StarDodgerSim
+
+pytest.importorskip("pgzero")
+
+LIVES = 10
+
+# (star_dodger.py settings, the matching StarDodgerSim settings). The sim
+# uses the shapes-mode geometry, and counts time in ticks like the timer wheel.
+GAMES = [
+    ({}, Settings()),
+    ({"USE_BONUS_STARS": True}, Settings(bonus_stars=True)),
+    ({"USE_INVINCIBILITY": True}, Settings(invincibility=True)),
+    # A Rect rounds a speed of 3.5 to whole pixels; the pool and sim do too
+    ({"USE_INCREASING_DIFFICULTY": True}, Settings(increasing_difficulty=True)),
+    (
+        {"USE_INCREASING_DIFFICULTY": True, "USE_ASTEROID_POOL": True},
+        Settings(increasing_difficulty=True),
+    ),
+    (
+        {"USE_BONUS_STARS": True, "USE_INVINCIBILITY": True, "USE_BROADPHASE": True},
+        Settings(bonus_stars=True, invincibility=True),
+    ),
+]
+
+
+class ScriptedKeyboard:
+    """Stands in for pgzero's keyboard, holding whatever Keys it is given."""
+
+    left = right = up = down = False
+
+    def hold(self, keys):
+        self.left, self.right, self.up, self.down = keys
+
+
+@pytest.mark.parametrize("script_settings, settings", GAMES)
+def test_star_dodger_and_the_sim_play_the_same_game(script_settings, settings):
+    seed = 5
+    game = load_game(
+        "star_dodger",
+        {
+            "USE_SPRITES": False,
+            "USE_TIMER_WHEEL": True,
+            "LOG_LEVEL": "OFF",
+            **script_settings,
+        },
+    )
+    game.keyboard = ScriptedKeyboard()
+    game.random = random.Random(seed)  # Spawns draw from it, like the sim's rng
+    game.lives = LIVES
+    settings.lives = LIVES
+    sim = StarDodgerSim(settings, seed=seed)
+
+    inputs = random.Random(seed + 1)
+    keys = Keys()
+    for tick in range(1, 20001):
+        if tick % 20 == 1:
+            keys = Keys(*(inputs.random() < 0.5 for _ in range(4)))
+        game.keyboard.hold(keys)
+        game.update()
+        sim.step(keys)
+
+        game_state = (game.score, game.lives, game.game_over, game.invincible)
+        sim_state = (sim.score, sim.lives, sim.game_over, sim.invincible)
+        assert game_state == sim_state, f"tick {tick}"
+        assert (game.player.x, game.player.y) == (sim.player.left, sim.player.top)
+        if sim.game_over:
+            break
+    assert sim.game_over and sim.score > 20
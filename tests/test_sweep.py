@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from gamekit.asteroid_pool import AsteroidPool
+from gamekit.sweep import overlapping_pairs
+
+
+def brute_force_pairs(boxes_a, boxes_b):
+    """Every pair, tested the slow way, with colliderect()'s rules."""
+    return [
+        (i, j)
+        for i, (al, at, aw, ah) in enumerate(boxes_a)
+        for j, (bl, bt, bw, bh) in enumerate(boxes_b)
+        if al < bl + bw and bl < al + aw and at < bt + bh and bt < at + ah
+    ]
+
+
+def random_boxes(rng, count, size, world=800):
+    return [
+        (rng.randint(0, world), rng.randint(0, world), rng.randint(1, size), size)
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sweep_finds_the_same_pairs_as_brute_force(seed):
+    rng = random.Random(seed)
+    bullets = random_boxes(rng, rng.randint(0, 60), 10)
+    asteroids = random_boxes(rng, rng.randint(0, 300), 40)
+    expected = sorted(brute_force_pairs(bullets, asteroids))
+    assert sorted(overlapping_pairs(bullets, asteroids)) == expected
+
+
+def test_edges_that_only_touch_do_not_overlap():
+    box = (100, 100, 30, 30)
+    touching = [(130, 100, 30, 30), (100, 130, 30, 30), (70, 70, 30, 30)]
+    assert overlapping_pairs([box], touching) == []
+    assert overlapping_pairs([box], [(129, 129, 30, 30)]) == [(0, 0)]
+
+
+def test_identical_left_edges_and_empty_groups():
+    column = [(0, y, 10, 10) for y in range(0, 100, 5)]
+    expected = sorted(brute_force_pairs(column, column))
+    assert sorted(overlapping_pairs(column, column)) == expected
+    assert overlapping_pairs([], column) == overlapping_pairs(column, []) == []
+
+
+def test_sweep_reads_pool_rects():
+    rng = random.Random(1)
+    pool = AsteroidPool()
+    for left, top, width, height in random_boxes(rng, 200, 30):
+        pool.spawn(left, top, width, height)
+    player = [(rng.randint(0, 800), rng.randint(0, 800), 40, 50) for _ in range(5)]
+    expected = sorted(brute_force_pairs(player, pool.rects()))
+    assert sorted(overlapping_pairs(player, pool.rects())) == expected
@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from gamekit.timer_wheel import TickClock, TimerWheel
+
+
+class ListTimers:
+    """The slow, obviously-right version: check every timer every tick."""
+
+    def __init__(self):
+        self.now = 0
+        self.timers = []  # [expires, seq, interval, name, active]
+        self.seq = 0
+
+    def schedule(self, name, delay, interval=None):
+        self.seq += 1
+        timer = [self.now + max(1, delay), self.seq, interval, name, True]
+        self.timers.append(timer)
+        return timer
+
+    def advance(self):
+        self.now += 1
+        due = sorted(t for t in self.timers if t[4] and t[0] == self.now)
+        fired = []
+        for timer in due:
+            if not timer[4]:
+                continue
+            if timer[2] is None:
+                timer[4] = False
+            else:
+                timer[0] += timer[2]
+            fired.append(timer[3])
+        return fired
+
+
+def test_timers_due_together_run_in_the_order_they_were_scheduled():
+    wheel = TimerWheel()
+    log = []
+    for name in "cab":
+        wheel.schedule(log.append, 5, name)
+    wheel.schedule(log.append, 4, "first")
+    wheel.advance(5)
+    assert log == ["first", "c", "a", "b"]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_firing_order_matches_a_plain_list_across_cascades(seed):
+    # 4-slot wheels on 3 levels: anything over 64 ticks away overflows, so
+    # timers are tipped from wheel to wheel (and back from overflow) all the time
+    rng = random.Random(seed)
+    wheel = TimerWheel(slot_bits=2, levels=3)
+    reference = ListTimers()
+    log = []
+    handles = []
+    for name in range(200):
+        delay = rng.choice([1, 3, 4, 5, 16, 17, 63, 64, 65, 300, rng.randint(1, 1000)])
+        interval = rng.choice([None, None, 1, 7, 64, 100])
+        if interval is None:
+            timer = wheel.schedule(log.append, delay, name)
+        else:
+            timer = wheel.schedule_interval(log.append, interval, name, delay=delay)
+        handles.append((timer, reference.schedule(name, delay, interval)))
+
+    for tick in range(1200):
+        if tick % 50 == 0:  # Cancel a few along the way
+            for timer, ref in rng.sample(handles, 5):
+                wheel.cancel(timer)
+                ref[4] = False
+        start = len(log)
+        wheel.advance()
+        assert log[start:] == reference.advance(), f"tick {wheel.now}"
+    assert len(wheel) == sum(1 for ref in reference.timers if ref[4])
+
+
+def test_callbacks_can_cancel_and_schedule_timers_due_this_tick():
+    wheel = TimerWheel(slot_bits=2, levels=2)
+    log = []
+
+    def first():
+        log.append("first")
+        wheel.cancel(second_timer)
+        wheel.schedule(log.append, 1, "next tick")
+
+    wheel.schedule(first, 40)
+    second_timer = wheel.schedule(log.append, 40, "second")
+    wheel.schedule(log.append, 40, "third")
+    wheel.advance(40)
+    assert log == ["first", "third"]
+    wheel.advance()
+    assert log == ["first", "third", "next tick"]
+    assert len(wheel) == 0
+
+
+def test_far_timers_wait_in_overflow_and_still_fire_on_time():
+    wheel = TimerWheel(slot_bits=2, levels=2)  # Wheels cover 16 ticks
+    fired_at = []
+    for delay in (15, 16, 17, 100, 1000):
+        wheel.schedule(lambda: fired_at.append(wheel.now), delay)
+    wheel.advance(1000)
+    assert fired_at == [15, 16, 17, 100, 1000]
+
+
+def test_schedule_unique_and_unschedule():
+    wheel = TimerWheel()
+    log = []
+    wheel.schedule_interval(log.append, 10, "tick")
+    wheel.schedule_unique(log.append, 5, "unique")
+    wheel.advance(20)
+    assert log == ["unique"]  # schedule_unique() cancelled the interval too
+    wheel.schedule_interval(log.append, 3, "again")
+    wheel.unschedule(log.append)
+    wheel.advance(10)
+    assert log == ["unique"] and len(wheel) == 0
+
+
+def test_tick_clock_converts_seconds_to_ticks():
+    clock = TickClock(tick_rate=60)
+    log = []
+    clock.schedule_interval(lambda: log.append(clock.wheel.now), 1.5)
+    for _ in range(300):
+        clock.tick()
+    assert log == [90, 180, 270]
@@ -27,8 +27,18 @@ FOR: Python for Kids Course
 # ========================================
 # These lines bring in code that other people wrote for us to use
 import random  # This lets us create random numbers (like for coin placement)
+import sys  # Lets us tell Python where to find our shared helpers
+from pathlib import Path  # For working with file and folder paths
 
-import pgzrun  # This is the game engine - it handles drawing, input, etc.
+# Let Python find the shared "gamekit" folder that sits next to week01/ and week02/
+# (This must come BEFORE "import pgzrun", because pgzrun changes __file__.)
+GAME_FOLDER = Path(__file__).resolve().parent  # The folder this file is in
+sys.path.insert(0, str(GAME_FOLDER.parent))
+
+import pgzrun  # noqa: E402  This is the game engine - it handles drawing, input, etc.
+
+# Our shared helper for printing game messages (see LOG_LEVEL below)
+from gamekit.log import configure_logging  # noqa: E402
 
 # ========================================
 # GAME SETTINGS - Change these to unlock features!
@@ -39,6 +49,28 @@ import pgzrun  # This is the game engine - it handles drawing, input, etc.
 USE_SPRITES = False  # Set to True to use images instead of shapes
 USE_RANDOM_MOVEMENT = False  # Set to True to make coin move randomly
 USE_BACKGROUND = False  # Set to True to use background image
+USE_COIN_ARENA = False  # True = a huge scrolling arena with thousands of coins!
+ARENA_COINS = 5000  # With USE_COIN_ARENA: how many coins are in the arena
+
+# ========================================
+# PERFORMANCE SETTINGS - For advanced players!
+# ========================================
+# These don't change the rules of the game — they change HOW the computer
+# does the work, so the game runs faster.
+
+USE_HUD_CACHE = False  # True = remember drawn text and reuse it (gamekit/hud.py)
+USE_FIXED_TIMESTEP = False  # True = update() runs TICK_RATE times a second, always
+TICK_RATE = 60  # With USE_FIXED_TIMESTEP: game updates per second
+USE_ASSET_CACHE = False  # True = load every image once, at the start
+USE_DIRTY_RECTS = False  # True = only repaint the parts of the screen that changed
+
+# How chatty the console is: "INFO" = every message, "WARNING" = only
+# problems, "OFF" = silent, which makes the game fastest.
+LOG_LEVEL = "INFO"
+
+# 📝 The game's messages go through a "logger" instead of print(). It only
+# builds a message if it will be shown, and it skips repeats that come too fast.
+log = configure_logging("gold_collector", LOG_LEVEL)
 
 # ========================================
 # GAME VARIABLES
@@ -48,6 +80,19 @@ USE_BACKGROUND = False  # Set to True to use background image
 # Game window size (how big the game window will be)
 WIDTH, HEIGHT = 800, 600  # 800 pixels wide, 600 pixels tall
 
+if USE_ASSET_CACHE and USE_SPRITES:
+    # Advanced: load every picture in images/ right now, and decide ONCE what
+    # we have. (There's no "bg" picture yet, so without this, draw() searches
+    # for it 60 times a second and fails every time!)
+    from gamekit.assets import Assets
+
+    assets = Assets(GAME_FOLDER / "images", load=images.load).preload()
+    if not assets.has("alien", "coin"):
+        log.warning("⚠️  Images not found, using shapes instead")
+        USE_SPRITES = False
+    if USE_BACKGROUND and not assets.has("bg"):
+        USE_BACKGROUND = False  # No background picture: use the solid color
+
 # Game objects - these are the things that appear in our game
 if USE_SPRITES:
     # Try to use images (sprites) for the player and coin
@@ -56,10 +101,10 @@ if USE_SPRITES:
         # The first part ('alien') is the image name, then (100, 300) is the start position
         player = Actor("alien", (100, 300))  # Player starts at (100, 300)
         coin = Actor("coin", (500, 300))  # Coin starts at position (500, 300)
-        print("✅ Using sprites (images)!")
+        log.info("✅ Using sprites (images)!")
     except Exception:
         # If images aren't found, we'll use shapes instead
-        print("⚠️  Images not found, using shapes instead")
+        log.warning("⚠️  Images not found, using shapes instead")
         USE_SPRITES = False
 
 if not USE_SPRITES:
@@ -71,6 +116,59 @@ if not USE_SPRITES:
 # Keep track of how many coins the player has collected
 score = 0  # Start with 0 points
 
+if USE_HUD_CACHE:
+    # Advanced: remembers the pictures of our text so we don't redraw them every frame
+    from gamekit.hud import Hud
+
+    hud = Hud()
+
+if USE_COIN_ARENA:
+    # Advanced: a world 5 times bigger than the window, full of coins! A "grid"
+    # remembers which coins are in which square of the arena, so we only look
+    # at the coins near the player (or on screen), never all of them. The
+    # camera follows the player and says which part of the arena to show.
+    # (gamekit/coin_arena.py and gamekit/camera.py)
+    from gamekit.camera import Camera
+    from gamekit.coin_arena import CoinArena
+
+    arena = CoinArena(width=4000, height=4000, coins=ARENA_COINS)
+    camera = Camera(WIDTH, HEIGHT, arena.width, arena.height)
+    player.center = (arena.width // 2, arena.height // 2)  # Start in the middle
+
+    def draw_arena():
+        """Draw the coins on screen, the player, and an arrow to the nearest coin."""
+        cam_x, cam_y = camera.follow(player)
+        camera.new_frame()
+        for gold in camera.visible(arena):  # Only the coins the window can see
+            x, y = gold.center
+            screen.draw.filled_circle((x - cam_x, y - cam_y), 12, (250, 210, 80))
+
+        # The player's arena position, moved to where it is in the window
+        if USE_SPRITES:
+            player.x, player.y = player.x - cam_x, player.y - cam_y
+            player.draw()
+            player.x, player.y = player.x + cam_x, player.y + cam_y
+        else:
+            screen.draw.filled_rect(player.move(-cam_x, -cam_y), (90, 150, 255))
+
+        # Compass: a short line pointing from the player to the nearest coin
+        line = compass_line()
+        if line is not None:
+            screen.draw.line(*line, (255, 255, 0))
+
+    def compass_line():
+        """The compass's (start, end) in the window, or None if there are no coins."""
+        nearest = arena.nearest(player.centerx, player.centery)
+        if nearest is None:
+            return None
+        dx = nearest.center[0] - player.centerx
+        dy = nearest.center[1] - player.centery
+        distance = max(1, (dx * dx + dy * dy) ** 0.5)
+        start = camera.to_screen(player.centerx, player.centery)
+        end = (start[0] + 40 * dx / distance, start[1] + 40 * dy / distance)
+        return start, end
+
+
 # ========================================
 # GAME FUNCTIONS
 # ========================================
@@ -98,7 +196,9 @@ def draw():
         screen.fill((20, 24, 34))  # Dark blue background (Red=20, Green=24, Blue=34)
 
     # Draw the game objects (player and coin)
-    if USE_SPRITES:
+    if USE_COIN_ARENA:
+        draw_arena()  # Only the coins the window can see — not all 5000!
+    elif USE_SPRITES:
         # If using images, just tell them to draw themselves
         player.draw()  # Draw the player image
         coin.draw()  # Draw the coin image
@@ -114,14 +214,17 @@ def draw():
         # (250, 210, 80) = Gold color (Red=250, Green=210, Blue=80)
         screen.draw.filled_circle(coin.center, 12, (250, 210, 80))
 
+    # draw_text is screen.draw.text — or the cached version if USE_HUD_CACHE is on
+    draw_text = hud.text if USE_HUD_CACHE else screen.draw.text
+
     # Show the score on screen
     # (10, 10) = position in top-left corner
     # color="white" = white text
-    screen.draw.text(f"Score: {score}", (10, 10), color="white")
+    draw_text(f"Score: {score}", (10, 10), color="white")
 
     # Show which mode we're in (sprites or shapes)
     mode_text = f"Mode: {'Sprites' if USE_SPRITES else 'Shapes'}"
-    screen.draw.text(mode_text, (10, 30), color="yellow")
+    draw_text(mode_text, (10, 30), color="yellow")
 
 
 def update():
@@ -149,7 +252,11 @@ def update():
         player.y = player.y + speed
 
     # Keep player inside the game window (so they can't go off-screen)
-    if USE_SPRITES:
+    if USE_COIN_ARENA:
+        # In the arena, the edges are the ARENA's edges (it's bigger than the window)
+        player.left = max(0, min(player.left, arena.width - player.width))
+        player.top = max(0, min(player.top, arena.height - player.height))
+    elif USE_SPRITES:
         # For sprites, we use the full window size
         player.x = max(
             0, min(player.x, WIDTH)
@@ -166,17 +273,28 @@ def update():
 
     # Check if player touched the coin (collision detection)
     # colliderect() returns True if two rectangles overlap
-    if player.colliderect(coin):
+    if USE_COIN_ARENA:
+        # Advanced: the grid hands us just the coins near the player to check
+        for touched in arena.touching(player):
+            score += 1
+            move_coin_to_new_position(touched)
+    elif player.colliderect(coin):
         score += 1  # Increase score by 1
         move_coin_to_new_position()  # Move coin to a new spot
 
 
-def move_coin_to_new_position():
+def move_coin_to_new_position(which=None):
     """
     This function moves the coin to a new position when it's collected.
     It's like a helper function - it does one specific job.
+    (In the coin arena, `which` says which of the coins was collected.)
     """
-    if USE_RANDOM_MOVEMENT:
+    if USE_COIN_ARENA:
+        # Advanced: instead of a random spot, ask the grid for the emptiest
+        # square of the arena, so coins spread back into the parts you cleared
+        arena.respawn(which)
+        log.debug("🎯 Coin respawned at (%s, %s)", which.left, which.top)
+    elif USE_RANDOM_MOVEMENT:
         # Advanced: Move coin randomly anywhere on screen
         if USE_SPRITES:
             # For sprites, keep them away from the edges
@@ -186,15 +304,70 @@ def move_coin_to_new_position():
             # For rectangles, account for their size
             coin.x = random.randint(0, WIDTH - coin.w)  # Random X position
             coin.y = random.randint(0, HEIGHT - coin.h)  # Random Y position
-        print("🎯 Coin moved to random position!")
+        log.info("🎯 Coin moved to random position!")
     else:
         # Basic: Move coin only on X-axis (horizontal movement)
         # This formula moves the coin 160 pixels to the right, then wraps around
         # % (modulo) operator gives us the remainder after division
         # This makes the coin "wrap around" to the left side when it goes off the right edge
         coin.x = (coin.x + 160) % (WIDTH - coin.w)
-        print("➡️  Coin moved horizontally!")
-
+        log.info("➡️  Coin moved horizontally!")
+
+
+if USE_DIRTY_RECTS:
+    # Advanced: most of the screen looks the same every frame! This runs draw()
+    # only where something moved or changed, and skips the rest. (gamekit/dirty.py)
+    from gamekit.dirty import DirtyRects, bounds
+
+    def changed_regions():
+        """Everything that can change: where it is, and what it looks like."""
+        if USE_COIN_ARENA:
+            return arena_regions()
+        return {
+            "background": ((0, 0, WIDTH, HEIGHT), USE_BACKGROUND),
+            "player": (bounds(player), None),
+            "coin": (bounds(coin), None),
+            "hud": ((0, 0, 260, 60), score),  # The text changes when the score does
+        }
+
+    def arena_regions():
+        """
+        The coin arena's regions, in WINDOW positions (where draw_arena()
+        paints them). The coins scroll whenever the camera moves, and a coin
+        vanishes and pops up somewhere else whenever one is collected (the
+        score goes up), so either one repaints everything.
+        """
+        cam_x, cam_y = camera.follow(player)
+        left, top, width, height = bounds(player)
+        regions = {
+            "background": (
+                (0, 0, WIDTH, HEIGHT),
+                (USE_BACKGROUND, cam_x, cam_y, score),
+            ),
+            "player": ((left - cam_x, top - cam_y, width, height), None),
+            "hud": ((0, 0, 260, 60), score),
+        }
+        line = compass_line()
+        if line is not None:
+            (x1, y1), (x2, y2) = line
+            # A little extra all round: the line's ends are rounded to pixels
+            x, y = int(min(x1, x2)) - 2, int(min(y1, y2)) - 2
+            size = (int(abs(x2 - x1)) + 5, int(abs(y2 - y1)) + 5)
+            regions["compass"] = ((x, y, *size), None)
+        return regions
+
+    dirty_rects = DirtyRects(changed_regions)
+    draw = dirty_rects.wrap(draw)
+
+if USE_FIXED_TIMESTEP:
+    # Advanced: Pygame Zero calls update() once per frame, so a slow computer
+    # makes a slow game. This runs our update() TICK_RATE times a second of
+    # real time instead, and draw() slides the player smoothly between
+    # updates. (The coin jumps, so it isn't slid.) See gamekit/timestep.py.
+    from gamekit.timestep import FixedTimestep
+
+    timestep = FixedTimestep(update, TICK_RATE, tracked=lambda: (player, coin))
+    update, draw = timestep.wrap(draw)
 
 # ========================================
 # INSTRUCTIONS FOR KIDS:
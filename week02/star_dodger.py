@@ -30,8 +30,18 @@ FOR: Python for Kids Course - Week 02
 # ========================================
 # These lines bring in code that other people wrote for us to use
 import random  # For creating random numbers (asteroid positions, starfield)
+import sys  # Lets us tell Python where to find our shared helpers
+from pathlib import Path  # For working with file and folder paths
 
-import pgzrun  # The game engine that handles drawing, input, etc.
+# Let Python find the shared "gamekit" folder that sits next to week01/ and week02/
+# (This must come BEFORE "import pgzrun", because pgzrun changes __file__.)
+GAME_FOLDER = Path(__file__).resolve().parent  # The folder this file is in
+sys.path.insert(0, str(GAME_FOLDER.parent))
+
+import pgzrun  # noqa: E402  The game engine that handles drawing, input, etc.
+
+# Our shared helper for printing game messages (see LOG_LEVEL below)
+from gamekit.log import configure_logging  # noqa: E402
 
 # ========================================
 # GAME SETTINGS - Change these to unlock features!
@@ -45,6 +55,38 @@ USE_INCREASING_DIFFICULTY = False  # True = asteroids get faster as score goes u
 USE_INVINCIBILITY = False  # Set to True to get a brief shield after being hit
 
 ASTEROID_SPEED = 3  # How fast asteroids fall (try 1, 5, or 8!)
+STAR_COUNT = 80  # How many background stars to twinkle (try 20 or 300!)
+
+# ========================================
+# PERFORMANCE SETTINGS - For advanced pilots!
+# ========================================
+# These don't change the rules of the game — they change HOW the computer
+# does the work, so the game stays smooth with thousands of objects.
+
+USE_ASTEROID_POOL = False  # True = keep asteroids in fast arrays (for 1000s of them!)
+USE_BROADPHASE = False  # True = only check collisions for objects NEAR the player
+USE_STARFIELD_CACHE = False  # True = paint the starry sky once, then reuse the picture
+USE_PARALLAX_STARS = False  # True = a scrolling sky of 20,000+ stars, in layers
+USE_CAMERA_CULLING = False  # True = only draw what's on screen (and count the rest)
+USE_BATCHED_DRAW = False  # True = draw each layer of asteroids/stars in ONE blit call
+USE_HUD_CACHE = False  # True = remember drawn text and reuse it (gamekit/hud.py)
+USE_OBJECT_POOL = False  # True = reuse removed asteroids/stars (gamekit/object_pool.py)
+OBJECT_POOL_SIZE = 50  # With USE_OBJECT_POOL: spares to build before the game starts
+USE_FIXED_TIMESTEP = False  # True = update() runs TICK_RATE times a second, always
+TICK_RATE = 60  # With USE_FIXED_TIMESTEP: game updates per second
+USE_TIMER_WHEEL = False  # True = timers count game updates, not seconds
+USE_SPAWN_DIRECTOR = False  # True = asteroids come in planned waves
+USE_ASSET_CACHE = False  # True = load every image once, at the start
+USE_PROFILER = False  # True = time each part of every frame (press P to see it)
+PROFILE_FILE = "profile.json"  # With USE_PROFILER: the timings are saved here on exit
+
+# How chatty the console is: "DEBUG" = every list change, "INFO" = game events
+# only (hits, bonus stars...), "OFF" = silent, which makes the game fastest.
+LOG_LEVEL = "DEBUG"
+
+# 📝 The game's messages go through a "logger" instead of print(). It only
+# builds a message if it will be shown, and it skips repeats that come too fast.
+log = configure_logging("star_dodger", LOG_LEVEL)
 
 # ========================================
 # GAME VARIABLES
@@ -54,14 +96,25 @@ ASTEROID_SPEED = 3  # How fast asteroids fall (try 1, 5, or 8!)
 # Game window size (how big the game window will be)
 WIDTH, HEIGHT = 800, 600  # 800 pixels wide, 600 pixels tall
 
+if USE_ASSET_CACHE and USE_SPRITES:
+    # Advanced: load every picture in images/ right now, and decide ONCE if we
+    # have all three. If one is missing, every spawn would otherwise search
+    # for it again (and fail) before falling back to a shape.
+    from gamekit.assets import Assets
+
+    assets = Assets(GAME_FOLDER / "images", load=images.load).preload()
+    if not assets.has("spaceship", "asteroid", "star"):
+        log.warning("⚠️  Some images are missing, using shapes for everything")
+        USE_SPRITES = False
+
 # --- Player Setup ---
 # Same pattern as Week 01: try to use images, fall back to shapes if not found
 if USE_SPRITES:
     try:
         player = Actor("spaceship", (WIDTH // 2, HEIGHT - 60))
-        print("✅ Using spaceship sprite!")
+        log.info("✅ Using spaceship sprite!")
     except Exception:
-        print("⚠️  Spaceship image not found, using shapes instead")
+        log.warning("⚠️  Spaceship image not found, using shapes instead")
         USE_SPRITES = False
 
 if not USE_SPRITES:
@@ -76,10 +129,26 @@ if not USE_SPRITES:
 # Think of it like a backpack — you can put things in and take things out.
 asteroids = []  # Empty list — asteroids will be added by spawn_asteroid()
 
+if USE_ASTEROID_POOL:
+    # Advanced: a list-like "pool" that keeps asteroid positions in arrays,
+    # so update() can move and check ALL of them in one step.
+    from gamekit.asteroid_pool import AsteroidPool
+
+    asteroids = AsteroidPool(whole_pixels=not USE_SPRITES)  # Rects: whole pixels
+
 # --- Bonus Stars List ---
 # Same idea! A separate list for collectible bonus stars.
 bonus_stars = []  # Empty list — stars will be added by spawn_bonus_star()
 
+if USE_BROADPHASE:
+    # Advanced: a grid that remembers which asteroids/stars are in which
+    # part of the screen, so we only check the ones close to the player.
+    # Everything in it falls together, so the grid moves them all at once.
+    from gamekit.broadphase import FallingGrid
+
+    asteroid_grid = FallingGrid(cell_size=64)
+    bonus_star_grid = FallingGrid(cell_size=64)
+
 # --- Starfield Background ---
 # Let's use a list + for loop to create a starry night sky!
 # This is a gentle first look at how lists and for loops work together.
@@ -87,16 +156,143 @@ bonus_stars = []  # Empty list — stars will be added by spawn_bonus_star()
 background_stars = []  # Start with an empty list
 
 # 🆕 NEW CONCEPT: FOR LOOPS!
-# This loop runs 80 times. Each time, it creates a star and adds it to the list.
-# Without a loop, we'd need to write 80 lines of code! 😵
-for i in range(80):  # i goes from 0 to 79
+# This loop runs STAR_COUNT times (80 to start). Each time, it creates a star
+# and adds it to the list. Without a loop, we'd need to write 80 lines of code! 😵
+for i in range(STAR_COUNT):  # i goes from 0 to STAR_COUNT - 1
     star_x = random.randint(0, WIDTH)  # Random x position
     star_y = random.randint(0, HEIGHT)  # Random y position
     star_size = random.randint(1, 3)  # Random size (1, 2, or 3 pixels)
     # append() adds the star to the END of the list — like putting it in a backpack!
     background_stars.append((star_x, star_y, star_size))
 
-print(f"✨ Created {len(background_stars)} background stars using a list + for loop!")
+log.debug(
+    "✨ Created %s background stars using a list + for loop!", len(background_stars)
+)
+
+if USE_STARFIELD_CACHE:
+    # Advanced: paint all the stars into one picture the first time we draw,
+    # then reuse that picture every frame instead of drawing each star again.
+    from gamekit.starfield import StarfieldCache
+
+    starfield = StarfieldCache(background=(10, 10, 30))
+
+if USE_PARALLAX_STARS:
+    # Advanced: a sky that scrolls past in three layers (far stars slowly,
+    # near ones faster), with over 20,000 stars. Each layer is a picture
+    # that just gets slid along, so drawing it is still only a few blits.
+    from gamekit.starfield import ParallaxStarfield
+
+    sky = ParallaxStarfield(WIDTH, HEIGHT, background=(10, 10, 30))
+
+if USE_HUD_CACHE:
+    # Advanced: remembers the pictures of our text so we don't redraw them every frame
+    from gamekit.hud import Hud
+
+    hud = Hud()
+
+if USE_OBJECT_POOL:
+    # Advanced: removed asteroids and stars go into a "free list", and
+    # spawning takes one back out instead of building a brand-new one.
+    from gamekit.object_pool import ObjectPool
+
+    def make_falling_object(image, size):
+        """Build one asteroid or star, the same way the spawn functions do."""
+        if USE_SPRITES:
+            try:
+                return Actor(image)
+            except Exception:
+                pass  # If image not found, use a shape instead
+        return Rect((0, 0), (size, size))
+
+    def place_at_top(thing, x):
+        """Move a recycled asteroid or star back above the top of the screen."""
+        if hasattr(thing, "pos"):
+            thing.pos = (x, -20)  # Actor (sprite) — set the center position
+        else:
+            thing.topleft = (
+                x - thing.w // 2,
+                -20,
+            )  # Rect (shape) — the top-left corner
+
+    asteroid_recycler = ObjectPool(
+        lambda: make_falling_object("asteroid", 30),
+        place_at_top,
+        prewarm=OBJECT_POOL_SIZE,
+    )
+    star_recycler = ObjectPool(
+        lambda: make_falling_object("star", 20),
+        place_at_top,
+        prewarm=OBJECT_POOL_SIZE if USE_BONUS_STARS else 0,
+    )
+
+if USE_PROFILER:
+    # Advanced: time each part of update() and draw() to see what's slow.
+    # lap("movement") means "the time since the last lap was spent moving".
+    import atexit
+
+    from gamekit.profiler import FrameProfiler
+
+    profiler = FrameProfiler()
+    atexit.register(profiler.dump, PROFILE_FILE)  # Save the timings on exit
+    lap = profiler.lap
+else:
+
+    def lap(phase):
+        """USE_PROFILER is off, so there's nothing to time."""
+
+
+if USE_TIMER_WHEEL:
+    # Advanced: timers that count update() calls ("ticks") instead of real
+    # seconds, TICK_RATE ticks to a second. They stay in step with the game
+    # even when the computer is slow, and the headless StarDodgerSim uses
+    # the very same kind of timers. (gamekit/timer_wheel.py)
+    from gamekit.timer_wheel import TickClock
+
+    timers = TickClock(TICK_RATE)
+else:
+    timers = clock  # Pygame Zero's clock, which counts real seconds
+
+if USE_SPAWN_DIRECTOR:
+    # Advanced: instead of one asteroid every 1.5 seconds, plan whole WAVES
+    # ahead of time (a calm one, then lines, then a snake sweeping across).
+    # update() just takes the spawns that are due. (gamekit/spawn_director.py)
+    from gamekit.spawn_director import DifficultyCurve, SpawnDirector, Wave
+
+    director = SpawnDirector(
+        [
+            Wave(duration=10, every=1.5, star_every=4.0 if USE_BONUS_STARS else 0),
+            Wave(duration=4, every=0.75, burst=4, pattern="line"),
+            Wave(duration=5, every=0.1, pattern="sweep", speed=0.8),
+        ],
+        width=WIDTH,
+        tick_rate=TICK_RATE,
+        curve=DifficultyCurve(
+            base_speed=ASTEROID_SPEED,
+            speed_step=0.5 if USE_INCREASING_DIFFICULTY else 0,
+            gap_step=0.05 if USE_INCREASING_DIFFICULTY else 0,
+        ),
+    )
+
+if USE_CAMERA_CULLING:
+    # Advanced: a "camera" that knows which part of the world is on screen,
+    # so draw() can skip everything that isn't. It counts how many things it
+    # drew and how many it skipped ("culled"). Here the world IS the window,
+    # so it skips the asteroids still waiting above the top or already gone
+    # past the bottom; in a bigger world (like Gold Collector's coin arena)
+    # it skips almost everything. (gamekit/camera.py)
+    from gamekit.camera import Camera
+
+    camera = Camera(WIDTH, HEIGHT, world_width=WIDTH, world_height=HEIGHT)
+
+if USE_BATCHED_DRAW:
+    # Advanced: draw the asteroid and star shapes ONCE, as little "stamps",
+    # then every frame collect where each one goes and hand the whole list
+    # to pygame in a single blits() call. (gamekit/batch.py)
+    from gamekit.batch import SpriteBatch, Stamp
+
+    asteroid_stamp = Stamp.circle(15, (160, 160, 160), outline=(100, 100, 100))
+    star_stamp = Stamp.circle(10, (255, 255, 50))
+    batch = SpriteBatch()
 
 # --- Game State ---
 score = 0  # Points earned by surviving and collecting stars
@@ -112,20 +308,24 @@ invincible_timer = 0  # Counts frames of invincibility (for the flash effect)
 # Functions are like recipes — they contain instructions for specific tasks
 
 
-def spawn_asteroid():
+def spawn_asteroid(x=None):
     """
     Create a new asteroid at a random position along the top of the screen
     and add it to the asteroids list.
 
     This is called automatically by clock.schedule_interval() every 1.5 seconds.
+    (With USE_SPAWN_DIRECTOR, update() calls it and says where: x.)
     """
     if game_over:
         return  # Don't spawn asteroids if the game is over
 
     # Pick a random x position along the top
-    x = random.randint(30, WIDTH - 30)
+    if x is None:
+        x = random.randint(30, WIDTH - 30)
 
-    if USE_SPRITES:
+    if USE_OBJECT_POOL:
+        asteroid = asteroid_recycler.acquire(x)  # Reuse an old asteroid if there is one
+    elif USE_SPRITES:
         try:
             asteroid = Actor("asteroid", (x, -20))  # Start above the screen
         except Exception:
@@ -137,10 +337,13 @@ def spawn_asteroid():
     # 🆕 append() adds the asteroid to the END of our list
     # It's like putting a new item in your backpack!
     asteroids.append(asteroid)
-    print(f"📦 asteroids.append(asteroid) → list now has {len(asteroids)} item(s)")
+    log.debug("📦 asteroids.append(asteroid) → list now has %s item(s)", len(asteroids))
 
+    if USE_BROADPHASE and not USE_ASTEROID_POOL:  # (the pool checks collisions itself)
+        asteroid_grid.insert(asteroid)
 
-def spawn_bonus_star():
+
+def spawn_bonus_star(x=None):
     """
     Create a bonus star at a random position along the top.
     Stars are worth +5 points when collected!
@@ -149,9 +352,12 @@ def spawn_bonus_star():
     if game_over or not USE_BONUS_STARS:
         return
 
-    x = random.randint(30, WIDTH - 30)
+    if x is None:
+        x = random.randint(30, WIDTH - 30)
 
-    if USE_SPRITES:
+    if USE_OBJECT_POOL:
+        star = star_recycler.acquire(x)  # Reuse an old star if there is one
+    elif USE_SPRITES:
         try:
             star = Actor("star", (x, -20))
         except Exception:
@@ -160,7 +366,10 @@ def spawn_bonus_star():
         star = Rect((x - 10, -20), (20, 20))
 
     bonus_stars.append(star)
-    print(f"📦 bonus_stars.append(star) → list now has {len(bonus_stars)} item(s)")
+    log.debug("📦 bonus_stars.append(star) → list now has %s item(s)", len(bonus_stars))
+
+    if USE_BROADPHASE:
+        bonus_star_grid.insert(star)
 
 
 def get_asteroid_speed():
@@ -173,6 +382,8 @@ def get_asteroid_speed():
 
     If USE_INCREASING_DIFFICULTY is True, asteroids get faster as score goes up!
     """
+    if USE_SPAWN_DIRECTOR:
+        return director.speed  # The speed of the wave that's running now
     if USE_INCREASING_DIFFICULTY:
         # Every 10 points, asteroids get 0.5 pixels/frame faster
         # But never faster than 10 (that would be impossibly fast!)
@@ -198,13 +409,24 @@ def reset_game():
     invincible = False
     invincible_timer = 0
 
+    if USE_OBJECT_POOL:
+        # Hand every asteroid and star back to the recyclers before clearing
+        asteroid_recycler.release_all(asteroids)
+        star_recycler.release_all(bonus_stars)
+        log.debug("♻️  Asteroid recycler: %s", asteroid_recycler.stats())
+        log.debug("♻️  Star recycler: %s", star_recycler.stats())
+
     # .clear() removes ALL items from a list — like emptying your backpack!
-    print(f"🧹 asteroids.clear() — removing {len(asteroids)} item(s)...")
+    log.debug("🧹 asteroids.clear() — removing %s item(s)...", len(asteroids))
     asteroids.clear()
-    print(f"   → asteroids is now: {asteroids}")  # Prints [] (empty list!)
-    print(f"🧹 bonus_stars.clear() — removing {len(bonus_stars)} item(s)...")
+    log.debug("   → asteroids is now: %s", asteroids)  # Shows [] (empty list!)
+    log.debug("🧹 bonus_stars.clear() — removing %s item(s)...", len(bonus_stars))
     bonus_stars.clear()
-    print(f"   → bonus_stars is now: {bonus_stars}")
+    log.debug("   → bonus_stars is now: %s", bonus_stars)
+
+    if USE_BROADPHASE:
+        asteroid_grid.clear()
+        bonus_star_grid.clear()
 
     # Reset player position to center-bottom
     if hasattr(player, "pos"):
@@ -216,7 +438,177 @@ def reset_game():
         player.x = WIDTH // 2 - 20
         player.y = HEIGHT - 70
 
-    print("🔄 Game reset! Good luck!")
+    if USE_HUD_CACHE:
+        log.debug("📊 HUD text cache: %s", hud.stats())
+
+    if USE_SPAWN_DIRECTOR:
+        director.reset()  # Start again from the first (calm) wave
+
+    log.info("🔄 Game reset! Good luck!")
+
+
+def player_hit():
+    """
+    The player just got hit by an asteroid: lose a life, and then either
+    end the game or (if enabled) turn on the shield.
+    """
+    global lives, game_over, invincible, invincible_timer
+
+    lives -= 1
+    log.info("💥 Hit! Lives remaining: %s", lives)
+
+    if lives <= 0:
+        game_over = True
+        log.info("💀 Game Over! Final score: %s", score)
+    elif USE_INVINCIBILITY:
+        # Turn on the shield!
+        invincible = True
+        invincible_timer = 0
+        # clock.schedule_unique() sets a one-time timer.
+        # "unique" means it replaces any existing timer for this function
+        # (prevents stacking if you get hit twice quickly)
+        timers.schedule_unique(end_invincibility, 2.0)
+        log.info("🛡️  Shield activated for 2 seconds!")
+
+
+def update_asteroid_pool(current_speed):
+    """
+    The USE_ASTEROID_POOL version of the asteroid loops in update().
+    Same rules, but the pool moves, culls and collides every asteroid at once.
+    """
+    global score
+
+    asteroids.move(current_speed)  # Move EVERY asteroid down in one step
+    lap("movement")
+
+    # ONE pass over the pool finds both: asteroids off the bottom, and the
+    # (other) asteroids touching the player. Both are lists of positions.
+    # (Like asteroid.y in update(): an Actor's y is its center, a Rect's its top)
+    dodged, touching = asteroids.collide(player, HEIGHT + 30, center=USE_SPRITES)
+    score += len(dodged)  # +1 point for each asteroid you dodge!
+    lap("culling")  # (collide() does the collision tests too)
+
+    hits = []
+    for index in touching:
+        if invincible:
+            break  # The shield is up — the other asteroids can't hurt us
+        hits.append(index)
+        player_hit()
+    lap("collision")
+
+    removed = asteroids.remove_at(dodged + hits)
+    if USE_OBJECT_POOL:
+        asteroid_recycler.release_all(removed)
+    lap("removal")
+
+    if dodged:
+        log.info(
+            "✅ Dodged %s asteroid(s)! +%s pts (score: %s)",
+            len(dodged),
+            len(dodged),
+            score,
+        )
+    if removed:
+        log.debug(
+            "🗑️  asteroids.remove_at() × %s → pool now has %s item(s)",
+            len(removed),
+            len(asteroids),
+        )
+    lap("logging")
+
+
+def move_in_grid(items, grid, dy, off_screen_y):
+    """
+    USE_BROADPHASE helper: move every item down by dy. Returns two lists:
+    items that fell below off_screen_y, and items touching the player.
+    Only grid cells near the player (and below the screen) are checked!
+    """
+    for item in items:
+        item.y += dy  # So draw() shows them in the right place...
+    grid.fall(dy)  # ...but the grid moves them ALL with one addition
+
+    # Broad phase: ask the grid what's in the thin strip that items just
+    # fell into (nothing moved further than dy, and the rest are gone)...
+    below = grid.query_area(0, off_screen_y, WIDTH, dy + 1)
+    off_screen = [item for item in below if item.y > off_screen_y]
+
+    # ...and what's in the cells around the player. Narrow phase: colliderect().
+    touching = [item for item in grid.query(player) if player.colliderect(item)]
+    return off_screen, touching
+
+
+def remove_from_grid(items, grid, fell_off, hit):
+    """Take the items that fell off (or hit something) out of the list and grid."""
+    for item in fell_off + hit:
+        grid.remove(item)
+    # Everything starts at the same height and falls at the same speed, so
+    # the list is oldest first: the ones that fell off are at the very front
+    del items[: len(fell_off)]
+    for item in hit:
+        items.remove(item)
+
+
+def update_asteroid_grid(current_speed):
+    """
+    The USE_BROADPHASE version of the asteroid loops in update().
+    Same rules, but collisions are only checked near the player.
+    """
+    global score
+
+    dodged, touching = move_in_grid(
+        asteroids, asteroid_grid, current_speed, HEIGHT + 30
+    )
+    score += len(dodged)  # +1 point for each asteroid you dodge!
+    lap("movement")  # (move_in_grid() also does the culling and grid lookups)
+
+    hits = []
+    for asteroid in touching:
+        if invincible:
+            break  # The shield is up — the other asteroids can't hurt us
+        hits.append(asteroid)
+        player_hit()
+    lap("collision")
+
+    remove_from_grid(asteroids, asteroid_grid, dodged, hits)
+    if USE_OBJECT_POOL:
+        asteroid_recycler.release_all(dodged + hits)
+    lap("removal")
+
+    if dodged:
+        log.info(
+            "✅ Dodged %s asteroid(s)! +%s pts (score: %s)",
+            len(dodged),
+            len(dodged),
+            score,
+        )
+    if dodged or hits:
+        log.debug(
+            "🗑️  asteroids removed × %s → list now has %s item(s)",
+            len(dodged) + len(hits),
+            len(asteroids),
+        )
+    lap("logging")
+
+
+def update_bonus_star_grid():
+    """The USE_BROADPHASE version of the bonus star loops in update()."""
+    global score
+
+    fallen, collected = move_in_grid(bonus_stars, bonus_star_grid, 2, HEIGHT + 20)
+    for star in collected:
+        score += 5  # Bonus stars are worth 5 points!
+        log.info("⭐ Bonus star collected! +5 points! Score: %s", score)
+
+    remove_from_grid(bonus_stars, bonus_star_grid, fallen, collected)
+    if USE_OBJECT_POOL:
+        star_recycler.release_all(fallen + collected)
+
+    if fallen or collected:
+        log.debug(
+            "🗑️  bonus_stars removed × %s → list now has %s item(s)",
+            len(fallen) + len(collected),
+            len(bonus_stars),
+        )
 
 
 def end_invincibility():
@@ -230,7 +622,7 @@ def end_invincibility():
     """
     global invincible
     invincible = False
-    print("🛡️  Shield expired!")
+    log.info("🛡️  Shield expired!")
 
 
 def draw_player():
@@ -263,20 +655,40 @@ def draw():
     everything on screen. Like a painter who repaints the entire picture
     over and over, super fast.
     """
-    # Clear the screen with dark space color
-    screen.fill((10, 10, 30))  # Very dark blue, almost black — like space!
+    if USE_PROFILER:
+        profiler.start("draw")
+    if USE_CAMERA_CULLING:
+        camera.new_frame()  # Start counting drawn and culled things again
+
+    if USE_PARALLAX_STARS:
+        sky.draw(screen.surface)  # A few blits, however many stars there are
+    elif USE_STARFIELD_CACHE:
+        # Advanced: the space color AND every star are already painted into
+        # one picture, so the whole background is a single blit!
+        screen.blit(starfield.surface(background_stars, WIDTH, HEIGHT), (0, 0))
+    else:
+        # Clear the screen with dark space color
+        screen.fill((10, 10, 30))  # Very dark blue, almost black — like space!
 
-    # --- Draw the starfield background ---
-    # 🆕 This for loop goes through EVERY star in our background_stars list.
-    # Each star is a tuple: (x, y, size)
-    for bg_star in background_stars:
-        x, y, size = bg_star  # "Unpack" the tuple into three variables
-        screen.draw.filled_circle((x, y), size, (255, 255, 255))  # White dots
+        # --- Draw the starfield background ---
+        # 🆕 This for loop goes through EVERY star in our background_stars list.
+        # Each star is a tuple: (x, y, size)
+        for bg_star in background_stars:
+            x, y, size = bg_star  # "Unpack" the tuple into three variables
+            screen.draw.filled_circle((x, y), size, (255, 255, 255))  # White dots
+    lap("background")
 
     # --- Draw asteroids ---
     # 🆕 Another for loop! This one draws every asteroid in the asteroids list.
     # Whether there are 0 asteroids or 100, this SAME code handles them all!
-    for asteroid in asteroids:
+    # (With USE_CAMERA_CULLING, only the ones the camera can see.)
+    on_screen = camera.visible(asteroids) if USE_CAMERA_CULLING else asteroids
+    if USE_BATCHED_DRAW:
+        # Collect every asteroid's picture and position, then ONE blits() call
+        batch.add_all(on_screen, asteroid_stamp)
+        batch.draw(screen.surface)
+        on_screen = []  # Already drawn, so the loop below has nothing to do
+    for asteroid in on_screen:
         if hasattr(asteroid, "draw"):
             asteroid.draw()  # Sprites draw themselves
         else:
@@ -284,15 +696,22 @@ def draw():
             screen.draw.filled_circle(asteroid.center, 15, (160, 160, 160))
             # Darker outline to make it look more like a rock
             screen.draw.circle(asteroid.center, 15, (100, 100, 100))
+    lap("asteroids")
 
     # --- Draw bonus stars ---
     if USE_BONUS_STARS:
-        for star in bonus_stars:
+        on_screen = camera.visible(bonus_stars) if USE_CAMERA_CULLING else bonus_stars
+        if USE_BATCHED_DRAW:
+            batch.add_all(on_screen, star_stamp)
+            batch.draw(screen.surface)
+            on_screen = []
+        for star in on_screen:
             if hasattr(star, "draw"):
                 star.draw()
             else:
                 # Draw a bright yellow circle for each star
                 screen.draw.filled_circle(star.center, 10, (255, 255, 50))
+    lap("stars")
 
     # --- Draw the player ---
     if invincible and invincible_timer % 6 < 3:
@@ -301,16 +720,20 @@ def draw():
         pass
     else:
         draw_player()
+    lap("player")
 
     # --- Draw the HUD (Heads-Up Display) ---
+    # draw_text is screen.draw.text — or the cached version if USE_HUD_CACHE is on
+    draw_text = hud.text if USE_HUD_CACHE else screen.draw.text
+
     # Score in top-left
-    screen.draw.text(f"Score: {score}", (10, 10), color="white", fontsize=30)
+    draw_text(f"Score: {score}", (10, 10), color="white", fontsize=30)
 
     # Lives counter
-    screen.draw.text(f"Lives: {lives}", (10, 40), color="red", fontsize=24)
+    draw_text(f"Lives: {lives}", (10, 40), color="red", fontsize=24)
 
     # Show asteroid count (watch the list grow and shrink in real time!)
-    screen.draw.text(
+    draw_text(
         f"Asteroids on screen: {len(asteroids)}",
         (10, 70),
         color="gray",
@@ -320,11 +743,15 @@ def draw():
     # Show current speed (useful when increasing difficulty is on)
     if USE_INCREASING_DIFFICULTY:
         speed_text = f"Speed: {get_asteroid_speed():.1f}"
-        screen.draw.text(speed_text, (10, 90), color="cyan", fontsize=18)
+        draw_text(speed_text, (10, 90), color="cyan", fontsize=18)
 
     # Show mode in top-right
     mode_text = f"Mode: {'Sprites' if USE_SPRITES else 'Shapes'}"
-    screen.draw.text(mode_text, (WIDTH - 180, 10), color="yellow", fontsize=18)
+    draw_text(mode_text, (WIDTH - 180, 10), color="yellow", fontsize=18)
+
+    if USE_CAMERA_CULLING:
+        cull_text = f"Drawn: {camera.drawn}  Culled: {camera.culled}"
+        draw_text(cull_text, (10, 110), color="gray", fontsize=18)
 
     # --- Game Over Screen ---
     if game_over:
@@ -333,24 +760,39 @@ def draw():
         screen.draw.filled_rect(box, (0, 0, 0))
         screen.draw.rect(box, (255, 50, 50))  # Red border
 
-        screen.draw.text(
+        draw_text(
             "GAME OVER",
             center=(WIDTH // 2, HEIGHT // 2 - 40),
             color="red",
             fontsize=60,
         )
-        screen.draw.text(
+        draw_text(
             f"Final Score: {score}",
             center=(WIDTH // 2, HEIGHT // 2 + 10),
             color="white",
             fontsize=36,
         )
-        screen.draw.text(
+        draw_text(
             "Press SPACE to play again!",
             center=(WIDTH // 2, HEIGHT // 2 + 50),
             color="yellow",
             fontsize=24,
         )
+    lap("hud")
+
+    if USE_PROFILER:
+        profiler.stop()
+        if profiler.visible:
+            draw_profile()  # Drawn after stop(), so it doesn't time itself
+
+
+def draw_profile():
+    """USE_PROFILER: show how long each part of the frame takes (press P)."""
+    lines = profiler.lines()
+    box = Rect((WIDTH - 260, 40), (250, 16 * len(lines) + 10))
+    screen.draw.filled_rect(box, (0, 0, 0))
+    for row, line in enumerate(lines):
+        screen.draw.text(line, (WIDTH - 255, 45 + 16 * row), color="white", fontsize=16)
 
 
 def update():
@@ -359,13 +801,32 @@ def update():
     Handles movement, collisions, and all the game rules.
     """
     # We need 'global' to change these variables from inside a function.
-    # That's 4 global variables — we'll learn a cleaner way (classes) in a future week!
-    global score, lives, game_over, invincible, invincible_timer
+    # (Lives and the shield are changed by player_hit() — see above!)
+    # We'll learn a cleaner way (classes) in a future week!
+    global score, invincible_timer
+
+    if USE_TIMER_WHEEL:
+        timers.tick()  # One more tick: run any timers that are due
 
     # If the game is over, don't update anything
     if game_over:
         return
 
+    if USE_PROFILER:
+        profiler.start("update")
+
+    if USE_SPAWN_DIRECTOR:
+        # Spawn whatever the wave plan says is due this tick
+        # (Their speed isn't per asteroid: get_asteroid_speed() moves them all)
+        for x, kind in director.advance(score):
+            if kind == "asteroid":
+                spawn_asteroid(x)
+            else:
+                spawn_bonus_star(x)
+
+    if USE_PARALLAX_STARS:
+        sky.scroll(1)  # The sky drifts down past us: we're flying!
+
     # --- Player Movement ---
     speed = 5  # How fast the player moves (pixels per frame)
 
@@ -395,73 +856,77 @@ def update():
     # --- Update invincibility timer ---
     if invincible:
         invincible_timer += 1
+    lap("input")
 
     # --- Move Asteroids ---
     # 🆕 This for loop moves EVERY asteroid in the list down the screen.
     # Whether there are 2 or 200 asteroids, this SAME code handles them all!
     current_speed = get_asteroid_speed()  # Get speed (might increase with score)
 
-    for asteroid in asteroids:
-        asteroid.y += current_speed  # Move each asteroid down
+    if USE_ASTEROID_POOL:
+        # Advanced: same rules, but the pool does it all in one go
+        update_asteroid_pool(current_speed)
+    elif USE_BROADPHASE:
+        # Advanced: same rules, but only asteroids near the player are checked
+        update_asteroid_grid(current_speed)
+    else:
+        for asteroid in asteroids:
+            asteroid.y += current_speed  # Move each asteroid down
+        lap("movement")
+
+        # --- Remove off-screen objects and check collisions ---
+        # ⚠️  IMPORTANT: We can't remove items from a list WHILE we're looping through it!
+        # That would be like pulling cards from a deck while someone is counting them —
+        # it messes up the count!
+        # Instead, we make a SEPARATE list of things to remove, then remove them AFTER.
+        asteroids_to_remove = []  # Asteroids we want to take out of the list
+        dodged_count = 0  # Count how many asteroids we dodged this frame
+
+        for asteroid in asteroids:
+            # Check if asteroid has fallen off the bottom of the screen
+            if asteroid.y > HEIGHT + 30:
+                asteroids_to_remove.append(asteroid)
+                score += 1  # +1 point for each asteroid you dodge!
+                dodged_count += 1
+                continue  # Skip to the next asteroid (no need to check collision)
+
+            # Check collision with player
+            if player.colliderect(asteroid):
+                if not invincible:
+                    asteroids_to_remove.append(asteroid)
+                    player_hit()  # Lose a life (and maybe turn on the shield)
+        lap("collision")  # (this loop does the culling too)
+
+        # NOW remove the asteroids (after we're done looping through the list)
+        for asteroid in asteroids_to_remove:
+            asteroids.remove(asteroid)
+        if USE_OBJECT_POOL:
+            asteroid_recycler.release_all(asteroids_to_remove)  # Keep them for reuse!
+        lap("removal")
+
+        # Show what happened to the list this frame
+        if dodged_count > 0:
+            log.info(
+                "✅ Dodged %s asteroid(s)! +%s pts (score: %s)",
+                dodged_count,
+                dodged_count,
+                score,
+            )
+        if asteroids_to_remove:
+            log.debug(
+                "🗑️  asteroids.remove() × %s → list now has %s item(s)",
+                len(asteroids_to_remove),
+                len(asteroids),
+            )
+        lap("logging")
 
-    # --- Move Bonus Stars ---
-    if USE_BONUS_STARS:
+    # --- Move Bonus Stars and Check Collisions ---
+    if USE_BONUS_STARS and USE_BROADPHASE:
+        update_bonus_star_grid()  # Advanced: only check stars near the player
+    elif USE_BONUS_STARS:
         for star in bonus_stars:
             star.y += 2  # Stars fall slower than asteroids
 
-    # --- Remove off-screen objects and check collisions ---
-    # ⚠️  IMPORTANT: We can't remove items from a list WHILE we're looping through it!
-    # That would be like pulling cards from a deck while someone is counting them —
-    # it messes up the count!
-    # Instead, we make a SEPARATE list of things to remove, then remove them AFTER.
-    asteroids_to_remove = []  # Asteroids we want to take out of the list
-    dodged_count = 0  # Count how many asteroids we dodged this frame
-
-    for asteroid in asteroids:
-        # Check if asteroid has fallen off the bottom of the screen
-        if asteroid.y > HEIGHT + 30:
-            asteroids_to_remove.append(asteroid)
-            score += 1  # +1 point for each asteroid you dodge!
-            dodged_count += 1
-            continue  # Skip to the next asteroid (no need to check collision)
-
-        # Check collision with player
-        if player.colliderect(asteroid):
-            if not invincible:
-                lives -= 1
-                asteroids_to_remove.append(asteroid)
-                print(f"💥 Hit! Lives remaining: {lives}")
-
-                if lives <= 0:
-                    game_over = True
-                    print(f"💀 Game Over! Final score: {score}")
-                elif USE_INVINCIBILITY:
-                    # Turn on the shield!
-                    invincible = True
-                    invincible_timer = 0
-                    # clock.schedule_unique() sets a one-time timer.
-                    # "unique" means it replaces any existing timer for this function
-                    # (prevents stacking if you get hit twice quickly)
-                    clock.schedule_unique(end_invincibility, 2.0)
-                    print("🛡️  Shield activated for 2 seconds!")
-
-    # NOW remove the asteroids (after we're done looping through the list)
-    for asteroid in asteroids_to_remove:
-        asteroids.remove(asteroid)
-
-    # Show what happened to the list this frame
-    if dodged_count > 0:
-        print(
-            f"✅ Dodged {dodged_count} asteroid(s)! +{dodged_count} pts (score: {score})"
-        )
-    if asteroids_to_remove:
-        print(
-            f"🗑️  asteroids.remove() × {len(asteroids_to_remove)}"
-            f" → list now has {len(asteroids)} item(s)"
-        )
-
-    # --- Bonus Star Collisions ---
-    if USE_BONUS_STARS:
         stars_to_remove = []  # Same "to_remove" pattern as asteroids!
 
         for star in bonus_stars:
@@ -474,16 +939,23 @@ def update():
             if player.colliderect(star):
                 score += 5  # Bonus stars are worth 5 points!
                 stars_to_remove.append(star)
-                print(f"⭐ Bonus star collected! +5 points! Score: {score}")
+                log.info("⭐ Bonus star collected! +5 points! Score: %s", score)
 
         for star in stars_to_remove:
             bonus_stars.remove(star)
+        if USE_OBJECT_POOL:
+            star_recycler.release_all(stars_to_remove)
 
         if stars_to_remove:
-            print(
-                f"🗑️  bonus_stars.remove() × {len(stars_to_remove)}"
-                f" → list now has {len(bonus_stars)} item(s)"
+            log.debug(
+                "🗑️  bonus_stars.remove() × %s → list now has %s item(s)",
+                len(stars_to_remove),
+                len(bonus_stars),
             )
+    lap("bonus_stars")
+
+    if USE_PROFILER:
+        profiler.stop()
 
 
 def on_key_down(key):
@@ -495,6 +967,8 @@ def on_key_down(key):
     """
     if key == keys.SPACE and game_over:
         reset_game()
+    if USE_PROFILER and key == keys.P:
+        profiler.toggle()  # Show or hide the timings
 
 
 # ========================================
@@ -502,16 +976,33 @@ def on_key_down(key):
 # ========================================
 # 🆕 clock.schedule_interval() calls a function over and over at a set time interval.
 # This spawns a new asteroid every 1.5 seconds — try changing 1.5 to see what happens!
-clock.schedule_interval(spawn_asteroid, 1.5)
-
-# Spawn bonus stars less frequently (every 4 seconds)
-if USE_BONUS_STARS:
-    clock.schedule_interval(spawn_bonus_star, 4.0)
+# (timers is Pygame Zero's clock, unless USE_TIMER_WHEEL is on — see above.)
+# (With USE_SPAWN_DIRECTOR, the director plans the spawns instead.)
+if not USE_SPAWN_DIRECTOR:
+    timers.schedule_interval(spawn_asteroid, 1.5)
 
-print("🚀 Star Dodger loaded! Use arrow keys to dodge asteroids!")
-print(f"📋 Settings: Sprites={USE_SPRITES}, Bonus Stars={USE_BONUS_STARS}")
-print(f"📋 Difficulty={USE_INCREASING_DIFFICULTY}, Invincibility={USE_INVINCIBILITY}")
-print(f"📋 Asteroid Speed={ASTEROID_SPEED}")
+    # Spawn bonus stars less frequently (every 4 seconds)
+    if USE_BONUS_STARS:
+        timers.schedule_interval(spawn_bonus_star, 4.0)
+
+log.info("🚀 Star Dodger loaded! Use arrow keys to dodge asteroids!")
+log.info("📋 Settings: Sprites=%s, Bonus Stars=%s", USE_SPRITES, USE_BONUS_STARS)
+log.info(
+    "📋 Difficulty=%s, Invincibility=%s", USE_INCREASING_DIFFICULTY, USE_INVINCIBILITY
+)
+log.info("📋 Asteroid Speed=%s", ASTEROID_SPEED)
+
+if USE_FIXED_TIMESTEP:
+    # Advanced: Pygame Zero calls update() once per frame, so a slow computer
+    # makes a slow game. This runs our update() TICK_RATE times a second of
+    # real time instead (several times in one frame if it has to catch up),
+    # and draw() slides things smoothly between updates. (gamekit/timestep.py)
+    from gamekit.timestep import FixedTimestep
+
+    timestep = FixedTimestep(
+        update, TICK_RATE, tracked=lambda: [player, *asteroids, *bonus_stars]
+    )
+    update, draw = timestep.wrap(draw)
 
 # ========================================
 # INSTRUCTIONS FOR KIDS:
@@ -0,0 +1,132 @@
+"""
+🚀 STAR DODGER — SIMULATION VIEW 🚀
+===================================
+
+The same Star Dodger game, but all the rules live in an object:
+gamekit/star_dodger_sim.py's StarDodgerSim. This file is only the
+"front end" — it reads the keyboard, hands the keys to the simulation one
+tick at a time, and draws whatever the simulation says is happening.
+
+Because the rules don't need a window, the very same StarDodgerSim can
+also run without one — thousands of games per second — for testing and
+balancing. Try changing SEED: the same seed always gives the same
+asteroids!
+
+Set RECORD_REPLAY to a file name to save your session when the window
+closes. `python -m gamekit.replay that_file` plays it back (no window
+needed) and shows how the game ended.
+
+FOR: Python for Kids Course - Week 02 (advanced pilots!)
+"""
+
+import atexit  # Lets us run some code when the game window closes
+import sys  # Lets us tell Python where to find our shared helpers
+from pathlib import Path  # For working with file and folder paths
+
+# Let Python find the shared "gamekit" folder that sits next to week01/ and week02/
+# (This must come BEFORE "import pgzrun", because pgzrun changes __file__.)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pgzrun  # noqa: E402  The game engine that handles drawing, input, etc.
+
+from gamekit.replay import ReplayRecorder  # noqa: E402
+from gamekit.star_dodger_sim import Keys, Settings, StarDodgerSim  # noqa: E402
+
+# ========================================
+# GAME SETTINGS - Same switches as star_dodger.py
+# ========================================
+USE_SPRITES = True  # Set to True to use images instead of shapes
+USE_BONUS_STARS = False  # Set to True to enable collectible bonus stars (+5 pts each!)
+USE_INCREASING_DIFFICULTY = False  # True = asteroids get faster as score goes up
+USE_INVINCIBILITY = False  # Set to True to get a brief shield after being hit
+
+ASTEROID_SPEED = 3  # How fast asteroids fall (try 1, 5, or 8!)
+SEED = None  # Set to a number (like 42) to get the same game every time
+RECORD_REPLAY = None  # Set to a file name (like "replay.sdr") to record this session
+
+WIDTH, HEIGHT = 800, 600
+
+sim = StarDodgerSim(
+    Settings(
+        width=WIDTH,
+        height=HEIGHT,
+        bonus_stars=USE_BONUS_STARS,
+        increasing_difficulty=USE_INCREASING_DIFFICULTY,
+        invincibility=USE_INVINCIBILITY,
+        asteroid_speed=ASTEROID_SPEED,
+    ),
+    seed=SEED,
+)
+
+# A recorder writes down every key, so the whole session can be played again
+recorder = None
+if RECORD_REPLAY:
+    recorder = ReplayRecorder(sim)
+    atexit.register(recorder.save, RECORD_REPLAY)
+
+if USE_SPRITES:
+    try:
+        images.load("spaceship")
+        images.load("asteroid")
+        images.load("star")
+    except Exception:
+        print("⚠️  Images not found, using shapes instead")
+        USE_SPRITES = False
+
+
+def update():
+    """Hand this frame's keys to the simulation and let it do one tick."""
+    held = Keys(keyboard.left, keyboard.right, keyboard.up, keyboard.down)
+    if recorder:
+        recorder.step(held)
+    else:
+        sim.step(held)
+
+
+def draw():
+    """Draw whatever the simulation says is happening."""
+    screen.fill((10, 10, 30))
+
+    for left, top, w, h in sim.asteroids.rects():
+        if USE_SPRITES:
+            screen.blit("asteroid", (left, top))
+        else:
+            screen.draw.filled_circle((left + 15, top + 15), 15, (160, 160, 160))
+
+    for left, top, w, h in sim.bonus_stars.rects():
+        if USE_SPRITES:
+            screen.blit("star", (left, top))
+        else:
+            screen.draw.filled_circle((left + 10, top + 10), 10, (255, 255, 50))
+
+    player = sim.player
+    if not (sim.invincible and sim.invincible_timer % 6 < 3):
+        if USE_SPRITES:
+            screen.blit("spaceship", (player.left, player.top))
+        else:
+            screen.draw.filled_rect(
+                Rect((player.left, player.top), (player.width, player.height)),
+                (50, 150, 255),
+            )
+
+    screen.draw.text(f"Score: {sim.score}", (10, 10), color="white", fontsize=30)
+    screen.draw.text(f"Lives: {sim.lives}", (10, 40), color="red", fontsize=24)
+    screen.draw.text(f"Tick: {sim.tick}", (10, 70), color="gray", fontsize=18)
+
+    if sim.game_over:
+        screen.draw.text(
+            f"GAME OVER — Final Score: {sim.score}\nPress SPACE to play again!",
+            center=(WIDTH // 2, HEIGHT // 2),
+            color="yellow",
+            fontsize=36,
+        )
+
+
+def on_key_down(key):
+    if recorder:
+        recorder.key_down(key)  # Records the key, then does the same as below
+    elif key == keys.SPACE and sim.game_over:
+        sim.reset()
+
+
+pgzrun.go()